@@ -16,9 +16,11 @@
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
                          QasmQobjConfig)
+from qiskit.tools.parallel import parallel_map
+from qiskit.validation import skip_validation
 
 
-def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
+def assemble_circuits(circuits, run_config, qobj_id, qobj_header, parallel=False):
     """Assembles a list of circuits into a qobj which can be run on the backend.
 
     Args:
@@ -26,6 +28,7 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
         qobj_id (int): identifier for the generated qobj
         qobj_header (QobjHeader): header to pass to the results
         run_config (RunConfig): configuration of the runtime environment
+        parallel (bool): assemble the experiments in parallel processes
 
     Returns:
         QasmQobj: the Qobj to be run on the backends
@@ -35,50 +38,107 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
         qobj_config = QasmQobjConfig(**run_config.to_dict())
 
     # Pack everything into the Qobj
-    experiments = []
-    max_n_qubits = 0
-    max_memory_slots = 0
-    for circuit in circuits:
-        # header stuff
-        n_qubits = 0
-        memory_slots = 0
-        qubit_labels = []
-        clbit_labels = []
-
-        qreg_sizes = []
-        creg_sizes = []
-        for qreg in circuit.qregs:
-            qreg_sizes.append([qreg.name, qreg.size])
-            for j in range(qreg.size):
-                qubit_labels.append([qreg.name, j])
-            n_qubits += qreg.size
-        for creg in circuit.cregs:
-            creg_sizes.append([creg.name, creg.size])
-            for j in range(creg.size):
-                clbit_labels.append([creg.name, j])
-            memory_slots += creg.size
+    if parallel:
+        experiments = parallel_map(_assemble_circuit, circuits, task_args=({},))
+    else:
+        # Circuits with the same registers share their bit layout
+        layouts = {}
+        experiments = [_assemble_circuit(circuit, layouts) for circuit in circuits]
+
+    qobj_config.memory_slots = max([experiment.config.memory_slots
+                                    for experiment in experiments], default=0)
+    qobj_config.n_qubits = max([experiment.config.n_qubits
+                                for experiment in experiments], default=0)
 
+    return QasmQobj(qobj_id=qobj_id,
+                    config=qobj_config,
+                    experiments=experiments,
+                    header=qobj_header)
+
+
+class _BitLayout:
+    """Positions of the qubits and clbits of the registers of a circuit.
+
+    Bits are looked up by ``(register name, index)`` in dicts, and the masks
+    of the conditionals on each classical register are computed once. A
+    layout is shared by the circuits with the same registers, but each of
+    their experiments gets its own header and config, which can be modified.
+    """
+
+    def __init__(self, qreg_sizes, creg_sizes):
+        self.qreg_sizes = qreg_sizes
+        self.creg_sizes = creg_sizes
+        self.qubit_indices = {}
+        for name, size in self.qreg_sizes:
+            for j in range(size):
+                self.qubit_indices[(name, j)] = len(self.qubit_indices)
+        self.clbit_indices = {}
+        # First memory slot and size of each classical register
+        self.creg_slots = {}
+        for name, size in self.creg_sizes:
+            self.creg_slots[name] = (len(self.clbit_indices), size)
+            for j in range(size):
+                self.clbit_indices[(name, j)] = len(self.clbit_indices)
+        self.n_qubits = len(self.qubit_indices)
+        self.memory_slots = len(self.clbit_indices)
+
+    def header(self, name):
+        """Return a new experiment header for a circuit called name."""
         # TODO: why do we need creq_sizes and qreg_sizes in header
         # TODO: we need to rethink memory_slots as they are tied to classical bit
-        header = QobjExperimentHeader(qubit_labels=qubit_labels,
-                                      n_qubits=n_qubits,
-                                      qreg_sizes=qreg_sizes,
-                                      clbit_labels=clbit_labels,
-                                      memory_slots=memory_slots,
-                                      creg_sizes=creg_sizes,
-                                      name=circuit.name)
+        return QobjExperimentHeader(
+            qubit_labels=[list(label) for label in self.qubit_indices],
+            n_qubits=self.n_qubits,
+            qreg_sizes=[list(reg_size) for reg_size in self.qreg_sizes],
+            clbit_labels=[list(label) for label in self.clbit_indices],
+            memory_slots=self.memory_slots,
+            creg_sizes=[list(reg_size) for reg_size in self.creg_sizes],
+            name=name)
+
+    def config(self):
+        """Return a new experiment config."""
         # TODO: why do we need n_qubits and memory_slots in both the header and the config
-        config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
+        return QasmQobjExperimentConfig(n_qubits=self.n_qubits, memory_slots=self.memory_slots)
 
-        # Convert conditionals from QASM-style (creg ?= int) to qobj-style
-        # (register_bit ?= 1), by assuming device has unlimited register slots
-        # (supported only for simulators). Map all measures to a register matching
-        # their clbit_index, create a new register slot for every conditional gate
-        # and add a bfunc to map the creg=val mask onto the gating register bit.
+    def conditional_mask(self, creg_name, value):
+        """Return the mask and the value of the bits of ``creg_name == value``."""
+        if creg_name not in self.creg_slots:
+            return 0, 0
+        first, size = self.creg_slots[creg_name]
+        bits = (1 << size) - 1
+        return bits << first, (value & bits) << first
 
-        is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
-        max_conditional_idx = 0
 
+def _assemble_circuit(circuit, layouts):
+    """Assemble a circuit into a QasmQobjExperiment.
+
+    Args:
+        circuit (QuantumCircuit): circuit to assemble
+        layouts (dict): bit layouts of the circuits assembled before, by
+            registers. The layout of circuit is added if missing.
+
+    Returns:
+        QasmQobjExperiment: the experiment of the circuit
+    """
+    registers = (tuple((qreg.name, qreg.size) for qreg in circuit.qregs),
+                 tuple((creg.name, creg.size) for creg in circuit.cregs))
+    layout = layouts.get(registers)
+    if layout is None:
+        layout = layouts[registers] = _BitLayout(*registers)
+    qubit_indices = layout.qubit_indices
+    clbit_indices = layout.clbit_indices
+
+    # Convert conditionals from QASM-style (creg ?= int) to qobj-style
+    # (register_bit ?= 1), by assuming device has unlimited register slots
+    # (supported only for simulators). Map all measures to a register matching
+    # their clbit_index, create a new register slot for every conditional gate
+    # and add a bfunc to map the creg=val mask onto the gating register bit.
+
+    is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
+    max_conditional_idx = 0
+
+    # The instructions are made by the assembler, so they are not validated
+    with skip_validation():
         instructions = []
         for op_context in circuit.data:
             instruction = op_context[0].assemble()
@@ -87,31 +147,23 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
             qargs = op_context[1]
             cargs = op_context[2]
             if qargs:
-                qubit_indices = [qubit_labels.index([qubit[0].name, qubit[1]])
-                                 for qubit in qargs]
-                instruction.qubits = qubit_indices
+                instruction.qubits = [qubit_indices[(qubit[0].name, qubit[1])] for qubit in qargs]
             if cargs:
-                clbit_indices = [clbit_labels.index([clbit[0].name, clbit[1]])
-                                 for clbit in cargs]
-                instruction.memory = clbit_indices
+                clbit_list = [clbit_indices[(clbit[0].name, clbit[1])] for clbit in cargs]
+                instruction.memory = clbit_list
                 # If the experiment has conditional instructions, assume every
                 # measurement result may be needed for a conditional gate.
                 if instruction.name == "measure" and is_conditional_experiment:
-                    instruction.register = clbit_indices
+                    instruction.register = clbit_list
 
             # To convert to a qobj-style conditional, insert a bfunc prior
             # to the conditional instruction to map the creg ?= val condition
             # onto a gating register bit.
             if hasattr(instruction, '_control'):
                 ctrl_reg, ctrl_val = instruction._control
-                mask = 0
-                val = 0
-                for clbit in clbit_labels:
-                    if clbit[0] == ctrl_reg.name:
-                        mask |= (1 << clbit_labels.index(clbit))
-                        val |= (((ctrl_val >> clbit[1]) & 1) << clbit_labels.index(clbit))
-
-                conditional_reg_idx = memory_slots + max_conditional_idx
+                mask, val = layout.conditional_mask(ctrl_reg.name, ctrl_val)
+
+                conditional_reg_idx = layout.memory_slots + max_conditional_idx
                 conversion_bfunc = QasmQobjInstruction(name='bfunc',
                                                        mask="0x%X" % mask,
                                                        relation='==',
@@ -126,17 +178,5 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
 
             instructions.append(instruction)
 
-        experiments.append(QasmQobjExperiment(instructions=instructions, header=header,
-                                              config=config))
-        if n_qubits > max_n_qubits:
-            max_n_qubits = n_qubits
-        if memory_slots > max_memory_slots:
-            max_memory_slots = memory_slots
-
-    qobj_config.memory_slots = max_memory_slots
-    qobj_config.n_qubits = max_n_qubits
-
-    return QasmQobj(qobj_id=qobj_id,
-                    config=qobj_config,
-                    experiments=experiments,
-                    header=qobj_header)
+        return QasmQobjExperiment(instructions=instructions, header=layout.header(circuit.name),
+                                  config=layout.config())
@@ -23,4 +23,5 @@ from .measure import Measure
 from .reset import Reset
 from .compositegate import CompositeGate
 from .parameter import Parameter
+from .parameterexpression import ParameterExpression
 from .parametervector import ParameterVector
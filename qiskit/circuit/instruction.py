@@ -33,14 +33,16 @@ Instructions do not have any context about where they are in a circuit (which qu
 The circuit itself keeps this context.
 """
 import copy
+import math
 from itertools import zip_longest
 import sympy
+from mpmath.libmp import from_float as mpmath_from_float, to_str as mpmath_to_str
 import numpy
 
 from qiskit.qasm.node import node
 from qiskit.exceptions import QiskitError
 from qiskit.circuit.classicalregister import ClassicalRegister
-from qiskit.circuit.parameter import Parameter
+from qiskit.circuit.parameterexpression import ParameterExpression
 from qiskit.qobj.models.qasm import QasmQobjInstruction
 
 _CUTOFF_PRECISION = 1E-10
@@ -123,19 +125,18 @@ class Instruction:
     def params(self, parameters):
         self._params = []
         for single_param in parameters:
-            # example: u2(pi/2, sin(pi/4))
-            if isinstance(single_param, (Parameter, sympy.Basic)):
+            # example: u3(numpy.float64(0.1), 0.2, 0.3)
+            if isinstance(single_param, numpy.number):
+                self._params.append(single_param.item())
+            # example: u3(0.1, 0.2, 0.3)
+            elif isinstance(single_param, (int, float, complex)):
                 self._params.append(single_param)
+            # example: u2(pi/2, sin(pi/4))
+            elif isinstance(single_param, (ParameterExpression, sympy.Basic)):
+                self._params.append(_sympy_to_number(single_param))
             # example: OpenQASM parsed instruction
             elif isinstance(single_param, node.Node):
-                self._params.append(single_param.sym())
-            # example: u3(0.1, 0.2, 0.3)
-            elif isinstance(single_param, (int, float)):
-                self._params.append(sympy.Number(single_param))
-            # example: Initialize([complex(0,1), complex(0,0)])
-            elif isinstance(single_param, complex):
-                self._params.append(single_param.real +
-                                    single_param.imag * sympy.I)
+                self._params.append(_sympy_to_number(single_param.sym()))
             # example: snapshot('label')
             elif isinstance(single_param, str):
                 self._params.append(sympy.Symbol(single_param))
@@ -145,10 +146,6 @@ class Instruction:
             # example: sympy.Matrix([[1, 0], [0, 1]])
             elif isinstance(single_param, sympy.Matrix):
                 self._params.append(single_param)
-            elif isinstance(single_param, sympy.Expr):
-                self._params.append(single_param)
-            elif isinstance(single_param, numpy.number):
-                self._params.append(sympy.Number(single_param.item()))
             else:
                 raise QiskitError("invalid param type {0} in instruction "
                                   "{1}".format(type(single_param), self.name))
@@ -273,7 +270,7 @@ class Instruction:
         name_param = self.name
         if self.params:
             name_param = "%s(%s)" % (name_param, ",".join(
-                [str(i) for i in self.params]))
+                [_param_str(i) for i in self.params]))
 
         return self._qasmif(name_param)
 
@@ -320,3 +317,53 @@ class Instruction:
             flat_qargs = [qarg for sublist in qargs for qarg in sublist]
             flat_cargs = [carg for sublist in cargs for carg in sublist]
             yield flat_qargs, flat_cargs
+
+
+def _rule_key(instruction):
+    """Return a hashable key of the rule of an instruction, for caching its
+    decomposition, or None if the rule is not defined by the class of the
+    instruction and its parameters alone.
+
+    The key may still hold unhashable parameters, such as arrays."""
+    # pylint: disable=protected-access
+    if type(instruction)._define is Instruction._define:
+        # Instructions built from circuits carry their own definition
+        return None
+    if any(isinstance(param, ParameterExpression) for param in instruction.params):
+        return None
+    return (type(instruction), instruction.name,
+            tuple((type(param), param) for param in instruction.params),
+            instruction.num_qubits, instruction.num_clbits)
+
+
+def _sympy_to_number(param):
+    """Return sympy integers and floats as int and float, and other
+    parameters as they are."""
+    if isinstance(param, sympy.Integer):
+        return int(param)
+    if isinstance(param, sympy.Float):
+        return float(param)
+    return param
+
+
+def _param_str(param):
+    """Format a parameter for OpenQASM.
+
+    Numbers are stored as Python int, float and complex values, but are
+    printed the way sympy prints them, e.g. ``0.100000000000000``.
+    """
+    if isinstance(param, int):
+        return str(param)
+    if isinstance(param, float):
+        if not math.isfinite(param):
+            return str(sympy.Number(param))
+        # The digits sympy prints for a Float of 53 bits precision
+        formatted = mpmath_to_str(mpmath_from_float(param), 15, strip_zeros=False)
+        if formatted.startswith('-.0'):
+            formatted = '-0.' + formatted[3:]
+        elif formatted.startswith('.0'):
+            formatted = '0.' + formatted[2:]
+        return formatted.lstrip('+')
+    if isinstance(param, complex):
+        return str(param.real + param.imag * sympy.I)
+    return str(param)
@@ -15,12 +15,23 @@
 Parameter Class for variable parameters.
 """
 
+import sympy
 
-class Parameter():
+from .parameterexpression import ParameterExpression
+
+
+class Parameter(ParameterExpression):
     """Parameter Class for variable parameters"""
     def __init__(self, name):
         self._name = name
 
+        symbol = sympy.Symbol(name)
+        super().__init__(symbol_map={self: symbol}, expr=symbol)
+
+    def subs(self, parameter_map):
+        """Substitute self with the corresponding parameter in parameter_map."""
+        return parameter_map[self]
+
     @property
     def name(self):
         """Returns the name of the Parameter."""
@@ -37,3 +48,11 @@ class Parameter():
 
     def __repr__(self):
         return '{}({})'.format(self.__class__.__name__, self.name)
+
+    def __eq__(self, other):
+        if isinstance(other, Parameter):
+            return self is other
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return id(self)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+ParameterExpression Class to enable creating simple expressions of Parameters.
+"""
+
+import numbers
+import operator
+
+import sympy
+
+from qiskit.exceptions import QiskitError
+
+
+class ParameterExpression():
+    """ParameterExpression class to enable creating expressions of Parameters."""
+
+    def __init__(self, symbol_map, expr):
+        """Create a new ParameterExpression.
+
+        Not intended to be called directly, but to be instantiated via operations
+        on other Parameter or ParameterExpression objects.
+
+        Args:
+            symbol_map (dict): Mapping of Parameter instances to the sympy.Symbol
+                               serving as their placeholder in expr.
+            expr (sympy.Expr): Expression of sympy.Symbols.
+        """
+        self._parameter_symbols = symbol_map
+        self._symbol_expr = expr
+        self._evaluate = None
+
+    @property
+    def parameters(self):
+        """Returns a set of the unbound Parameters in the expression."""
+        return set(self._parameter_symbols)
+
+    def bind(self, parameter_values):
+        """Binds the provided set of parameters to their corresponding values.
+
+        Args:
+            parameter_values (dict): Mapping of Parameter instances to the
+                                     numeric value to which they will be bound.
+
+        Raises:
+            QiskitError: If parameter_values contains Parameters outside those in self.
+
+        Returns:
+            ParameterExpression: a new expression parameterized by any parameters
+                which were not bound by parameter_values.
+        """
+        self._raise_if_passed_unknown_parameters(parameter_values.keys())
+        if len(parameter_values) == len(self._parameter_symbols) and \
+                all(isinstance(value, numbers.Number) for value in parameter_values.values()):
+            # Binding all the parameters is done numerically, which is much
+            # faster than substituting them in the sympy expression
+            if self._evaluate is None:
+                parameters = list(self._parameter_symbols)
+                function = sympy.lambdify([self._parameter_symbols[parameter]
+                                           for parameter in parameters],
+                                          self._symbol_expr, modules='math')
+                self._evaluate = (parameters, function)
+            parameters, function = self._evaluate
+            try:
+                value = function(*[parameter_values[parameter] for parameter in parameters])
+            except (TypeError, ValueError):
+                pass
+            else:
+                return ParameterExpression({}, sympy.sympify(value))
+
+        symbol_values = {self._parameter_symbols[parameter]: value
+                         for parameter, value in parameter_values.items()}
+        free_parameter_symbols = {parameter: symbol
+                                  for parameter, symbol in self._parameter_symbols.items()
+                                  if parameter not in parameter_values}
+        return ParameterExpression(free_parameter_symbols,
+                                   self._symbol_expr.subs(symbol_values))
+
+    def subs(self, parameter_map):
+        """Returns a new Expression with replacement Parameters.
+
+        Args:
+            parameter_map (dict): Mapping from Parameters in self to the
+                                  Parameter instances with which they should be
+                                  replaced.
+
+        Raises:
+            QiskitError: If parameter_map contains Parameters outside those in self,
+                or if a replacement Parameter has the name of another parameter
+                of the expression.
+
+        Returns:
+            ParameterExpression: a new expression with the specified parameters
+                replaced.
+        """
+        self._raise_if_passed_unknown_parameters(parameter_map.keys())
+        kept_symbols = {parameter: symbol
+                        for parameter, symbol in self._parameter_symbols.items()
+                        if parameter not in parameter_map}
+        self._raise_if_parameter_names_conflict(kept_symbols, parameter_map.values())
+
+        new_parameter_symbols = {new: sympy.Symbol(new.name) for new in parameter_map.values()}
+        symbol_map = {self._parameter_symbols[old]: new_parameter_symbols[new]
+                      for old, new in parameter_map.items()}
+        new_parameter_symbols.update(kept_symbols)
+        return ParameterExpression(new_parameter_symbols, self._symbol_expr.subs(symbol_map))
+
+    def _raise_if_passed_unknown_parameters(self, parameters):
+        unknown_parameters = set(parameters) - self.parameters
+        if unknown_parameters:
+            raise QiskitError('Cannot bind Parameters ({}) not present in '
+                              'expression.'.format([str(p) for p in unknown_parameters]))
+
+    @staticmethod
+    def _raise_if_parameter_names_conflict(parameter_symbols, other_parameters):
+        names = {parameter.name: parameter for parameter in parameter_symbols}
+        conflicts = [parameter.name for parameter in other_parameters
+                     if names.get(parameter.name, parameter) is not parameter]
+        if conflicts:
+            raise QiskitError('Name conflict applying operation for parameters: '
+                              '{}'.format(conflicts))
+
+    def _apply_operation(self, operation, other, reflected=False):
+        """Base method implementing math operations between Parameters and
+        either a constant or a second ParameterExpression.
+
+        Args:
+            operation (function): One of operator.{add,sub,mul,truediv}.
+            other (Parameter or numbers.Number or sympy.Basic): The second
+                argument to be used with self in operation.
+            reflected (bool): Optional - The default ordering is
+                "self operator other". If reflected is True, this is switched
+                to "other operator self". For use in e.g. __radd__, ...
+
+        Raises:
+            QiskitError: If parameters in self and other have conflicting names.
+
+        Returns:
+            ParameterExpression: a new expression describing the result of the
+                operation.
+        """
+        if isinstance(other, ParameterExpression):
+            self._raise_if_parameter_names_conflict(self._parameter_symbols,
+                                                    other._parameter_symbols)
+            parameter_symbols = dict(self._parameter_symbols)
+            parameter_symbols.update(other._parameter_symbols)
+            other_expr = other._symbol_expr
+        elif isinstance(other, (numbers.Number, sympy.Basic)):
+            parameter_symbols = dict(self._parameter_symbols)
+            other_expr = other
+        else:
+            return NotImplemented
+
+        if reflected:
+            expr = operation(other_expr, self._symbol_expr)
+        else:
+            expr = operation(self._symbol_expr, other_expr)
+        return ParameterExpression(parameter_symbols, expr)
+
+    def __add__(self, other):
+        return self._apply_operation(operator.add, other)
+
+    def __radd__(self, other):
+        return self._apply_operation(operator.add, other, reflected=True)
+
+    def __sub__(self, other):
+        return self._apply_operation(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._apply_operation(operator.sub, other, reflected=True)
+
+    def __mul__(self, other):
+        return self._apply_operation(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._apply_operation(operator.mul, other, reflected=True)
+
+    def __truediv__(self, other):
+        if other == 0:
+            raise ZeroDivisionError('Division of a ParameterExpression by zero.')
+        return self._apply_operation(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._apply_operation(operator.truediv, other, reflected=True)
+
+    def __neg__(self):
+        return self._apply_operation(operator.mul, -1)
+
+    def __float__(self):
+        if self.parameters:
+            raise TypeError('ParameterExpression with unbound parameters ({}) '
+                            'cannot be cast to a float.'.format(
+                                [str(p) for p in self.parameters]))
+        return float(self._symbol_expr)
+
+    def __str__(self):
+        return str(self._symbol_expr)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, str(self))
+
+    def __getstate__(self):
+        # Functions made by lambdify can not be pickled
+        state = self.__dict__.copy()
+        state['_evaluate'] = None
+        return state
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def __eq__(self, other):
+        if isinstance(other, ParameterExpression):
+            return (self.parameters == other.parameters
+                    and bool(self._symbol_expr.equals(other._symbol_expr)))
+        if isinstance(other, numbers.Number):
+            return not self.parameters and complex(self._symbol_expr) == other
+        return False
+
+    def __hash__(self):
+        return hash((frozenset(self._parameter_symbols), self._symbol_expr))
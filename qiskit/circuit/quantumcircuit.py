@@ -14,15 +14,21 @@
 
 """Quantum circuit object."""
 
-from copy import deepcopy
+from collections import OrderedDict
+from copy import copy, deepcopy
+import hashlib
 import itertools
+import numbers
 import sys
 import multiprocessing as mp
 
+import numpy
+
 from qiskit.circuit.instruction import Instruction
 from qiskit.qasm.qasm import Qasm
 from qiskit.exceptions import QiskitError
 from qiskit.circuit.parameter import Parameter
+from qiskit.circuit.parameterexpression import ParameterExpression
 from .quantumregister import QuantumRegister
 from .classicalregister import ClassicalRegister
 from .parametertable import ParameterTable
@@ -99,9 +105,73 @@ class QuantumCircuit:
         return str(self.draw(output='text'))
 
     def __eq__(self, other):
-        # TODO: remove the DAG from this function
-        from qiskit.converters import circuit_to_dag
-        return circuit_to_dag(self) == circuit_to_dag(other)
+        """Two circuits are equal if they have the same wires and equal
+        instructions, in the same order, along every wire.
+
+        Instructions on different wires may have been appended in any order.
+        The comparison takes linear time in the size of the circuits.
+        """
+        if not isinstance(other, QuantumCircuit):
+            return False
+        if len(self.data) != len(other.data):
+            return False
+        operations = self._wire_operations()
+        other_operations = other._wire_operations()
+        if operations.keys() != other_operations.keys():
+            return False
+
+        compared = set()
+        for wire, indices in operations.items():
+            other_indices = other_operations[wire]
+            if len(indices) != len(other_indices):
+                return False
+            for index, other_index in zip(indices, other_indices):
+                if (index, other_index) in compared:
+                    continue
+                instruction, qargs, cargs = self.data[index]
+                other_instruction, other_qargs, other_cargs = other.data[other_index]
+                if not _same_operation(instruction, qargs, cargs, instruction.control,
+                                       other_instruction, other_qargs, other_cargs,
+                                       other_instruction.control):
+                    return False
+                compared.add((index, other_index))
+        return True
+
+    def fingerprint(self):
+        """Return a canonical fingerprint of the circuit.
+
+        The fingerprint is computed from the wires of the circuit and the
+        instructions along each of them, so it does not depend on the order of
+        the registers, nor on the order in which instructions on different
+        wires were appended, and it is the fingerprint of the DAG of the
+        circuit. It does not depend on the circuit name. It is the same in
+        every process, and can be used as a cache key.
+
+        Equal circuits have the same fingerprint, except when the parameters
+        of their instructions differ within the tolerance of ``Instruction``
+        equality.
+
+        Returns:
+            str: a hex digest.
+        """
+        labels = [_operation_label(instruction, qargs, cargs, instruction.control)
+                  for instruction, qargs, cargs in self.data]
+        return _wires_fingerprint({wire: [labels[index] for index in indices]
+                                   for wire, indices in self._wire_operations().items()})
+
+    def _wire_operations(self):
+        """Return, for every wire, the indices in ``data`` of the instructions
+        on it, in order. The wires of an instruction are its qubits, clbits
+        and the clbits of its condition."""
+        operations = OrderedDict((wire, []) for wire in self.qubits + self.clbits)
+        for index, (instruction, qargs, cargs) in enumerate(self.data):
+            wires = list(qargs) + list(cargs)
+            if instruction.control is not None:
+                creg = instruction.control[0]
+                wires.extend((creg, j) for j in range(creg.size))
+            for wire in OrderedDict.fromkeys(wires):
+                operations.setdefault(wire, []).append(index)
+        return operations
 
     @classmethod
     def _increment_instances(cls):
@@ -375,16 +445,17 @@ class QuantumCircuit:
 
         # track variable parameters in instruction
         for param_index, param in enumerate(instruction.params):
-            if isinstance(param, Parameter):
+            if isinstance(param, ParameterExpression):
                 current_symbols = self.parameters
 
-                if param in current_symbols:
-                    self._parameter_table[param].append((instruction, param_index))
-                else:
-                    if param.name in {p.name for p in current_symbols}:
-                        raise QiskitError(
-                            'Name conflict on adding parameter: {}'.format(param.name))
-                    self._parameter_table[param] = [(instruction, param_index)]
+                for parameter in param.parameters:
+                    if parameter in current_symbols:
+                        self._parameter_table[parameter].append((instruction, param_index))
+                    else:
+                        if parameter.name in {p.name for p in current_symbols}:
+                            raise QiskitError(
+                                'Name conflict on adding parameter: {}'.format(parameter.name))
+                        self._parameter_table[parameter] = [(instruction, param_index)]
 
         return instruction
 
@@ -831,6 +902,83 @@ class QuantumCircuit:
             del new_circuit._parameter_table[parameter]
         return new_circuit
 
+    def bind_parameters_batch(self, value_dicts):
+        """Assign parameters to values for each of several assignments.
+
+        This gives the same circuits as binding each assignment with
+        ``bind_parameters``, but they are not deep copies of this circuit:
+        only the instructions in which a parameter is bound are copied, and
+        the registers, qubits and other instructions are shared with this
+        circuit and among the returned circuits.
+
+        Args:
+            value_dicts (list[dict] or dict): a list of {parameter: value, ...}
+                assignments, or a single {parameter: values, ...} dict mapping
+                each parameter to a sequence of values, all of the same length.
+
+        Raises:
+            QiskitError: If an assignment contains parameters not present in
+                the circuit, or if the sequences of values have different lengths.
+
+        Returns:
+            list[QuantumCircuit]: a circuit for each assignment.
+        """
+        if isinstance(value_dicts, dict):
+            lengths = {len(values) for values in value_dicts.values()}
+            if len(lengths) > 1:
+                raise QiskitError('Parameter value sequences have different lengths: '
+                                  '{}'.format(sorted(lengths)))
+            value_dicts = [{parameter: values[index]
+                            for parameter, values in value_dicts.items()}
+                           for index in range(lengths.pop() if lengths else 0)]
+
+        parameters = self.parameters
+        bound_circuits = []
+        for value_dict in value_dicts:
+            unrolled_value_dict = self._unroll_param_dict(value_dict)
+            if unrolled_value_dict.keys() - parameters:
+                raise QiskitError('Cannot bind parameters ({}) not present in the circuit.'.format(
+                    [str(p) for p in unrolled_value_dict.keys() - parameters]))
+            bound_circuits.append(self._bind_parameters_shallow(unrolled_value_dict))
+        return bound_circuits
+
+    def _bind_parameters_shallow(self, value_dict):
+        """Return a copy of self with parameters bound, sharing unchanged instructions."""
+        # Gather the values bound in each instruction parameter
+        assignments = {}
+        for parameter, value in value_dict.items():
+            for instr, param_index in self._parameter_table[parameter]:
+                key = (id(instr), param_index)
+                if key not in assignments:
+                    assignments[key] = (instr, param_index, {})
+                assignments[key][2][parameter] = value
+
+        # Copy the instructions in which a parameter is bound, and only those
+        replacements = {}
+        for instr, param_index, values in assignments.values():
+            new_instr = replacements.get(id(instr))
+            if new_instr is None:
+                new_instr = copy(instr)
+                new_instr._params = list(instr._params)
+                if type(instr)._define is not Instruction._define:
+                    # The definition is built from the parameters again
+                    new_instr._definition = None
+                replacements[id(instr)] = new_instr
+            _assign_parameters(new_instr, param_index, values)
+
+        new_circuit = copy(self)
+        new_circuit.qregs = list(self.qregs)
+        new_circuit.cregs = list(self.cregs)
+        new_circuit.data = [(replacements.get(id(instr), instr), qargs, cargs)
+                            for instr, qargs, cargs in self.data]
+        new_circuit._parameter_table = ParameterTable()
+        for parameter, instr_params in self._parameter_table.items():
+            if parameter not in value_dict:
+                new_circuit._parameter_table[parameter] = [
+                    (replacements.get(id(instr), instr), param_index)
+                    for instr, param_index in instr_params]
+        return new_circuit
+
     def _unroll_param_dict(self, value_dict):
         unrolled_value_dict = {}
         for (param, value) in value_dict.items():
@@ -847,7 +995,7 @@ class QuantumCircuit:
     def _bind_parameter(self, parameter, value):
         """Assigns a parameter value to matching instructions in-place."""
         for (instr, param_index) in self._parameter_table[parameter]:
-            instr.params[param_index] = value
+            _assign_parameters(instr, param_index, {parameter: value})
 
     def _substitute_parameters(self, parameter_map):
         """For every {existing_parameter: replacement_parameter} pair in
@@ -856,13 +1004,100 @@ class QuantumCircuit:
         """
         for old_parameter, new_parameter in parameter_map.items():
             self._bind_parameter(old_parameter, new_parameter)
-            self._parameter_table[new_parameter] = self._parameter_table.pop(old_parameter)
+            instr_params = self._parameter_table.pop(old_parameter)
+            if new_parameter in self._parameter_table:
+                self._parameter_table[new_parameter].extend(instr_params)
+            else:
+                self._parameter_table[new_parameter] = instr_params
+
+
+def _assign_parameters(instruction, param_index, values):
+    """Assign values, or replacement parameters, to the parameters in the
+    ``param_index``-th parameter of ``instruction``, in place.
+
+    Parameters appearing in a ParameterExpression are bound in the expression,
+    which becomes a float once it has no unbound parameters left.
+    """
+    current = instruction.params[param_index]
+    if isinstance(current, Parameter):
+        new_param = values[current]
+    elif all(isinstance(value, ParameterExpression) for value in values.values()):
+        new_param = current.subs(values)
+    else:
+        new_param = current.bind(values)
+        if not new_param.parameters:
+            new_param = float(new_param)
+    instruction.params[param_index] = new_param
 
 
 def _circuit_from_qasm(qasm):
     # pylint: disable=cyclic-import
-    from qiskit.converters import ast_to_dag
-    from qiskit.converters import dag_to_circuit
-    ast = qasm.parse()
-    dag = ast_to_dag(ast)
-    return dag_to_circuit(dag)
+    from qiskit.converters import qasm_to_circuit
+    return qasm_to_circuit(qasm)
+
+
+def _same_operation(op1, qargs1, cargs1, condition1, op2, qargs2, cargs2, condition2):
+    """Return whether two instructions are equal and on the same wires.
+
+    Gates defined by their class, with the same numeric parameters, are equal
+    without comparing their definitions. Otherwise the instructions are
+    compared with ``Instruction.__eq__``. The qubits of barriers are compared
+    as sets.
+    """
+    if list(qargs1) != list(qargs2) and not (
+            op1.name == op2.name == 'barrier' and set(qargs1) == set(qargs2)):
+        return False
+    if list(cargs1) != list(cargs2) or condition1 != condition2:
+        return False
+    # pylint: disable=protected-access
+    if type(op1) is type(op2) and type(op1)._define is not Instruction._define \
+            and op1.name == op2.name and op1.num_qubits == op2.num_qubits \
+            and op1.num_clbits == op2.num_clbits \
+            and all(isinstance(param, numbers.Number) for param in op1.params + op2.params) \
+            and op1.params == op2.params:
+        return True
+    return op1 == op2
+
+
+def _wire_key(wire):
+    """Return a key of a wire that sorts and prints the same in every process."""
+    return (type(wire[0]).__name__, wire[0].name, wire[0].size, wire[1])
+
+
+def _param_label(param):
+    """Return a string of a parameter that is the same in every process."""
+    if isinstance(param, numbers.Real):
+        return repr(float(param))
+    if isinstance(param, numbers.Complex):
+        return repr(complex(param))
+    if isinstance(param, numpy.ndarray):
+        return repr((param.shape, param.dtype.str, param.tobytes()))
+    return str(param)
+
+
+def _operation_label(op, qargs, cargs, condition):
+    """Return a string of an instruction on its wires that is the same in
+    every process."""
+    if op.name == 'barrier':
+        qargs = sorted(qargs, key=_wire_key)
+    if condition is not None:
+        condition = (_wire_key((condition[0], 0))[:3], condition[1])
+    label = repr((type(op).__module__, type(op).__qualname__, op.name,
+                  op.num_qubits, op.num_clbits, [_param_label(param) for param in op.params],
+                  [_wire_key(qubit) for qubit in qargs], [_wire_key(clbit) for clbit in cargs],
+                  condition))
+    # Instructions built from circuits are only told apart by their definition
+    # pylint: disable=protected-access
+    if type(op)._define is Instruction._define and op.definition:
+        label += '(' + ''.join(_operation_label(inst, inst_qargs, inst_cargs, inst.control)
+                               for inst, inst_qargs, inst_cargs in op.definition) + ')'
+    return label
+
+
+def _wires_fingerprint(labels):
+    """Return the hex digest of the labels of the operations along each wire,
+    given as a dict from wires to lists of labels."""
+    digest = hashlib.sha256()
+    for wire in sorted(labels, key=_wire_key):
+        digest.update(repr((_wire_key(wire), labels[wire])).encode())
+    return digest.hexdigest()
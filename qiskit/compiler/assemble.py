@@ -34,7 +34,7 @@ def assemble(experiments,
              qubit_lo_range=None, meas_lo_range=None,
              schedule_los=None, meas_level=2, meas_return='avg', meas_map=None,
              memory_slots=None, memory_slot_size=100, rep_time=None, parameter_binds=None,
-             **run_config):
+             parallel=False, **run_config):
     """Assemble a list of circuits or pulse schedules into a Qobj.
 
     This function serializes the payloads, which could be either circuits or schedules,
@@ -120,6 +120,10 @@ def assemble(experiments,
             length-n list, and there are m experiments, a total of m x n
             experiments will be run (one for each experiment/bind pair).
 
+        parallel (bool):
+            If True, the experiments of circuits are assembled in parallel
+            processes. Default: False
+
         run_config (dict):
             extra arguments used to configure the run (e.g. for Aer configurable backends)
             Refer to the backend documentation for details on these arguments
@@ -148,7 +152,8 @@ def assemble(experiments,
         bound_experiments, run_config = _expand_parameters(circuits=experiments,
                                                            run_config=run_config)
         return assemble_circuits(circuits=bound_experiments, qobj_id=qobj_id,
-                                 qobj_header=qobj_header, run_config=run_config)
+                                 qobj_header=qobj_header, run_config=run_config,
+                                 parallel=parallel)
 
     elif all(isinstance(exp, ScheduleComponent) for exp in experiments):
         return assemble_schedules(schedules=experiments, qobj_id=qobj_id,
@@ -297,9 +302,9 @@ def _expand_parameters(circuits, run_config):
                  'Parameter binds: {} ' +
                  'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
 
-        circuits = [circuit.bind_parameters(binds)
+        circuits = [bound_circuit
                     for circuit in circuits
-                    for binds in parameter_binds]
+                    for bound_circuit in circuit.bind_parameters_batch(parameter_binds)]
 
         # All parameters have been expanded and bound, so remove from run_config
         run_config = copy.deepcopy(run_config)
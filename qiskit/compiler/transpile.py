@@ -19,6 +19,8 @@ from qiskit.transpiler import Layout, CouplingMap
 from qiskit.tools.parallel import parallel_map
 from qiskit.transpiler.transpile_config import TranspileConfig
 from qiskit.transpiler.transpile_circuit import transpile_circuit
+from qiskit.transpiler.profiling import PassProfiler
+from qiskit.compiler.transpile_cache import _copy_for_circuit
 from qiskit.pulse import Schedule
 
 
@@ -27,7 +29,9 @@ def transpile(circuits,
               basis_gates=None, coupling_map=None, backend_properties=None,
               initial_layout=None, seed_transpiler=None,
               optimization_level=None,
-              pass_manager=None):
+              pass_manager=None,
+              cache=None,
+              profiler=None):
     """transpile one or more circuits, according to some desired
     transpilation targets.
 
@@ -117,6 +121,16 @@ def transpile(circuits,
             pass manager will be used directly (Qiskit will not attempt to
             auto-select a pass manager based on transpile options).
 
+        cache (TranspileCache):
+            If set, circuits are looked up in this cache before being
+            transpiled, and the circuits that had to be transpiled are added
+            to it. Circuits transpiled with a custom ``pass_manager`` are
+            not cached.
+
+        profiler (PassProfiler):
+            If set, a record of every pass run on every circuit is added to it,
+            also when the circuits are transpiled in parallel. Circuits found
+            in ``cache`` are not profiled.
 
     Returns:
         QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
@@ -137,28 +151,95 @@ def transpile(circuits,
                                               seed_transpiler, optimization_level,
                                               pass_manager)
 
-    # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    if cache is not None:
+        circuits = _transpile_with_cache(circuits, transpile_configs, cache, profiler)
+    else:
+        # Transpile circuits in parallel. The configs share their CouplingMap and
+        # BackendProperties objects, which are pickled once per chunk of circuits.
+        circuits = _transpile_circuits(list(zip(circuits, transpile_configs)), profiler)
 
     if len(circuits) == 1:
         return circuits[0]
     return circuits
 
 
+def _transpile_circuits(circuit_config_tuples, profiler=None):
+    """Transpile circuits in parallel, adding the records of their passes to ``profiler``.
+
+    Args:
+        circuit_config_tuples (list[tuple]): circuits and their configuration
+        profiler (PassProfiler): profiler of the passes, or None
+
+    Returns:
+        list[QuantumCircuit]: transpiled circuits
+    """
+    if profiler is None:
+        return parallel_map(_transpile_circuit, circuit_config_tuples)
+
+    # Each worker profiles its circuits on its own, and returns the records.
+    results = parallel_map(_transpile_circuit, circuit_config_tuples,
+                           task_kwargs={'profile': True})
+    for _, records in results:
+        profiler.add_records(records)
+    return [circuit for circuit, _ in results]
+
+
+def _transpile_with_cache(circuits, transpile_configs, cache, profiler=None):
+    """Transpile the circuits missing from ``cache`` and add them to it.
+
+    Args:
+        circuits (list[QuantumCircuit]): circuits to transpile
+        transpile_configs (list[TranspileConfig]): configuration of each circuit
+        cache (TranspileCache): cache of transpiled circuits
+        profiler (PassProfiler): profiler of the passes, or None
+
+    Returns:
+        list[QuantumCircuit]: transpiled circuits
+    """
+    keys = [cache.key(circuit, transpile_config)
+            for circuit, transpile_config in zip(circuits, transpile_configs)]
+    results = [None if key is None else cache.get(key, circuit)
+               for key, circuit in zip(keys, circuits)]
+
+    # Circuits with the same key are transpiled once, for the first of them
+    missing = {}
+    for index, result in enumerate(results):
+        if result is None:
+            missing.setdefault(index if keys[index] is None else keys[index], []).append(index)
+    if not missing:
+        return results
+    groups = list(missing.values())
+    transpiled = _transpile_circuits([(circuits[group[0]], transpile_configs[group[0]])
+                                      for group in groups], profiler)
+    for group, circuit in zip(groups, transpiled):
+        if keys[group[0]] is not None:
+            cache.put(keys[group[0]], circuit)
+        results[group[0]] = circuit
+        for index in group[1:]:
+            results[index] = _copy_for_circuit(circuit, circuits[index])
+    return results
+
+
 # FIXME: This is a helper function because of parallel tools.
-def _transpile_circuit(circuit_config_tuple):
+def _transpile_circuit(circuit_config_tuple, profile=False):
     """Select a PassManager and run a single circuit through it.
 
     Args:
         circuit_config_tuple (tuple):
             circuit (QuantumCircuit): circuit to transpile
             transpile_config (TranspileConfig): configuration dictating how to transpile
+        profile (bool): whether to profile the passes
 
     Returns:
-        QuantumCircuit: transpiled circuit
+        QuantumCircuit: transpiled circuit, or a tuple of it and the records of
+            its passes if ``profile`` is set
     """
     circuit, transpile_config = circuit_config_tuple
 
+    if profile:
+        profiler = PassProfiler()
+        circuit = transpile_circuit(circuit, transpile_config, callback=profiler)
+        return circuit, profiler.records
     return transpile_circuit(circuit, transpile_config)
 
 
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of transpiled circuits, keyed on circuit structure and target."""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+
+import numpy
+
+from qiskit.circuit import Gate, Instruction, ParameterExpression
+from qiskit.version import __version__
+
+
+class TranspileCache:
+    """Least recently used cache of transpiled circuits.
+
+    Pass an instance to ``transpile(..., cache=cache)`` to reuse the result of
+    transpiling a structurally identical circuit for the same target. Circuits
+    are fingerprinted on their registers, instructions (including unbound
+    parameters, by name) and the resolved transpile configuration (basis
+    gates, coupling map, backend properties, initial layout, seed and
+    optimization level). The circuit name is not part of the fingerprint.
+    The Qiskit version is, since the preset pass managers change between
+    versions.
+
+    Circuits transpiled with a custom ``pass_manager`` are never cached, as
+    the passes cannot be fingerprinted.
+
+    If ``directory`` is given, every cached circuit is also pickled there, so
+    that a new cache using the same directory starts warm. Only the entries
+    kept in memory are bounded by ``maxsize``. Stored circuits that can not
+    be loaded are deleted and count as misses.
+
+    Attributes:
+        hits (int): number of lookups that found a cached circuit.
+        misses (int): number of lookups that did not.
+    """
+
+    def __init__(self, maxsize=128, directory=None):
+        """Create a transpile cache.
+
+        Args:
+            maxsize (int): maximum number of circuits kept in memory.
+            directory (str): optional directory where the circuits are stored
+                on disk.
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._circuits = OrderedDict()
+        # The configurations of a transpile call share their properties object
+        self._properties = (None, None)
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._circuits)
+
+    def key(self, circuit, transpile_config):
+        """Return the cache key of transpiling a circuit with a configuration.
+
+        Args:
+            circuit (QuantumCircuit): circuit to transpile.
+            transpile_config (TranspileConfig): resolved configuration.
+
+        Returns:
+            str or None: the key, or None if the transpilation can not be cached.
+        """
+        if getattr(transpile_config, 'pass_manager', None) is not None:
+            return None
+        names = [parameter.name for parameter in circuit.parameters]
+        if len(set(names)) != len(names):
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(__version__.encode())
+        digest.update(repr([(reg.name, reg.size) for reg in circuit.qregs]).encode())
+        digest.update(repr([(reg.name, reg.size) for reg in circuit.cregs]).encode())
+        _update_instructions(digest, circuit.data)
+        properties = getattr(transpile_config, 'backend_properties', None)
+        if properties is not None and properties is not self._properties[0]:
+            self._properties = (properties, json.dumps(properties.to_dict(), sort_keys=True,
+                                                       default=str))
+        digest.update(_config_fingerprint(transpile_config, self._properties[1]).encode())
+        return digest.hexdigest()
+
+    def get(self, key, circuit):
+        """Return the cached transpilation of ``circuit``, if any.
+
+        Args:
+            key (str): the key of ``circuit``, as returned by ``key()``.
+            circuit (QuantumCircuit): the circuit being transpiled.
+
+        Returns:
+            QuantumCircuit or None: a copy of the cached circuit, named after
+                ``circuit`` and using its parameters, or None on a miss.
+        """
+        cached = self._circuits.get(key)
+        if cached is not None:
+            self._circuits.move_to_end(key)
+        elif self.directory is not None:
+            cached = self._load(key)
+            if cached is not None:
+                self._insert(key, cached)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return _copy_for_circuit(cached, circuit)
+
+    def put(self, key, transpiled):
+        """Store a transpiled circuit under ``key``.
+
+        Args:
+            key (str): the key of the input circuit, as returned by ``key()``.
+            transpiled (QuantumCircuit): the transpiled circuit.
+        """
+        transpiled = transpiled.copy()
+        self._insert(key, transpiled)
+        if self.directory is not None:
+            self._store(key, transpiled)
+
+    def clear(self):
+        """Empty the in-memory cache and reset the counters.
+
+        Circuits stored on disk are kept.
+        """
+        self._circuits.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _insert(self, key, transpiled):
+        self._circuits[key] = transpiled
+        self._circuits.move_to_end(key)
+        while len(self._circuits) > self.maxsize:
+            self._circuits.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # A pickle can fail in many ways, e.g. on classes that were renamed
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _store(self, key, transpiled):
+        # Write to a temporary file first so readers never see partial entries
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as file:
+            pickle.dump(transpiled, file)
+        os.replace(file.name, self._path(key))
+
+
+def _copy_for_circuit(transpiled, circuit):
+    """Return a copy of the transpilation of a circuit with the same key as
+    ``circuit``, named after ``circuit`` and using its parameters."""
+    result = transpiled.copy(name=circuit.name)
+    by_name = {parameter.name: parameter for parameter in circuit.parameters}
+    result._substitute_parameters({parameter: by_name[parameter.name]
+                                   for parameter in result.parameters
+                                   if by_name.get(parameter.name, parameter)
+                                   is not parameter})
+    return result
+
+
+def _update_instructions(digest, data):
+    """Hash a list of (instruction, qargs, cargs) into ``digest``."""
+    for instruction, qargs, cargs in data:
+        control = instruction.control
+        if control is not None:
+            control = (control[0].name, control[0].size, control[1])
+        digest.update(repr((type(instruction).__module__, type(instruction).__qualname__,
+                            instruction.name, instruction.num_qubits,
+                            instruction.num_clbits,
+                            [_param_fingerprint(param) for param in instruction.params],
+                            [(reg.name, index) for reg, index in qargs],
+                            [(reg.name, index) for reg, index in cargs],
+                            control)).encode())
+        # Instructions built from circuits are only told apart by their definition
+        if type(instruction) in (Gate, Instruction) and instruction.definition:
+            digest.update(b'(')
+            _update_instructions(digest, instruction.definition)
+            digest.update(b')')
+
+
+def _param_fingerprint(param):
+    if isinstance(param, ParameterExpression):
+        return (type(param).__name__, str(param))
+    if isinstance(param, numpy.ndarray):
+        return ('ndarray', param.shape, param.dtype.str, param.tobytes())
+    return str(param)
+
+
+def _config_fingerprint(transpile_config, properties):
+    """Return a string identifying the target of a transpile configuration."""
+    basis_gates = getattr(transpile_config, 'basis_gates', None)
+    coupling_map = getattr(transpile_config, 'coupling_map', None)
+    layout = getattr(transpile_config, 'initial_layout', None)
+
+    if basis_gates is not None:
+        basis_gates = sorted(basis_gates)
+    if coupling_map is not None:
+        coupling_map = sorted(coupling_map.get_edges())
+    if layout is not None:
+        layout = sorted((physical, None if virtual is None else (virtual[0].name, virtual[1]))
+                        for physical, virtual in layout.get_physical_bits().items())
+    if getattr(transpile_config, 'backend_properties', None) is None:
+        properties = None
+    return repr((basis_gates, coupling_map, properties, layout,
+                 getattr(transpile_config, 'seed_transpiler', None),
+                 getattr(transpile_config, 'optimization_level', None)))
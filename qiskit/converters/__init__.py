@@ -20,4 +20,6 @@ The functions in this module provide convenience converters
 from .circuit_to_dag import circuit_to_dag
 from .dag_to_circuit import dag_to_circuit
 from .ast_to_dag import ast_to_dag
+from .qasm_to_circuit import qasm_to_circuit
+from .qasm_to_dag import qasm_to_dag
 from .circuit_to_instruction import circuit_to_instruction
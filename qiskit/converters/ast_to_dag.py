@@ -120,17 +120,30 @@ class AstInterpreter:
         # List of dictionaries mapping local bit ids to global ids (name, idx)
         self.bit_stack = [{}]
 
+    def _add_register(self, register):
+        """Add a quantum or classical register to the output."""
+        if isinstance(register, QuantumRegister):
+            self.dag.add_qreg(register)
+        else:
+            self.dag.add_creg(register)
+
+    def _get_register(self, name):
+        """Return the register of the output named name, or None."""
+        if name in self.dag.qregs:
+            return self.dag.qregs[name]
+        return self.dag.cregs.get(name)
+
+    def _apply_operation(self, op, qargs, cargs, condition=None):
+        """Append an operation to the output."""
+        self.dag.apply_operation_back(op, qargs, cargs, condition)
+
     def _process_bit_id(self, node):
         """Process an Id or IndexedId node as a bit or register type.
 
         Return a list of tuples (Register,index).
         """
-        reg = None
-        if node.name in self.dag.qregs:
-            reg = self.dag.qregs[node.name]
-        elif node.name in self.dag.cregs:
-            reg = self.dag.cregs[node.name]
-        else:
+        reg = self._get_register(node.name)
+        if reg is None:
             raise QiskitError("expected qreg or creg name:",
                               "line=%s" % node.line,
                               "file=%s" % node.file)
@@ -216,11 +229,11 @@ class AstInterpreter:
         maxidx = max([len(id0), len(id1)])
         for idx in range(maxidx):
             if len(id0) > 1 and len(id1) > 1:
-                self.dag.apply_operation_back(CXBase(), [id0[idx], id1[idx]], [], self.condition)
+                self._apply_operation(CXBase(), [id0[idx], id1[idx]], [], self.condition)
             elif len(id0) > 1:
-                self.dag.apply_operation_back(CXBase(), [id0[idx], id1[0]], [], self.condition)
+                self._apply_operation(CXBase(), [id0[idx], id1[0]], [], self.condition)
             else:
-                self.dag.apply_operation_back(CXBase(), [id0[0], id1[idx]], [], self.condition)
+                self._apply_operation(CXBase(), [id0[0], id1[idx]], [], self.condition)
 
     def _process_measure(self, node):
         """Process a measurement node."""
@@ -230,12 +243,12 @@ class AstInterpreter:
             raise QiskitError("internal error: reg size mismatch",
                               "line=%s" % node.line, "file=%s" % node.file)
         for idx, idy in zip(id0, id1):
-            self.dag.apply_operation_back(Measure(), [idx], [idy], self.condition)
+            self._apply_operation(Measure(), [idx], [idy], self.condition)
 
     def _process_if(self, node):
         """Process an if node."""
         creg_name = node.children[0].name
-        creg = self.dag.cregs[creg_name]
+        creg = self._get_register(creg_name)
         cval = node.children[1].value
         self.condition = (creg, cval)
         self._process_node(node.children[2])
@@ -253,11 +266,11 @@ class AstInterpreter:
 
         elif node.type == "qreg":
             qreg = QuantumRegister(node.index, node.name)
-            self.dag.add_qreg(qreg)
+            self._add_register(qreg)
 
         elif node.type == "creg":
             creg = ClassicalRegister(node.index, node.name)
-            self.dag.add_creg(creg)
+            self._add_register(creg)
 
         elif node.type == "id":
             raise QiskitError("internal error: _process_node on id")
@@ -290,7 +303,7 @@ class AstInterpreter:
             args = self._process_node(node.children[0])
             qid = self._process_bit_id(node.children[1])
             for element in qid:
-                self.dag.apply_operation_back(UBase(*args, element), self.condition)
+                self._apply_operation(UBase(*args), [element], [], self.condition)
 
         elif node.type == "cnot":
             self._process_cnot(node)
@@ -316,12 +329,12 @@ class AstInterpreter:
             for qubit in ids:
                 for j, _ in enumerate(qubit):
                     qubits.append(qubit[j])
-            self.dag.apply_operation_back(Barrier(len(qubits)), qubits, [])
+            self._apply_operation(Barrier(len(qubits)), qubits, [])
 
         elif node.type == "reset":
             id0 = self._process_bit_id(node.children[0])
             for i, _ in enumerate(id0):
-                self.dag.apply_operation_back(Reset(), [id0[i]], [], self.condition)
+                self._apply_operation(Reset(), [id0[i]], [], self.condition)
 
         elif node.type == "if":
             self._process_if(node)
@@ -363,4 +376,4 @@ class AstInterpreter:
         else:
             raise QiskitError("unknown operation for ast node name %s" % name)
 
-        self.dag.apply_operation_back(op, qargs, [], condition=self.condition)
+        self._apply_operation(op, qargs, [], condition=self.condition)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Helper function for converting OpenQASM to a circuit"""
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.converters.ast_to_dag import AstInterpreter
+
+
+def qasm_to_circuit(qasm):
+    """Build a ``QuantumCircuit`` object from an OpenQASM program.
+
+    The instructions are added to the circuit as the statements are parsed,
+    without building the AST of the whole program.
+
+    Args:
+        qasm (Qasm): the OpenQASM program, as a string or a file.
+
+    Return:
+        QuantumCircuit: the circuit of the program.
+
+    Raises:
+        QasmError: if the program can not be parsed.
+        QiskitError: if the program is malformed.
+    """
+    circuit = QuantumCircuit()
+    qasm.parse_statements(_CircuitInterpreter(circuit)._process_node)
+    return circuit
+
+
+class _CircuitInterpreter(AstInterpreter):
+    """OpenQASM interpreter adding the instructions to a QuantumCircuit."""
+
+    def __init__(self, circuit):
+        super().__init__(None)
+        self.circuit = circuit
+        # Registers of the circuit by name
+        self.registers = {}
+
+    def _add_register(self, register):
+        self.circuit.add_register(register)
+        self.registers[register.name] = register
+
+    def _get_register(self, name):
+        return self.registers.get(name)
+
+    def _apply_operation(self, op, qargs, cargs, condition=None):
+        op.control = condition
+        self.circuit._append(op, qargs, cargs)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Helper function for converting OpenQASM to a dag"""
+
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.converters.ast_to_dag import AstInterpreter
+
+
+def qasm_to_dag(qasm):
+    """Build a ``DAGCircuit`` object from an OpenQASM program.
+
+    The operations are added to the DAG as the statements are parsed,
+    without building the AST of the whole program.
+
+    Args:
+        qasm (Qasm): the OpenQASM program, as a string or a file.
+
+    Return:
+        DAGCircuit: the DAG of the program.
+
+    Raises:
+        QasmError: if the program can not be parsed.
+        QiskitError: if the program is malformed.
+    """
+    dag = DAGCircuit()
+    qasm.parse_statements(AstInterpreter(dag)._process_node)
+    return dag
@@ -22,9 +22,9 @@ to the input of B. The object's methods allow circuits to be constructed,
 composed, and modified. Some natural properties like depth can be computed
 directly from the graph.
 """
-import re
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import copy
+import heapq
 import itertools
 import warnings
 import networkx as nx
@@ -32,6 +32,7 @@ import networkx as nx
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
 from qiskit.circuit.gate import Gate
+from qiskit.circuit.quantumcircuit import _same_operation, _operation_label, _wires_fingerprint
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
 
@@ -63,17 +64,52 @@ class DAGCircuit:
         # Map from wire (Register,idx) to output nodes of the graph
         self.output_map = OrderedDict()
 
+        # Map from wire (Register,idx) to its integer index in self.wires
+        self._wire_index = {}
+
         # Stores the max id of a node added to the DAG
         self._max_node_id = 0
 
-        # Directed multigraph whose nodes are inputs, outputs, or operations.
-        # Operation nodes have equal in- and out-degrees and carry
-        # additional data about the operation, including the argument order
-        # and parameter values.
-        # Input nodes have out-degree 1 and output nodes have in-degree 1.
-        # Edges carry wire labels (reg,idx) and each operation has
-        # corresponding in- and out-edges with the same wire labels.
-        self._multi_graph = nx.MultiDiGraph()
+        # The graph is stored as adjacency arrays keyed on integer node ids.
+        # Nodes are inputs, outputs, or operations, and _id_to_node maps each
+        # id to its DAGNode (in insertion order). For every node, the
+        # _in_wires/_in_nodes lists hold, position by position, the wire
+        # index and the predecessor id of each incoming edge, and
+        # _out_wires/_out_nodes do the same for outgoing edges. Operation
+        # nodes have one in- and one out-edge per wire, input nodes have
+        # out-degree 1 and output nodes have in-degree 1. Edges that are
+        # rewired are moved to the end of their lists, so neighbours are
+        # reported in the order they were connected.
+        self._id_to_node = OrderedDict()
+        self._in_wires = {}
+        self._in_nodes = {}
+        self._out_wires = {}
+        self._out_nodes = {}
+
+        # Cached topological order as a list of DAGNodes, or None when it has
+        # to be recomputed. Mutations patch it rather than dropping it: op
+        # nodes added by apply_operation_back are kept in _topo_tail, with
+        # the ids of the output nodes they feed in _topo_deferred so these
+        # are moved after them; nodes replaced by substitute_node_with_dag
+        # map to their replacement nodes in _topo_splice; removed nodes are
+        # skipped. The patches are folded into the list on the next read.
+        self._topo_order = None
+        self._topo_tail = []
+        self._topo_deferred = set()
+        self._topo_splice = {}
+        self._topo_patched = False
+
+        # Changes of the graph, counted so passes can revisit only what changed
+        # since they last ran. _changes is bumped whenever a node or an edge is
+        # added or removed, and _wire_changes holds, for every wire index, the
+        # value it had when an edge on that wire was last added. Marks from
+        # another DAG are told apart by _change_token, which copies do not share.
+        self._changes = 0
+        self._wire_changes = []
+        self._change_token = object()
+
+        # (_changes, depth) as of the last call to depth()
+        self._depth = None
 
         # Map of qreg name to QuantumRegister object
         self.qregs = OrderedDict()
@@ -81,26 +117,106 @@ class DAGCircuit:
         # Map of creg name to ClassicalRegister object
         self.cregs = OrderedDict()
 
-        # TO REMOVE WHEN NODE IS HAVE BEEN REMOVED FULLY
-        self._id_to_node = {}
-
     @property
     def multi_graph(self):
-        """Deprecated. Returns internal multi_graph."""
+        """Deprecated. Returns the DAG as a networkx multi_graph."""
         warnings.warn('DAGCircuit.multi_graph access has been deprecated ' +
                       'in favor of access through the DAGCircuit API.', DeprecationWarning)
-        return self._multi_graph
+        return self._to_multi_graph()
 
     @multi_graph.setter
     def multi_graph(self, multi_graph):
-        """Deprecated. Sets internal multi_graph."""
+        """Deprecated. Rebuilds the DAG from a networkx multi_graph."""
         warnings.warn('DAGCircuit.multi_graph access has been deprecated ' +
                       'in favor of access through the DAGCircuit API. ', DeprecationWarning)
-        self._multi_graph = multi_graph
+        self._invalidate_topological_order()
+        for node_id in list(self._id_to_node):
+            self._remove_node(node_id)
+        for node in multi_graph.nodes():
+            self._add_node(node)
+        for source, dest, edge_data in multi_graph.edges(data=True):
+            self._add_edge(source._node_id, dest._node_id,
+                           self._wire_index[edge_data['wire']])
 
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
-        return copy.deepcopy(self._multi_graph)
+        return copy.deepcopy(self._to_multi_graph())
+
+    def _to_multi_graph(self):
+        """Build a networkx MultiDiGraph sharing the DAGNodes of self.
+
+        Edges carry wire labels (reg,idx) under 'wire' and 'name'.
+        """
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self._id_to_node.values())
+        graph.add_edges_from((source, dest, edge_data)
+                             for source, dest, edge_data in self.edges())
+        return graph
+
+    def _add_node(self, node):
+        """Store a DAGNode under its id with no edges attached."""
+        self._changes += 1
+        node_id = node._node_id
+        self._id_to_node[node_id] = node
+        self._in_wires[node_id] = []
+        self._in_nodes[node_id] = []
+        self._out_wires[node_id] = []
+        self._out_nodes[node_id] = []
+
+    def _remove_node(self, node_id):
+        """Drop the storage of a node. Edges pointing to it are left dangling."""
+        self._changes += 1
+        del self._id_to_node[node_id]
+        del self._in_wires[node_id]
+        del self._in_nodes[node_id]
+        del self._out_wires[node_id]
+        del self._out_nodes[node_id]
+
+    def _add_edge(self, source_id, dest_id, wire_idx):
+        """Connect source to dest along a wire.
+
+        Any previous out-edge of source, or in-edge of dest, on the same wire
+        is replaced, and the new edge is placed last in both adjacency lists.
+        """
+        self._changes += 1
+        self._wire_changes[wire_idx] = self._changes
+
+        wires = self._out_wires[source_id]
+        nodes = self._out_nodes[source_id]
+        if wire_idx in wires:
+            pos = wires.index(wire_idx)
+            del wires[pos]
+            del nodes[pos]
+        wires.append(wire_idx)
+        nodes.append(dest_id)
+
+        wires = self._in_wires[dest_id]
+        nodes = self._in_nodes[dest_id]
+        if wire_idx in wires:
+            pos = wires.index(wire_idx)
+            del wires[pos]
+            del nodes[pos]
+        wires.append(wire_idx)
+        nodes.append(source_id)
+
+    def _edge_data(self, wire_idx):
+        """Return the edge attribute dictionary of a wire."""
+        wire = self.wires[wire_idx]
+        return {'name': "%s[%s]" % (wire[0].name, wire[1]), 'wire': wire}
+
+    @staticmethod
+    def _unique(node_ids):
+        """Return node_ids without repetitions, keeping first occurrences."""
+        return list(OrderedDict.fromkeys(node_ids))
+
+    def _node_wires(self, qargs, all_cbits):
+        """Return the distinct wire indices spanned by the given (qu)bits."""
+        wire_ids = []
+        for wire in itertools.chain(qargs, all_cbits):
+            wire_idx = self._wire_index[wire]
+            if wire_idx not in wire_ids:
+                wire_ids.append(wire_idx)
+        return wire_ids
 
     def get_qubits(self):
         """Deprecated. Use qubits()."""
@@ -128,7 +244,7 @@ class DAGCircuit:
         warnings.warn('Usage of node_counter to return the maximum node id is deprecated,'
                       ' it now returns the number of nodes in the current DAG',
                       DeprecationWarning, 2)
-        return len(self._multi_graph)
+        return len(self._id_to_node)
 
     # TODO: unused function. is it needed?
     def rename_register(self, regname, newname):
@@ -154,7 +270,7 @@ class DAGCircuit:
             self.qregs[newname] = reg
             self.qregs.pop(regname, None)
 
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == "in" or node.type == "out":
                 if node.name and regname in node.name:
                     node.name = newname
@@ -174,10 +290,37 @@ class DAGCircuit:
                 if node.condition is not None:
                     if node.condition[0] == regname:
                         node.condition = (newname, node.condition[1])
-        # eX = edge, d= data
-        for _, _, edge_data in self._multi_graph.edges(data=True):
-            if regname in edge_data['name']:
-                edge_data['name'] = re.sub(regname, newname, edge_data['name'])
+
+        # The names of all the wires may have changed
+        self._changes += 1
+        self._wire_changes = [self._changes] * len(self.wires)
+
+    def change_mark(self):
+        """Return a mark of the current state of the circuit.
+
+        Returns:
+            tuple: an opaque mark to give to wires_changed_since().
+        """
+        return self._change_token, self._changes
+
+    def wires_changed_since(self, mark):
+        """Return the wires on which the circuit changed since a mark was taken.
+
+        A wire changes when an operation is added to it, removed from it or
+        substituted on it. Changes made to the nodes in place are not tracked.
+
+        Args:
+            mark (tuple or None): a mark returned by change_mark() on this DAG.
+
+        Returns:
+            list[(Register, int)]: the changed wires, in the order of self.wires.
+                All the wires if mark is None or was taken on another DAG.
+        """
+        if mark is None or mark[0] is not self._change_token:
+            return list(self.wires)
+        changes = mark[1]
+        return [wire for wire, wire_changes in zip(self.wires, self._wire_changes)
+                if wire_changes > changes]
 
     def remove_all_ops_named(self, opname):
         """Remove all operation nodes with the given name."""
@@ -214,8 +357,10 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if trying to add duplicate wire
         """
-        if wire not in self.wires:
+        if wire not in self._wire_index:
+            wire_idx = self._wire_index[wire] = len(self.wires)
             self.wires.append(wire)
+            self._wire_changes.append(0)
             self._max_node_id += 1
             input_map_wire = self.input_map[wire] = self._max_node_id
 
@@ -228,22 +373,13 @@ class DAGCircuit:
                                nid=input_map_wire)
             outp_node = DAGNode(data_dict={'type': 'out', 'name': wire_name, 'wire': wire},
                                 nid=output_map_wire)
-            self._id_to_node[input_map_wire] = inp_node
-            self._id_to_node[output_map_wire] = outp_node
-
             self.input_map[wire] = inp_node
             self.output_map[wire] = outp_node
 
-            self._multi_graph.add_node(inp_node)
-            self._multi_graph.add_node(outp_node)
-
-            self._multi_graph.add_edge(inp_node,
-                                       outp_node)
-
-            self._multi_graph.adj[inp_node][outp_node][0]["name"] \
-                = "%s[%s]" % (wire[0].name, wire[1])
-            self._multi_graph.adj[inp_node][outp_node][0]["wire"] \
-                = wire
+            self._add_node(inp_node)
+            self._add_node(outp_node)
+            self._add_edge(input_map_wire, output_map_wire, wire_idx)
+            self._invalidate_topological_order()
         else:
             raise DAGCircuitError("duplicate wire %s" % (wire,))
 
@@ -301,6 +437,9 @@ class DAGCircuit:
             qargs (list): list of quantum wires to attach to.
             cargs (list): list of classical wires to attach to.
             condition (tuple or None): optional condition (ClassicalRegister, int)
+
+        Returns:
+            DAGNode: the new node, not yet connected to any wire
         """
         node_properties = {
             "type": "op",
@@ -314,8 +453,8 @@ class DAGCircuit:
         # Add a new operation node to the graph
         self._max_node_id += 1
         new_node = DAGNode(data_dict=node_properties, nid=self._max_node_id)
-        self._multi_graph.add_node(new_node)
-        self._id_to_node[self._max_node_id] = new_node
+        self._add_node(new_node)
+        return new_node
 
     def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
         """Apply an operation to the output of the circuit.
@@ -343,25 +482,29 @@ class DAGCircuit:
         self._check_bits(qargs, self.output_map)
         self._check_bits(all_cbits, self.output_map)
 
-        self._add_op_node(op, qargs, cargs, condition)
+        new_node = self._add_op_node(op, qargs, cargs, condition)
+        node_id = new_node._node_id
 
         # Add new in-edges from predecessors of the output nodes to the
         # operation node while deleting the old in-edges of the output nodes
         # and adding new edges from the operation node to each output node
-        al = [qargs, all_cbits]
-        for q in itertools.chain(*al):
-            ie = list(self._multi_graph.predecessors(self.output_map[q]))
+        for wire_idx in self._node_wires(qargs, all_cbits):
+            out_id = self.output_map[self.wires[wire_idx]]._node_id
+            ie = self._in_nodes[out_id]
 
             if len(ie) != 1:
                 raise DAGCircuitError("output node has multiple in-edges")
 
-            self._multi_graph.add_edge(ie[0], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
-            self._multi_graph.remove_edge(ie[0], self.output_map[q])
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], self.output_map[q],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
+            self._add_edge(ie[0], node_id, wire_idx)
+            self._add_edge(node_id, out_id, wire_idx)
+            if self._topo_order is not None:
+                self._topo_deferred.add(out_id)
 
-        return self._id_to_node[self._max_node_id]
+        if self._topo_order is not None:
+            self._topo_tail.append(new_node)
+            self._topo_patched = True
+
+        return new_node
 
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
@@ -384,22 +527,22 @@ class DAGCircuit:
         self._check_condition(op.name, condition)
         self._check_bits(qargs, self.input_map)
         self._check_bits(all_cbits, self.input_map)
-        self._add_op_node(op, qargs, cargs, condition)
+        new_node = self._add_op_node(op, qargs, cargs, condition)
+        node_id = new_node._node_id
         # Add new out-edges to successors of the input nodes from the
         # operation node while deleting the old out-edges of the input nodes
         # and adding new edges to the operation node from each input node
-        al = [qargs, all_cbits]
-        for q in itertools.chain(*al):
-            ie = list(self._multi_graph.successors(self.input_map[q]))
+        for wire_idx in self._node_wires(qargs, all_cbits):
+            in_id = self.input_map[self.wires[wire_idx]]._node_id
+            ie = self._out_nodes[in_id]
             if len(ie) != 1:
                 raise DAGCircuitError("input node has multiple out-edges")
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], ie[0],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
-            self._multi_graph.remove_edge(self.input_map[q], ie[0])
-            self._multi_graph.add_edge(self.input_map[q], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
+            self._add_edge(node_id, ie[0], wire_idx)
+            self._add_edge(in_id, node_id, wire_idx)
+
+        self._invalidate_topological_order()
 
-        return self._id_to_node[self._max_node_id]
+        return new_node
 
     def _check_edgemap_registers(self, edge_map, keyregs, valregs, valreg=True):
         """Check that wiremap neither fragments nor leaves duplicate registers.
@@ -642,7 +785,7 @@ class DAGCircuit:
 
     def size(self):
         """Return the number of operations."""
-        return self._multi_graph.order() - 2 * len(self.wires)
+        return len(self._id_to_node) - 2 * len(self.wires)
 
     def depth(self):
         """Return the circuit depth.
@@ -651,11 +794,22 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if not a directed acyclic graph
         """
-        if not nx.is_directed_acyclic_graph(self._multi_graph):
+        if self._depth is not None and self._depth[0] == self._changes:
+            return self._depth[1]
+
+        # Longest path, counted in edges, from the input to the output nodes
+        path_length = {}
+        for node in self._topological_order():
+            node_id = node._node_id
+            path_length[node_id] = max((path_length[pred_id] + 1
+                                        for pred_id in self._in_nodes[node_id]), default=0)
+        if len(path_length) != len(self._id_to_node):
             raise DAGCircuitError("not a DAG")
 
-        depth = nx.dag_longest_path_length(self._multi_graph) - 1
-        return depth if depth != -1 else 0
+        depth = max(path_length.values(), default=0) - 1
+        depth = depth if depth != -1 else 0
+        self._depth = (self._changes, depth)
+        return depth
 
     def width(self):
         """Return the total number of qubits used by the circuit."""
@@ -667,7 +821,21 @@ class DAGCircuit:
 
     def num_tensor_factors(self):
         """Compute how many components the circuit can decompose into."""
-        return nx.number_weakly_connected_components(self._multi_graph)
+        # Union-find over the edges of the graph
+        parent = {node_id: node_id for node_id in self._id_to_node}
+
+        def find(node_id):
+            while parent[node_id] != node_id:
+                parent[node_id] = parent[parent[node_id]]
+                node_id = parent[node_id]
+            return node_id
+
+        for source_id, dest_ids in self._out_nodes.items():
+            for dest_id in dest_ids:
+                root_source, root_dest = find(source_id), find(dest_id)
+                if root_source != root_dest:
+                    parent[root_source] = root_dest
+        return sum(1 for node_id, root in parent.items() if node_id == root)
 
     def qasm(self):
         """Deprecated. use qiskit.converters.dag_to_circuit() then call
@@ -716,10 +884,11 @@ class DAGCircuit:
                 nodes of n.
         """
 
-        pred_map = {e[2]['wire']: e[0] for e in
-                    self._multi_graph.in_edges(nbunch=node, data=True)}
-        succ_map = {e[2]['wire']: e[1] for e in
-                    self._multi_graph.out_edges(nbunch=node, data=True)}
+        node_id = node._node_id
+        pred_map = {self.wires[wire_idx]: self._id_to_node[pred_id] for wire_idx, pred_id in
+                    zip(self._in_wires[node_id], self._in_nodes[node_id])}
+        succ_map = {self.wires[wire_idx]: self._id_to_node[succ_id] for wire_idx, succ_id in
+                    zip(self._out_wires[node_id], self._out_nodes[node_id])}
         return pred_map, succ_map
 
     def _full_pred_succ_maps(self, pred_map, succ_map, input_circuit,
@@ -753,36 +922,158 @@ class DAGCircuit:
                 # Otherwise, use the corresponding output nodes of self
                 # and compute the predecessor.
                 full_succ_map[w] = self.output_map[w]
-                full_pred_map[w] = self._multi_graph.predecessors(
-                    self.output_map[w])[0]
-                if len(list(self._multi_graph.predecessors(self.output_map[w]))) != 1:
+                o_pred = self._in_nodes[self.output_map[w]._node_id]
+                if len(o_pred) != 1:
                     raise DAGCircuitError("too many predecessors for %s[%d] "
                                           "output node" % (w[0], w[1]))
+                full_pred_map[w] = self._id_to_node[o_pred[0]]
 
         return full_pred_map, full_succ_map
 
     def __eq__(self, other):
-        # TODO this works but is a horrible way to do this
-        slf = copy.deepcopy(self._multi_graph)
-        oth = copy.deepcopy(other._multi_graph)
+        """Two DAGs are equal if they have the same wires and equal op nodes,
+        in the same order, along every wire.
 
-        for node in slf.nodes:
-            slf.nodes[node]['node'] = node
-        for node in oth.nodes:
-            oth.nodes[node]['node'] = node
+        This is the isomorphism of the DAGs that keeps the wires and the
+        operations, decided in linear time in the size of the DAGs.
+        """
+        if not isinstance(other, DAGCircuit):
+            return False
+        if len(self._id_to_node) != len(other._id_to_node) or \
+                set(self.wires) != set(other.wires):
+            return False
+
+        compared = set()
+        for wire in self.wires:
+            nodes = self.nodes_on_wire(wire, only_ops=True)
+            other_nodes = other.nodes_on_wire(wire, only_ops=True)
+            for node, other_node in itertools.zip_longest(nodes, other_nodes):
+                if node is None or other_node is None:
+                    return False
+                if (node._node_id, other_node._node_id) in compared:
+                    continue
+                if node.name != other_node.name or not _same_operation(
+                        node.op, node.qargs, node.cargs, node.condition,
+                        other_node.op, other_node.qargs, other_node.cargs,
+                        other_node.condition):
+                    return False
+                compared.add((node._node_id, other_node._node_id))
+        return True
+
+    def fingerprint(self):
+        """Return a canonical fingerprint of the DAG.
+
+        The fingerprint is computed from the wires of the DAG and the op
+        nodes along each of them, so it does not depend on the order of the
+        registers, nor on the order in which operations on different wires
+        were added, and it is the fingerprint of the circuit of the DAG. It
+        is the same in every process, and can be used as a cache key.
+
+        Equal DAGs have the same fingerprint, except when the parameters of
+        their operations differ within the tolerance of ``Instruction``
+        equality.
 
-        return nx.is_isomorphic(slf, oth,
-                                node_match=lambda x, y: DAGNode.semantic_eq(x['node'], y['node']))
+        Returns:
+            str: a hex digest.
+        """
+        node_labels = {}
+        labels = {}
+        for wire in self.wires:
+            labels[wire] = []
+            for node in self.nodes_on_wire(wire, only_ops=True):
+                label = node_labels.get(node._node_id)
+                if label is None:
+                    label = node_labels[node._node_id] = _operation_label(
+                        node.op, node.qargs, node.cargs, node.condition)
+                labels[wire].append(label)
+        return _wires_fingerprint(labels)
 
     def topological_nodes(self):
         """
         Yield nodes in topological order.
 
+        The order is computed once and then kept up to date as the DAG is
+        modified, so iterating over an unchanged DAG does not sort again.
+
+        Returns:
+            iterator(DAGNode): node in topological order
+        """
+        return iter(self._topological_order())
+
+    def _topological_order(self):
+        """Return the cached topological order, computing or patching it first.
+
         Returns:
-            generator(DAGNode): node in topological order
+            list(DAGNode): all the nodes of the DAG in topological order
         """
-        return nx.lexicographical_topological_sort(self._multi_graph,
-                                                   key=lambda x: str(x.qargs))
+        if self._topo_order is None:
+            self._topo_order = list(self._lexicographical_topological_sort())
+            self._topo_patched = False
+        elif self._topo_patched:
+            order = []
+            deferred = []
+            stack = list(reversed(self._topo_order))
+            tail = list(reversed(self._topo_tail))
+            while stack or tail:
+                if not stack:
+                    # The base order is exhausted; continue with the tail
+                    # and finally the output nodes it deferred.
+                    stack, tail = tail, []
+                node = stack.pop()
+                node_id = node._node_id
+                if node_id in self._topo_splice:
+                    stack.extend(reversed(self._topo_splice[node_id]))
+                elif node_id not in self._id_to_node:
+                    continue
+                elif node_id in self._topo_deferred:
+                    deferred.append(node)
+                else:
+                    order.append(node)
+            order.extend(deferred)
+            self._topo_order = order
+            self._topo_tail = []
+            self._topo_deferred = set()
+            self._topo_splice = {}
+            self._topo_patched = False
+        return self._topo_order
+
+    def _invalidate_topological_order(self):
+        """Drop the cached topological order so it is recomputed on the next read."""
+        self._topo_order = None
+        self._topo_tail = []
+        self._topo_deferred = set()
+        self._topo_splice = {}
+        self._topo_patched = False
+
+    def _lexicographical_topological_sort(self):
+        """Yield the nodes in the deterministic topological order of the DAG.
+
+        Kahn's algorithm, choosing among the ready nodes by their qargs and
+        breaking ties by node id.
+        """
+        # str(node.qargs), assembled from the strings of each wire
+        wire_strs = {wire: str(wire) for wire in self.wires}
+
+        def sort_key(node_id):
+            return '[' + ', '.join([wire_strs[wire] for wire in
+                                    self._id_to_node[node_id].qargs]) + ']'
+
+        in_degree = {}
+        ready = []
+        for node_id in self._id_to_node:
+            if self._in_nodes[node_id]:
+                in_degree[node_id] = len(self._in_nodes[node_id])
+            else:
+                ready.append((sort_key(node_id), node_id))
+        heapq.heapify(ready)
+        while ready:
+            _, node_id = heapq.heappop(ready)
+            for succ_id in self._out_nodes[node_id]:
+                in_degree[succ_id] -= 1
+                if in_degree[succ_id] == 0:
+                    del in_degree[succ_id]
+                    heapq.heappush(ready, (sort_key(succ_id), succ_id))
+            yield self._id_to_node[node_id]
 
     def topological_op_nodes(self):
         """
@@ -872,9 +1163,10 @@ class DAGCircuit:
         full_pred_map, full_succ_map = self._full_pred_succ_maps(pred_map, succ_map,
                                                                  input_dag, wire_map)
         # Now that we know the connections, delete node
-        self._multi_graph.remove_node(node)
+        self._remove_node(node._node_id)
 
         # Iterate over nodes of input_circuit
+        new_nodes = []
         for sorted_node in input_dag.topological_op_nodes():
             # Insert a new node
             condition = self._map_condition(wire_map, sorted_node.condition)
@@ -882,36 +1174,122 @@ class DAGCircuit:
                                sorted_node.qargs))
             m_cargs = list(map(lambda x: wire_map.get(x, x),
                                sorted_node.cargs))
-            self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
+            new_node = self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
+            new_nodes.append(new_node)
             # Add edges from predecessor nodes to new node
             # and update predecessor nodes that change
             all_cbits = self._bits_in_condition(condition)
             all_cbits.extend(m_cargs)
-            al = [m_qargs, all_cbits]
-            for q in itertools.chain(*al):
-                self._multi_graph.add_edge(full_pred_map[q],
-                                           self._id_to_node[self._max_node_id],
-                                           name="%s[%s]" % (q[0].name, q[1]),
-                                           wire=q)
-                full_pred_map[q] = self._id_to_node[self._max_node_id]
-
-        # Connect all predecessors and successors, and remove
-        # residual edges between input and output nodes
+            for wire_idx in self._node_wires(m_qargs, all_cbits):
+                q = self.wires[wire_idx]
+                self._add_edge(full_pred_map[q]._node_id, new_node._node_id, wire_idx)
+                full_pred_map[q] = new_node
+
+        # Connect all predecessors and successors. This replaces the
+        # residual edges that went into the removed node or the output nodes.
         for w in full_pred_map:
-            self._multi_graph.add_edge(full_pred_map[w],
-                                       full_succ_map[w],
-                                       name="%s[%s]" % (w[0].name, w[1]),
-                                       wire=w)
-            o_pred = list(self._multi_graph.predecessors(self.output_map[w]))
-            if len(o_pred) > 1:
-                if len(o_pred) != 2:
-                    raise DAGCircuitError("expected 2 predecessors here")
+            self._add_edge(full_pred_map[w]._node_id, full_succ_map[w]._node_id,
+                           self._wire_index[w])
+
+        # The replacement takes the place of node in the topological order
+        if self._topo_order is not None:
+            self._topo_splice[node._node_id] = new_nodes
+            self._topo_patched = True
+
+    def substitute_nodes_with_dags(self, replacements):
+        """Replace many op nodes with dags in one sweep.
 
-                p = [x for x in o_pred if x != full_pred_map[w]]
-                if len(p) != 1:
-                    raise DAGCircuitError("expected 1 predecessor to pass filter")
+        The wires of each replacement dag, its qubits and then its clbits in
+        the order of ``wires``, are matched to the qargs and then the cargs of
+        the node it replaces, and a conditioned node passes its condition on
+        to every operation of its replacement. The operations are copied, with
+        their parameter lists, so the same dag can replace any number of
+        nodes. The replacements take the place of the nodes in the
+        topological order.
+
+        Args:
+            replacements (dict or iterable): (node, dag) pairs, or a dict
+                from operation names to the dag that replaces every op node
+                of that name.
 
-                self._multi_graph.remove_edge(p[0], self.output_map[w])
+        Raises:
+            DAGCircuitError: if a node is not an op node, or if a dag does not
+                have as many wires as its node or has conditioned operations.
+        """
+        if isinstance(replacements, dict):
+            templates = replacements
+            replacements = [(node, templates[node.name]) for node in self.op_nodes()
+                            if node.name in templates]
+
+        # The operations of each dag in topological order, with the positions
+        # of their qubits and clbits among the wires of the dag. The rules are
+        # checked against all the nodes before any of them is replaced.
+        rules = {}
+        substitutions = []
+        for node, input_dag in replacements:
+            if node.type != "op":
+                raise DAGCircuitError("expected node type \"op\", got %s"
+                                      % node.type)
+            if id(input_dag) not in rules:
+                rules[id(input_dag)] = (input_dag, self._substitution_rule(input_dag))
+            num_wires, rule = rules[id(input_dag)][1]
+            if len(node.qargs) + len(node.cargs) != num_wires:
+                raise DAGCircuitError("expected %d wires, got %d"
+                                      % (len(node.qargs) + len(node.cargs), num_wires))
+            substitutions.append((node, rule))
+
+        for node, rule in substitutions:
+            self._substitute_node_with_rule(node, rule)
+
+    @staticmethod
+    def _substitution_rule(input_dag):
+        """Return the number of wires of a replacement dag and its operations,
+        as (op, qubit positions, clbit positions), in topological order."""
+        qwires = [w for w in input_dag.wires if isinstance(w[0], QuantumRegister)]
+        cwires = [w for w in input_dag.wires if isinstance(w[0], ClassicalRegister)]
+        positions = {w: pos for pos, w in enumerate(qwires + cwires)}
+        rule = []
+        for sorted_node in input_dag.topological_op_nodes():
+            if sorted_node.condition is not None:
+                raise DAGCircuitError("conditioned %s in a replacement dag"
+                                      % sorted_node.name)
+            rule.append((sorted_node.op,
+                         [positions[w] for w in sorted_node.qargs],
+                         [positions[w] for w in sorted_node.cargs]))
+        return len(positions), rule
+
+    def _substitute_node_with_rule(self, node, rule):
+        """Replace an op node with the operations of a substitution rule."""
+        node_id = node._node_id
+        wires = node.qargs + node.cargs
+        condition = node.condition
+        condition_bits = self._bits_in_condition(condition)
+        pred_map = dict(zip(self._in_wires[node_id], self._in_nodes[node_id]))
+        succ_map = dict(zip(self._out_wires[node_id], self._out_nodes[node_id]))
+        self._remove_node(node_id)
+
+        new_nodes = []
+        for op, qubits, clbits in rule:
+            # A shallow copy shares the parameter list, which passes edit in place
+            op = op.copy()
+            op.params = list(op.params)
+            op.control = condition
+            m_qargs = [wires[pos] for pos in qubits]
+            m_cargs = [wires[pos] for pos in clbits]
+            new_node = self._add_op_node(op, m_qargs, m_cargs, condition)
+            new_nodes.append(new_node)
+            for wire_idx in self._node_wires(m_qargs, condition_bits + m_cargs):
+                self._add_edge(pred_map[wire_idx], new_node._node_id, wire_idx)
+                pred_map[wire_idx] = new_node._node_id
+
+        # Reconnect the wires of the node in the order of its qargs, cargs
+        # and condition, as substitute_node_with_dag does
+        for wire_idx in self._node_wires(wires, condition_bits):
+            self._add_edge(pred_map[wire_idx], succ_map[wire_idx], wire_idx)
+
+        if self._topo_order is not None:
+            self._topo_splice[node_id] = new_nodes
+            self._topo_patched = True
 
     def node(self, node_id):
         """Get the node in the dag.
@@ -922,7 +1300,7 @@ class DAGCircuit:
         Returns:
             node: the node.
         """
-        return self._multi_graph.nodes[node_id]
+        return self._id_to_node[node_id]
 
     def nodes(self):
         """Iterator for node values.
@@ -930,17 +1308,26 @@ class DAGCircuit:
         Yield:
             node: the node.
         """
-        for node in self._multi_graph.nodes:
+        for node in list(self._id_to_node.values()):
             yield node
 
     def edges(self, nodes=None):
-        """Iterator for node values.
+        """Iterator for edge values, optionally restricted to the out-edges of nodes.
 
         Yield:
-            node: the node.
+            tuple(DAGNode, DAGNode, dict): source node, destination node and
+                edge data with the 'wire' and its 'name'.
         """
-        for source_node, dest_node, edge_data in self._multi_graph.edges(nodes, data=True):
-            yield source_node, dest_node, edge_data
+        if nodes is None:
+            nodes = list(self._id_to_node.values())
+        elif isinstance(nodes, DAGNode):
+            nodes = [nodes]
+
+        for source_node in nodes:
+            source_id = source_node._node_id
+            for wire_idx, dest_id in zip(list(self._out_wires[source_id]),
+                                         list(self._out_nodes[source_id])):
+                yield source_node, self._id_to_node[dest_id], self._edge_data(wire_idx)
 
     def get_op_nodes(self, op=None, data=False):
 
@@ -954,7 +1341,7 @@ class DAGCircuit:
                           ' which always contain the data',
                           DeprecationWarning, 2)
         nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == "op":
                 if op is None or isinstance(node.op, op):
                     nodes.append((node._node_id, node.data_dict))
@@ -972,7 +1359,7 @@ class DAGCircuit:
             list[DAGNode]: the list of node ids containing the given op.
         """
         nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == "op":
                 if op is None or isinstance(node.op, op):
                     nodes.append(node)
@@ -1018,7 +1405,7 @@ class DAGCircuit:
                       DeprecationWarning, 2)
 
         named_nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == 'op' and node.op.name in names:
                 named_nodes.append(node._node_id)
         return named_nodes
@@ -1026,7 +1413,7 @@ class DAGCircuit:
     def named_nodes(self, *names):
         """Get the set of "op" nodes with the given name."""
         named_nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == 'op' and node.op.name in names:
                 named_nodes.append(node)
         return named_nodes
@@ -1039,7 +1426,7 @@ class DAGCircuit:
                       DeprecationWarning, 2)
 
         two_q_nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == 'op' and len(node.qargs) == 2:
                 two_q_nodes.append(node.data_dict)
 
@@ -1062,7 +1449,7 @@ class DAGCircuit:
                       DeprecationWarning, 2)
 
         three_q_nodes = []
-        for node in self._multi_graph.nodes():
+        for node in self._id_to_node.values():
             if node.type == 'op' and len(node.qargs) >= 3:
                 three_q_nodes.append((node._node_id, node.data_dict))
         return three_q_nodes
@@ -1083,7 +1470,8 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return self._multi_graph.successors(node)
+        return (self._id_to_node[succ_id]
+                for succ_id in self._unique(self._out_nodes[node._node_id]))
 
     def predecessors(self, node):
         """Returns list of the predecessors of a node as DAGNodes."""
@@ -1093,18 +1481,21 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return self._multi_graph.predecessors(node)
+        return (self._id_to_node[pred_id]
+                for pred_id in self._unique(self._in_nodes[node._node_id]))
 
     def quantum_predecessors(self, node):
         """Returns list of the predecessors of a node that are
         connected by a quantum edge as DAGNodes."""
 
-        predecessors = []
-        for predecessor in self.predecessors(node):
-            if isinstance(self._multi_graph.get_edge_data(predecessor, node, key=0)['wire'][0],
-                          QuantumRegister):
-                predecessors.append(predecessor)
-        return predecessors
+        if isinstance(node, int):
+            node = self._id_to_node[node]
+
+        node_id = node._node_id
+        pred_ids = [pred_id for wire_idx, pred_id in zip(self._in_wires[node_id],
+                                                         self._in_nodes[node_id])
+                    if isinstance(self.wires[wire_idx][0], QuantumRegister)]
+        return [self._id_to_node[pred_id] for pred_id in self._unique(pred_ids)]
 
     def ancestors(self, node):
         """Returns set of the ancestors of a node as DAGNodes."""
@@ -1114,7 +1505,8 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.ancestors(self._multi_graph, node)
+        return {self._id_to_node[node_id]
+                for node_id in self._reachable(node._node_id, self._in_nodes)}
 
     def descendants(self, node):
         """Returns set of the descendants of a node as DAGNodes."""
@@ -1124,7 +1516,29 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.descendants(self._multi_graph, node)
+        return {self._id_to_node[node_id]
+                for node_id in self._reachable(node._node_id, self._out_nodes)}
+
+    @staticmethod
+    def _reachable(node_id, adjacency):
+        """Return the set of node ids reachable from node_id, excluding itself.
+
+        Args:
+            node_id (int): the id to start from
+            adjacency (dict): the edge lists to follow, _in_nodes or _out_nodes
+
+        Returns:
+            set(int): the ids of the reached nodes
+        """
+        seen = set()
+        stack = [node_id]
+        while stack:
+            for next_id in adjacency[stack.pop()]:
+                if next_id not in seen:
+                    seen.add(next_id)
+                    stack.append(next_id)
+        seen.discard(node_id)
+        return seen
 
     def bfs_successors(self, node):
         """
@@ -1137,7 +1551,26 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.bfs_successors(self._multi_graph, node)
+        return self._bfs_successors(node._node_id)
+
+    def _bfs_successors(self, source_id):
+        """Generator behind bfs_successors(), working on node ids."""
+        visited = {source_id}
+        queue = deque([source_id])
+        yielded = False
+        while queue:
+            parent_id = queue.popleft()
+            children = []
+            for succ_id in self._unique(self._out_nodes[parent_id]):
+                if succ_id not in visited:
+                    visited.add(succ_id)
+                    queue.append(succ_id)
+                    children.append(self._id_to_node[succ_id])
+            if children:
+                yielded = True
+                yield self._id_to_node[parent_id], children
+        if not yielded:
+            yield self._id_to_node[source_id], []
 
     def quantum_successors(self, node):
         """Returns list of the successors of a node that are
@@ -1148,13 +1581,11 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        successors = []
-        for successor in self.successors(node):
-            if isinstance(self._multi_graph.get_edge_data(
-                    node, successor, key=0)['wire'][0],
-                          QuantumRegister):
-                successors.append(successor)
-        return successors
+        node_id = node._node_id
+        succ_ids = [succ_id for wire_idx, succ_id in zip(self._out_wires[node_id],
+                                                         self._out_nodes[node_id])
+                    if isinstance(self.wires[wire_idx][0], QuantumRegister)]
+        return [self._id_to_node[succ_id] for succ_id in self._unique(succ_ids)]
 
     def remove_op_node(self, node):
         """Remove an operation node n.
@@ -1171,14 +1602,16 @@ class DAGCircuit:
             raise DAGCircuitError('The method remove_op_node only works on op node types. An "%s" '
                                   'node type was wrongly provided.' % node.type)
 
-        pred_map, succ_map = self._make_pred_succ_maps(node)
+        node_id = node._node_id
+        out_map = dict(zip(self._out_wires[node_id], self._out_nodes[node_id]))
+        pred_items = list(zip(self._in_wires[node_id], self._in_nodes[node_id]))
 
         # remove from graph and map
-        self._multi_graph.remove_node(node)
+        self._remove_node(node_id)
+        self._topo_patched = True
 
-        for w in pred_map.keys():
-            self._multi_graph.add_edge(pred_map[w], succ_map[w],
-                                       name="%s[%s]" % (w[0].name, w[1]), wire=w)
+        for wire_idx, pred_id in pred_items:
+            self._add_edge(pred_id, out_map[wire_idx], wire_idx)
 
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
@@ -1188,7 +1621,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self.ancestors(node)
         # TODO: probably better to do all at once using
         # multi_graph.remove_nodes_from; same for related functions ...
         for anc_node in anc:
@@ -1203,7 +1636,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        desc = nx.descendants(self._multi_graph, node)
+        desc = self.descendants(node)
         for desc_node in desc:
             if desc_node.type == "op":
                 self.remove_op_node(desc_node)
@@ -1216,8 +1649,8 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        anc = nx.ancestors(self._multi_graph, node)
-        comp = list(set(self._multi_graph.nodes()) - set(anc))
+        anc = self.ancestors(node)
+        comp = list(set(self._id_to_node.values()) - set(anc))
         for n in comp:
             if n.type == "op":
                 self.remove_op_node(n)
@@ -1230,8 +1663,8 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        dec = nx.descendants(self._multi_graph, node)
-        comp = list(set(self._multi_graph.nodes()) - set(dec))
+        dec = self.descendants(node)
+        comp = list(set(self._id_to_node.values()) - set(dec))
         for n in comp:
             if n.type == "op":
                 self.remove_op_node(n)
@@ -1256,11 +1689,6 @@ class DAGCircuit:
         except StopIteration:
             return
 
-        def add_nodes_from(layer, nodes):
-            """ Convert DAGNodes into a format that can be added to a
-             multigraph and then add to graph"""
-            layer._multi_graph.add_nodes_from(nodes)
-
         for graph_layer in graph_layers:
 
             # Get the op nodes from the layer, removing any input and output nodes.
@@ -1270,19 +1698,17 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
+            # Construct a shallow copy of self. Its input and output nodes
+            # get ids above those of self, so the op nodes can be shared.
             new_layer = DAGCircuit()
             new_layer.name = self.name
+            new_layer._max_node_id = self._max_node_id
 
             for creg in self.cregs.values():
                 new_layer.add_creg(creg)
             for qreg in self.qregs.values():
                 new_layer.add_qreg(qreg)
 
-            add_nodes_from(new_layer, self.input_map.values())
-            add_nodes_from(new_layer, self.output_map.values())
-            add_nodes_from(new_layer, op_nodes)
-
             # The quantum registers that have an operation in this layer.
             support_list = [
                 op_node.qargs
@@ -1290,20 +1716,17 @@ class DAGCircuit:
                 if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
             ]
 
-            # Now add the edges to the multi_graph
-            # By default we just wire inputs to the outputs.
-            wires = {self.input_map[wire]: self.output_map[wire]
-                     for wire in self.wires}
-            # Wire inputs to op nodes, and op nodes to outputs.
+            # Now add the edges to the graph. The input nodes start wired to
+            # the outputs, so wire inputs to op nodes, and op nodes to outputs.
             for op_node in op_nodes:
-                args = self._bits_in_condition(op_node.condition) \
-                       + op_node.cargs + op_node.qargs
-                arg_ids = (self.input_map[(arg[0], arg[1])] for arg in args)
-                for arg_id in arg_ids:
-                    wires[arg_id], wires[op_node] = op_node, wires[arg_id]
-
-            # Add wiring to/from the operations and between unused inputs & outputs.
-            new_layer._multi_graph.add_edges_from(wires.items())
+                node_id = op_node._node_id
+                new_layer._add_node(op_node)
+                all_cbits = self._bits_in_condition(op_node.condition) + op_node.cargs
+                for wire_idx in new_layer._node_wires(op_node.qargs, all_cbits):
+                    wire = new_layer.wires[wire_idx]
+                    new_layer._add_edge(new_layer.input_map[wire]._node_id, node_id, wire_idx)
+                    new_layer._add_edge(node_id, new_layer.output_map[wire]._node_id, wire_idx)
+
             yield {"graph": new_layer, "partition": support_list}
 
     def serial_layers(self):
@@ -1336,6 +1759,48 @@ class DAGCircuit:
             l_dict = {"graph": new_layer, "partition": support_list}
             yield l_dict
 
+    def light_layers(self):
+        """Yield the op nodes of each layer of this circuit, without building a
+        DAGCircuit for every layer.
+
+        The layers are the ones of layers(). Each layer is a tuple of
+        (node, support) pairs, where node is an op node of this circuit and
+        support is the tuple of its qubits, or an empty tuple for barrier,
+        snapshot, save, load and noise. The pairs are in the order of the
+        partition of the layer in layers().
+
+        The nodes are the ones of this circuit, not copies, so they must not
+        be modified.
+        """
+        graph_layers = self.multigraph_layers()
+        try:
+            next(graph_layers)  # Remove input nodes
+        except StopIteration:
+            return
+
+        for graph_layer in graph_layers:
+            op_nodes = [node for node in graph_layer if node.type == "op"]
+            if not op_nodes:
+                return
+            yield tuple((node, self._node_support(node)) for node in op_nodes)
+
+    def light_serial_layers(self):
+        """Yield a layer for all gates of this circuit, without building a
+        DAGCircuit for every layer.
+
+        Each layer is a tuple with the (node, support) pair of one op node,
+        as in light_layers().
+        """
+        for node in self.topological_op_nodes():
+            yield ((node, self._node_support(node)),)
+
+    @staticmethod
+    def _node_support(node):
+        """Return the qubits of an op node in the partition of its layer."""
+        if node.name in ("barrier", "snapshot", "save", "load", "noise"):
+            return ()
+        return tuple(node.qargs)
+
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
         predecessor_count = dict()  # Dict[node, predecessors not visited]
@@ -1345,23 +1810,25 @@ class DAGCircuit:
         while cur_layer:
             for node in cur_layer:
                 # Count multiedges with multiplicity.
-                for successor in self._multi_graph.successors(node):
-                    multiplicity = self._multi_graph.number_of_edges(node, successor)
+                multiplicities = OrderedDict()
+                for successor in self._out_nodes[node._node_id]:
+                    multiplicities[successor] = multiplicities.get(successor, 0) + 1
+                for successor, multiplicity in multiplicities.items():
                     if successor in predecessor_count:
                         predecessor_count[successor] -= multiplicity
                     else:
                         predecessor_count[successor] = \
-                            self._multi_graph.in_degree(successor) - multiplicity
+                            len(self._in_nodes[successor]) - multiplicity
 
                     if predecessor_count[successor] == 0:
-                        next_layer.append(successor)
+                        next_layer.append(self._id_to_node[successor])
                         del predecessor_count[successor]
 
             yield next_layer
             cur_layer = next_layer
             next_layer = []
 
-    def collect_runs(self, namelist):
+    def collect_runs(self, namelist, wires=None):
         """Return a set of non-conditional runs of "op" nodes with the given names.
 
         For example, "... h q[0]; cx q[0],q[1]; cx q[0],q[1]; h q[1]; .."
@@ -1372,6 +1839,9 @@ class DAGCircuit:
         in the circuit's basis.
 
         Nodes must have only one successor to continue the run.
+
+        If wires is given, only the runs starting with a node on one of
+        these wires are returned.
         """
         group_list = []
 
@@ -1379,19 +1849,23 @@ class DAGCircuit:
         # and form tuples containing sequences of gates
         # on the same qubit(s).
         topo_ops = list(self.topological_op_nodes())
+        if wires is not None:
+            wire_ids = {self._wire_index[wire] for wire in wires}
+            topo_ops = [node for node in topo_ops
+                        if not wire_ids.isdisjoint(self._in_wires[node._node_id])]
         nodes_seen = dict(zip(topo_ops, [False] * len(topo_ops)))
         for node in topo_ops:
             if node.name in namelist and node.condition is None \
                     and not nodes_seen[node]:
                 group = [node]
                 nodes_seen[node] = True
-                s = list(self._multi_graph.successors(node))
+                s = list(self.successors(node))
                 while len(s) == 1 and \
                         s[0].type == "op" and \
                         s[0].name in namelist:
                     group.append(s[0])
                     nodes_seen[s[0]] = True
-                    s = list(self._multi_graph.successors(s[0]))
+                    s = list(self.successors(s[0]))
                 if len(group) >= 1:
                     group_list.append(tuple(group))
         return set(group_list)
@@ -1415,6 +1889,7 @@ class DAGCircuit:
         if not current_node:
             raise DAGCircuitError('The given wire %s is not present in the circuit'
                                   % str(wire))
+        wire_idx = self._wire_index[wire]
 
         more_nodes = True
         while more_nodes:
@@ -1424,11 +1899,11 @@ class DAGCircuit:
                 yield current_node
 
             # find the adjacent node that takes the wire being looked at as input
-            for node, edges in self._multi_graph.adj[current_node].items():
-                if any(wire == edge['wire'] for edge in edges.values()):
-                    current_node = node
-                    more_nodes = True
-                    break
+            out_wires = self._out_wires[current_node._node_id]
+            if wire_idx in out_wires:
+                current_node = self._id_to_node[
+                    self._out_nodes[current_node._node_id][out_wires.index(wire_idx)]]
+                more_nodes = True
 
     def count_ops(self):
         """Count the occurrences of operation names.
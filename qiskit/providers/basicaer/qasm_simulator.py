@@ -33,9 +33,12 @@ field, which is a result of measurements for each shot.
 import uuid
 import time
 import logging
+import hashlib
+import operator
+import pickle
+from collections import OrderedDict
 
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit.util import local_hardware_info
@@ -47,9 +50,42 @@ from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
 from .basicaertools import einsum_vecmul_index
+from .basicaertools import einsum_matmul_index
 
 logger = logging.getLogger(__name__)
 
+# Comparisons of the bfunc instruction
+_BFUNC_RELATIONS = {'==': operator.eq, '!=': operator.ne,
+                    '<': operator.lt, '<=': operator.le,
+                    '>': operator.gt, '>=': operator.ge}
+
+# Compiled programs of the most recently run experiments, by content
+_COMPILED_EXPERIMENTS = OrderedDict()
+_MAX_COMPILED_EXPERIMENTS = 64
+
+
+def _merge_gates(block, block_qubits, number_of_qubits):
+    """Return a list with the gates of ``block`` merged into one gate.
+
+    Args:
+        block (list): ``unitary`` operations of a compiled program.
+        block_qubits (list[int]): the qubits the operations act on.
+        number_of_qubits (int): the number of qubits of the statevector.
+
+    Returns:
+        list: the merged operation, or ``block`` if it has less than two gates.
+    """
+    if len(block) < 2:
+        return block
+    size = len(block_qubits)
+    matrix = np.reshape(np.eye(2 ** size, dtype=complex), 2 * size * [2])
+    for _, _, (qubits, _, gate_tensor) in block:
+        local_qubits = [block_qubits.index(qubit) for qubit in qubits]
+        matrix = np.einsum(einsum_matmul_index(local_qubits, size), gate_tensor, matrix,
+                           dtype=complex, casting='no')
+    return [('unitary', None,
+             (block_qubits, einsum_vecmul_index(block_qubits, number_of_qubits), matrix))]
+
 
 class QasmSimulatorPy(BaseBackend):
     """Python implementation of a qasm simulator."""
@@ -106,7 +142,10 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "fusion_enable": False,
+        "fusion_max_qubit": 2,
+        "validate_qobj": True
     }
 
     # Class level variable to return the final state at the end of simulation
@@ -129,6 +168,9 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_enable = self.DEFAULT_OPTIONS["fusion_enable"]
+        self._fusion_max_qubit = self.DEFAULT_OPTIONS["fusion_max_qubit"]
+        self._validate_qobj = self.DEFAULT_OPTIONS["validate_qobj"]
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
@@ -150,24 +192,6 @@ class QasmSimulatorPy(BaseBackend):
                                       dtype=complex,
                                       casting='no')
 
-    def _add_unitary_two(self, gate, qubit0, qubit1):
-        """Apply a two-qubit unitary matrix.
-
-        Args:
-            gate (matrix_like): a the two-qubit gate matrix
-            qubit0 (int): gate qubit-0
-            qubit1 (int): gate qubit-1
-        """
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index([qubit0, qubit1], self._number_of_qubits)
-        # Convert to complex rank-4 tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), 4 * [2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor,
-                                      self._statevector,
-                                      dtype=complex,
-                                      casting='no')
-
     def _get_measure_outcome(self, qubit):
         """Simulate the outcome of measurement of a qubit.
 
@@ -198,7 +222,7 @@ class QasmSimulatorPy(BaseBackend):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            ndarray: The classical memory of each sample, as integers.
         """
         # Get unique qubits that are actually measured
         measured_qubits = list({qubit for qubit, cmembit in measure_params})
@@ -213,18 +237,15 @@ class QasmSimulatorPy(BaseBackend):
                                           axis=tuple(axis)),
                                    2 ** num_measured)
         # Generate samples on measured qubits
-        samples = self._local_random.choice(range(2 ** num_measured),
-                                            num_samples, p=probabilities)
-        # Convert to bit-strings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for count, (qubit, cmembit) in enumerate(sorted(measure_params)):
-                qubit_outcome = int((sample & (1 << count)) >> count)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        # Python ints are needed if the memory does not fit in an int64
+        if self._number_of_cmembits >= 63:
+            samples = samples.astype(object)
+        # Set the memory bits of all samples at once
+        memory = np.full(num_samples, self._classical_memory, dtype=samples.dtype)
+        for count, (_, cmembit) in enumerate(sorted(measure_params)):
+            qubit_outcomes = (samples >> count) & 1
+            memory = (memory & ~(1 << cmembit)) | (qubit_outcomes << cmembit)
         return memory
 
     def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
@@ -291,6 +312,9 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_enable = self.DEFAULT_OPTIONS["fusion_enable"]
+        self._fusion_max_qubit = self.DEFAULT_OPTIONS["fusion_max_qubit"]
+        self._validate_qobj = self.DEFAULT_OPTIONS["validate_qobj"]
         if backend_options is None:
             backend_options = {}
 
@@ -314,6 +338,17 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for gate fusion
+        if 'fusion_enable' in backend_options:
+            self._fusion_enable = backend_options['fusion_enable']
+        elif hasattr(qobj_config, 'fusion_enable'):
+            self._fusion_enable = qobj_config.fusion_enable
+        if 'fusion_max_qubit' in backend_options:
+            self._fusion_max_qubit = backend_options['fusion_max_qubit']
+        elif hasattr(qobj_config, 'fusion_max_qubit'):
+            self._fusion_max_qubit = qobj_config.fusion_max_qubit
+        if 'validate_qobj' in backend_options:
+            self._validate_qobj = backend_options['validate_qobj']
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -377,6 +412,140 @@ class QasmSimulatorPy(BaseBackend):
             # measure sampling is allowed
             self._sample_measure = True
 
+    def _get_compiled_experiment(self, experiment):
+        """Return the compiled program of an experiment.
+
+        Programs are cached on the content of the experiment, as jobs may run
+        in worker processes that receive a new copy of the qobj each time.
+        Running the same qobj again thus does not compile it again.
+
+        Args:
+            experiment (QobjExperiment): a qobj experiment.
+
+        Returns:
+            list: the program, as returned by ``_compile_experiment``.
+        """
+        fusion = (self._fusion_enable, self._fusion_max_qubit)
+        key = hashlib.sha1(pickle.dumps((experiment.config.n_qubits, experiment.instructions,
+                                         fusion),
+                                        protocol=pickle.HIGHEST_PROTOCOL)).digest()
+        program = _COMPILED_EXPERIMENTS.get(key)
+        if program is None:
+            program = self._compile_experiment(experiment)
+            _COMPILED_EXPERIMENTS[key] = program
+            if len(_COMPILED_EXPERIMENTS) > _MAX_COMPILED_EXPERIMENTS:
+                _COMPILED_EXPERIMENTS.popitem(last=False)
+        else:
+            _COMPILED_EXPERIMENTS.move_to_end(key)
+        return program
+
+    def _compile_experiment(self, experiment):
+        """Compile the instructions of an experiment for repeated execution.
+
+        Gate tensors and einsum index strings are built, and conditional masks
+        parsed, once here instead of for every shot. Instructions without an
+        effect on the state (``id``, ``u0`` and ``barrier``) are dropped.
+
+        Args:
+            experiment (QobjExperiment): a qobj experiment.
+
+        Returns:
+            list: a list of ``(kind, condition, args)`` tuples, where ``kind``
+            is one of ``'unitary'``, ``'measure'``, ``'reset'`` or ``'bfunc'``
+            and ``condition`` is None or a ``(from_register, mask, shift, val)``
+            tuple, the operation being applied only if
+            ``(bits & mask) >> shift == val``.
+
+        Raises:
+            BasicAerError: if an operation is not supported.
+        """
+        number_of_qubits = experiment.config.n_qubits
+        program = []
+        for operation in experiment.instructions:
+            conditional = getattr(operation, 'conditional', None)
+            if isinstance(conditional, int):
+                condition = (True, 1 << conditional, conditional, 1)
+            elif conditional is not None and int(conditional.mask, 16) > 0:
+                mask = int(conditional.mask, 16)
+                shift = (mask & -mask).bit_length() - 1
+                condition = (False, mask, shift, int(conditional.val, 16))
+            else:
+                condition = None
+
+            if operation.name in ('U', 'u1', 'u2', 'u3'):
+                params = getattr(operation, 'params', None)
+                qubits = operation.qubits[:1]
+                gate_tensor = np.array(single_gate_matrix(operation.name, params),
+                                       dtype=complex)
+                program.append(('unitary', condition,
+                                (qubits, einsum_vecmul_index(qubits, number_of_qubits),
+                                 gate_tensor)))
+            elif operation.name in ('CX', 'cx'):
+                qubits = operation.qubits[:2]
+                gate_tensor = np.reshape(cx_gate_matrix(), 4 * [2])
+                program.append(('unitary', condition,
+                                (qubits, einsum_vecmul_index(qubits, number_of_qubits),
+                                 gate_tensor)))
+            elif operation.name in ('id', 'u0', 'barrier'):
+                pass
+            elif operation.name == 'reset':
+                program.append(('reset', condition, operation.qubits[0]))
+            elif operation.name == 'measure':
+                cregbit = operation.register[0] if hasattr(operation, 'register') else None
+                program.append(('measure', condition,
+                                (operation.qubits[0], operation.memory[0], cregbit)))
+            elif operation.name == 'bfunc':
+                if operation.relation not in _BFUNC_RELATIONS:
+                    raise BasicAerError('Invalid boolean function relation.')
+                cmembit = operation.memory if hasattr(operation, 'memory') else None
+                program.append(('bfunc', condition,
+                                (int(operation.mask, 16), _BFUNC_RELATIONS[operation.relation],
+                                 int(operation.val, 16), operation.register, cmembit)))
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicAerError(err_msg.format(backend, operation.name))
+        if self._fusion_enable:
+            program = self._fuse_gates(program, number_of_qubits)
+        return program
+
+    def _fuse_gates(self, program, number_of_qubits):
+        """Merge consecutive gates of a compiled program into larger gates.
+
+        Runs of unconditional gates acting together on at most
+        ``fusion_max_qubit`` qubits are replaced by a single gate, so that
+        they are applied to the statevector in one pass instead of one pass
+        per gate.
+
+        Args:
+            program (list): a program, as returned by ``_compile_experiment``.
+            number_of_qubits (int): the number of qubits of the experiment.
+
+        Returns:
+            list: the program with the gates fused.
+        """
+        fused = []
+        block = []
+        block_qubits = []
+        for operation in program:
+            kind, condition, args = operation
+            fusable = kind == 'unitary' and condition is None
+            if fusable:
+                qubits = block_qubits + [qubit for qubit in args[0]
+                                         if qubit not in block_qubits]
+                if len(qubits) <= self._fusion_max_qubit or not block:
+                    block.append(operation)
+                    block_qubits = qubits
+                    continue
+            fused.extend(_merge_gates(block, block_qubits, number_of_qubits))
+            if fusable:
+                block, block_qubits = [operation], list(args[0])
+            else:
+                block, block_qubits = [], []
+                fused.append(operation)
+        fused.extend(_merge_gates(block, block_qubits, number_of_qubits))
+        return fused
+
     def run(self, qobj, backend_options=None):
         """Run qobj asynchronously.
 
@@ -390,22 +559,36 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "fusion_enable": bool
+                * "fusion_max_qubit": int
+                * "validate_qobj": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "fusion_enable" option merges consecutive gates acting on at
+            most "fusion_max_qubit" qubits (default 2) into a single gate
+            before simulation, so they take one pass over the statevector.
+            The default value is False.
+
+            The "validate_qobj" option can be set to False to skip the
+            validation of the qobj against its schema when it comes from a
+            trusted source, such as the assembler. The default value is True.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
+                    "fusion_enable": True
                 }
         """
         self._set_options(qobj_config=qobj.config,
                           backend_options=backend_options)
         job_id = str(uuid.uuid4())
-        job = BasicAerJob(self, job_id, self._run_job, qobj)
+        job = BasicAerJob(self, job_id, self._run_job, qobj,
+                          validate_qobj=self._validate_qobj)
         job.submit()
         return job
 
@@ -438,7 +621,7 @@ class QasmSimulatorPy(BaseBackend):
                   'time_taken': (end - start),
                   'header': qobj.header.as_dict()}
 
-        return Result.from_dict(result)
+        return Result.from_dict(result, validate=False)
 
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
@@ -488,7 +671,7 @@ class QasmSimulatorPy(BaseBackend):
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
-        # List of final counts for all shots
+        # Classical memory (int) of each shot
         memory = []
         # Check if we can sample measurements, if so we only perform 1 shot
         # and sample all outcomes from the final state vector
@@ -499,54 +682,30 @@ class QasmSimulatorPy(BaseBackend):
             measure_sample_ops = []
         else:
             shots = self._shots
+        program = self._get_compiled_experiment(experiment)
         for _ in range(shots):
             self._initialize_statevector()
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, 'conditional', None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
+            for kind, condition, args in program:
+                if condition is not None:
+                    from_register, mask, shift, val = condition
+                    if from_register:
+                        value = self._classical_register
+                    else:
+                        value = self._classical_memory
+                    if (value & mask) >> shift != val:
                         continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-
-                # Check if single  gate
-                if operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary_single(gate, qubit)
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary_two(gate, qubit0, qubit1)
-                # Check if reset
-                elif operation.name == 'reset':
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
-                # Check if measure
-                elif operation.name == 'measure':
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, 'register') else None
 
+                if kind == 'unitary':
+                    _, indexes, gate_tensor = args
+                    self._statevector = np.einsum(indexes, gate_tensor,
+                                                  self._statevector,
+                                                  dtype=complex,
+                                                  casting='no')
+                elif kind == 'measure':
+                    qubit, cmembit, cregbit = args
                     if self._sample_measure:
                         # If sampling measurements record the qubit and cmembit
                         # for this measurement for later sampling
@@ -554,30 +713,11 @@ class QasmSimulatorPy(BaseBackend):
                     else:
                         # If not sampling perform measurement as normal
                         self._add_qasm_measure(qubit, cmembit, cregbit)
-                elif operation.name == 'bfunc':
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, 'memory') else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == '==':
-                        outcome = (compared == 0)
-                    elif relation == '!=':
-                        outcome = (compared != 0)
-                    elif relation == '<':
-                        outcome = (compared < 0)
-                    elif relation == '<=':
-                        outcome = (compared <= 0)
-                    elif relation == '>':
-                        outcome = (compared > 0)
-                    elif relation == '>=':
-                        outcome = (compared >= 0)
-                    else:
-                        raise BasicAerError('Invalid boolean function relation.')
+                elif kind == 'reset':
+                    self._add_qasm_reset(args)
+                else:
+                    mask, relation, val, cregbit, cmembit = args
+                    outcome = relation((self._classical_register & mask) - val, 0)
 
                     # Store outcome in register and optionally memory slot
                     regbit = 1 << cregbit
@@ -587,10 +727,6 @@ class QasmSimulatorPy(BaseBackend):
                         membit = 1 << cmembit
                         self._classical_memory = \
                             (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
-                else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicAerError(err_msg.format(backend, operation.name))
 
             # Add final creg data to memory list
             if self._number_of_cmembits > 0:
@@ -598,15 +734,14 @@ class QasmSimulatorPy(BaseBackend):
                     # If sampling we generate all shot samples from the final statevector
                     memory = self._add_sample_measure(measure_sample_ops, self._shots)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    memory.append(self._classical_memory)
 
         # Add data
-        data = {'counts': dict(Counter(memory))}
-        # Optionally add memory list
+        values, counts = np.unique(memory, return_counts=True)
+        data = {'counts': {hex(int(value)): int(count) for value, count in zip(values, counts)}}
+        # Optionally add memory list, converted to hex only here
         if self._memory:
-            data['memory'] = memory
+            data['memory'] = [hex(int(value)) for value in memory]
         # Optionally add final statevector
         if self.SHOW_FINAL_STATE:
             data['statevector'] = self._get_statevector()
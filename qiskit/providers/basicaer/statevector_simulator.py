@@ -111,6 +111,9 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
                 * "chop_threshold": double
+                * "fusion_enable": bool
+                * "fusion_max_qubit": int
+                * "validate_qobj": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
@@ -121,11 +124,21 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             setting small values to zero in the output statevector. The default
             value is 1e-15.
 
+            The "fusion_enable" option merges consecutive gates acting on at
+            most "fusion_max_qubit" qubits (default 2) into a single gate
+            before simulation, so they take one pass over the statevector.
+            The default value is False.
+
+            The "validate_qobj" option can be set to False to skip the
+            validation of the qobj against its schema when it comes from a
+            trusted source, such as the assembler. The default value is True.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
-                    "chop_threshold": 1e-15
+                    "chop_threshold": 1e-15,
+                    "fusion_enable": True
                 }
         """
         return super().run(qobj, backend_options=backend_options)
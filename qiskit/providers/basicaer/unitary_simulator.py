@@ -100,7 +100,8 @@ class UnitarySimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_unitary": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "validate_qobj": True
     }
 
     def __init__(self, configuration=None, provider=None):
@@ -113,6 +114,7 @@ class UnitarySimulatorPy(BaseBackend):
         self._number_of_qubits = 0
         self._initial_unitary = None
         self._chop_threshold = 1e-15
+        self._validate_qobj = True
 
     def _add_unitary_single(self, gate, qubit):
         """Apply an arbitrary 1-qubit unitary matrix.
@@ -166,6 +168,7 @@ class UnitarySimulatorPy(BaseBackend):
         # Reset default options
         self._initial_unitary = self.DEFAULT_OPTIONS["initial_unitary"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._validate_qobj = self.DEFAULT_OPTIONS["validate_qobj"]
         if backend_options is None:
             backend_options = {}
 
@@ -196,6 +199,8 @@ class UnitarySimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        if 'validate_qobj' in backend_options:
+            self._validate_qobj = backend_options['validate_qobj']
 
     def _initialize_unitary(self):
         """Set the initial unitary for simulation"""
@@ -234,6 +239,7 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "validate_qobj": bool
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -244,6 +250,10 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "validate_qobj" option can be set to False to skip the
+            validation of the qobj against its schema when it comes from a
+            trusted source, such as the assembler. The default value is True.
+
             Example::
 
                 backend_options = {
@@ -257,7 +267,8 @@ class UnitarySimulatorPy(BaseBackend):
         self._set_options(qobj_config=qobj.config,
                           backend_options=backend_options)
         job_id = str(uuid.uuid4())
-        job = BasicAerJob(self, job_id, self._run_job, qobj)
+        job = BasicAerJob(self, job_id, self._run_job, qobj,
+                          validate_qobj=self._validate_qobj)
         job.submit()
         return job
 
@@ -287,7 +298,7 @@ class UnitarySimulatorPy(BaseBackend):
                   'time_taken': (end - start),
                   'header': qobj.header.as_dict()}
 
-        return Result.from_dict(result)
+        return Result.from_dict(result, validate=False)
 
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
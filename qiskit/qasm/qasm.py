@@ -18,6 +18,9 @@ OPENQASM circuit object.
 from .exceptions import QasmError
 from .qasmparser import QasmParser
 
+# Number of characters of a file parsed at a time by Qasm.parse_statements
+_CHUNK_SIZE = 2 ** 16
+
 
 class Qasm:
     """OPENQASM circuit object."""
@@ -54,3 +57,62 @@ class Qasm:
         with QasmParser(self._filename) as qasm_p:
             qasm_p.parse_debug(False)
             return qasm_p.parse(self._data)
+
+    def parse_statements(self, statement_callback):
+        """Parse the data statement by statement.
+
+        Every top-level statement is passed to ``statement_callback`` as it
+        is parsed, without building the tree of the whole program. Files are
+        read and parsed a chunk of statements at a time.
+
+        Args:
+            statement_callback (callable): function called with the node of
+                every top-level statement, in program order.
+        """
+        with QasmParser(None) as qasm_p:
+            qasm_p.parse_debug(False)
+            if self._filename:
+                qasm_p.lexer.filename = self._filename
+                with open(self._filename) as ifile:
+                    qasm_p.parse_statements(_statement_chunks(ifile, _CHUNK_SIZE),
+                                            statement_callback)
+            else:
+                qasm_p.parse_statements([(self._data, 1)], statement_callback)
+
+
+def _statement_chunks(lines, chunk_size):
+    """Split OPENQASM source lines into chunks of whole statements.
+
+    Args:
+        lines (iterable): lines of the program, e.g. an open file.
+        chunk_size (int): number of characters after which a chunk is ended
+            at the next line ending a top-level statement.
+
+    Yields:
+        tuple: ``(data, lineno)`` with the text of the chunk and the number
+            of its first line.
+    """
+    chunk = []
+    size = 0
+    lineno = 1
+    depth = 0
+    has_code = False
+    parsed = False
+    for number, line in enumerate(lines, 1):
+        if not chunk:
+            lineno = number
+        chunk.append(line)
+        size += len(line)
+        code = line.split('//', 1)[0].rstrip()
+        if code:
+            has_code = True
+            depth += code.count('{') - code.count('}')
+            if size >= chunk_size and depth == 0 and code.endswith((';', '}')):
+                yield ''.join(chunk), lineno
+                chunk = []
+                size = 0
+                has_code = False
+                parsed = True
+    if has_code or not parsed:
+        # An empty program is parsed too, for the parser to report it
+        yield ''.join(chunk), lineno
@@ -20,6 +20,7 @@ by creating a stack of lexers.
 """
 
 import os
+import sys
 
 import ply.lex as lex
 from sympy import Number
@@ -42,7 +43,11 @@ class QasmLexer:
 
     def __mklexer__(self, filename):
         """Create a PLY lexer."""
-        self.lexer = lex.lex(module=self, debug=False)
+        if getattr(self, 'lexer', None) is None:
+            self.lexer = lex.lex(module=self, debug=False)
+        else:
+            # Building the lexer compiles the token rules, so reuse them
+            self.lexer = self.lexer.clone()
         self.filename = filename
         self.lineno = 1
 
@@ -56,9 +61,16 @@ class QasmLexer:
         self.__mklexer__(filename)
         self.stack = []
 
-    def input(self, data):
-        """Set the input text data."""
+    def input(self, data, lineno=1):
+        """Set the input text data, whose first line is numbered lineno."""
+        if self.stack:
+            # A previous input stopped inside an include
+            self.lexer = self.stack[0]
+            self.filename = self.lexer.qasm_file
+            self.stack = []
         self.data = data
+        self.lineno = lineno
+        self.lexer.lineno = lineno
         self.lexer.input(data)
 
     def token(self):
@@ -106,8 +118,18 @@ class QasmLexer:
 
     def t_REAL(self, t):
         r'(([0-9]+|([0-9]+)?\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+)|(([0-9]+)?\.[0-9]+|[0-9]+\.)'
-        t.value = Number(t.value)
         # tad nasty, see mkfloat.py to see how this is derived from python spec
+        mantissa, _, exponent = t.value.lower().partition('e')
+        digits = len(mantissa.replace('.', '').lstrip('0'))
+        value = float(t.value)
+        if digits + max(int(exponent or 0), 0) <= 15 and \
+                (not digits or sys.float_info.min <= abs(value) <= sys.float_info.max):
+            # sympy gives literals of up to 15 digits the precision of a
+            # double, so skip its much slower parsing of the string. Values
+            # that underflow a normal double keep the sympy parsing.
+            t.value = Number(value)
+        else:
+            t.value = Number(t.value)
         return t
 
     def t_NNINTEGER(self, t):
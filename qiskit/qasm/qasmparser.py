@@ -14,10 +14,6 @@
 
 """OpenQASM parser."""
 
-import os
-import shutil
-import tempfile
-
 import ply.yacc as yacc
 import sympy
 
@@ -25,6 +21,10 @@ from . import node
 from .exceptions import QasmError
 from .qasmlexer import QasmLexer
 
+# LALR tables of the grammar, generated by the first QasmParser of the process
+# as (action, goto, productions) and shared by the later ones.
+_PARSE_TABLES = None
+
 
 class QasmParser:
     """OPENQASM Parser."""
@@ -37,16 +37,16 @@ class QasmParser:
             filename = ""
         self.lexer = QasmLexer(filename)
         self.tokens = self.lexer.tokens
-        self.parse_dir = tempfile.mkdtemp(prefix='qiskit')
         self.precedence = (
             ('left', '+', '-'),
             ('left', '*', '/'),
             ('left', 'negative', 'positive'),
             ('right', '^'))
-        # For yacc, also, write_tables = Bool and optimize = Bool
-        self.parser = yacc.yacc(module=self, debug=False,
-                                outputdir=self.parse_dir)
+        self.parser = self._make_parser()
         self.qasm = None
+        # When set, top-level statements are passed to this function as they
+        # are parsed instead of being collected in the program node
+        self.statement_callback = None
         self.parse_deb = False
         self.global_symtab = {}                          # global symtab
         self.current_symtab = self.global_symtab         # top of symbol stack
@@ -58,8 +58,27 @@ class QasmParser:
         return self
 
     def __exit__(self, *args):
-        if os.path.exists(self.parse_dir):
-            shutil.rmtree(self.parse_dir)
+        pass
+
+    def _make_parser(self):
+        """Return a PLY parser calling the grammar rules of this instance.
+
+        The LALR tables are only generated for the first parser of the process.
+        """
+        global _PARSE_TABLES  # pylint: disable=global-statement
+        if _PARSE_TABLES is None:
+            parser = yacc.yacc(module=self, debug=False, write_tables=False)
+            _PARSE_TABLES = (parser.action, parser.goto,
+                             [(str(prod), prod.name, prod.len, prod.func, prod.file, prod.line)
+                              for prod in parser.productions])
+            return parser
+
+        tables = yacc.LRTable()
+        tables.lr_action, tables.lr_goto, productions = _PARSE_TABLES
+        tables.lr_productions = [yacc.MiniProduction(*prod) for prod in productions]
+        tables.bind_callables({prod.func: getattr(self, prod.func)
+                               for prod in tables.lr_productions if prod.func})
+        return yacc.LRParser(tables, self.p_error)
 
     def update_symtab(self, obj):
         """Update a node in the symbol table.
@@ -281,14 +300,21 @@ class QasmParser:
         """
            program : statement
         """
-        program[0] = node.Program([program[1]])
+        if self.statement_callback is not None:
+            self.statement_callback(program[1])
+            program[0] = node.Program([])
+        else:
+            program[0] = node.Program([program[1]])
 
     def p_program_1(self, program):
         """
            program : program statement
         """
         program[0] = program[1]
-        program[0].add_child(program[2])
+        if self.statement_callback is not None:
+            self.statement_callback(program[2])
+        else:
+            program[0].add_child(program[2])
 
     # ----------------------------------------
     #  statement : decl
@@ -1069,8 +1095,46 @@ class QasmParser:
                             + "' must be True or False.")
 
     def parse(self, data):
-        """Parse some data."""
-        self.parser.parse(data, lexer=self.lexer, debug=self.parse_deb)
+        """Parse some data.
+
+        The parser can be reused to parse several programs, each starting
+        from an empty symbol table.
+        """
+        self.global_symtab = {}
+        self.current_symtab = self.global_symtab
+        self.symbols = []
+        self.statement_callback = None
+        return self._parse_chunk(data, 1)
+
+    def parse_statements(self, chunks, statement_callback):
+        """Parse a program statement by statement.
+
+        Instead of building the tree of the whole program, every top-level
+        statement is passed to ``statement_callback`` as soon as it is parsed
+        and then dropped. Only the symbol table of the declarations is kept.
+
+        Args:
+            chunks (iterable): pieces of the program as ``(data, lineno)``
+                tuples, where ``data`` holds whole statements and ``lineno``
+                is the line number of its first line.
+            statement_callback (callable): function called with the node of
+                every top-level statement, in program order.
+        """
+        self.global_symtab = {}
+        self.current_symtab = self.global_symtab
+        self.symbols = []
+        self.statement_callback = statement_callback
+        try:
+            for data, lineno in chunks:
+                self._parse_chunk(data, lineno)
+        finally:
+            self.statement_callback = None
+
+    def _parse_chunk(self, data, lineno):
+        """Parse data starting at line lineno and return the program node."""
+        self.qasm = None
+        self.lexer.input(data or '', lineno)
+        self.parser.parse(lexer=self.lexer, debug=self.parse_deb)
         if self.qasm is None:
             raise QasmError("Uncaught exception in parser; "
                             + "see previous messages for details.")
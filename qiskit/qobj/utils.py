@@ -14,9 +14,25 @@
 
 """Qobj utilities and enums."""
 
+import copy
+import hashlib
+import json
 from enum import Enum
 
+import jsonschema
+
+from qiskit.tools.parallel import parallel_map
 from qiskit.validation.jsonschema import validate_json_against_schema
+from qiskit.validation.jsonschema.schema_validation import (_SCHEMAS, _get_validator)
+
+_QOBJ_ERR_MSG = ('Qobj failed validation. Set Qiskit log level to DEBUG '
+                 'for further information.')
+
+# Digests of the experiments that already passed validation, per qobj type
+_VALIDATED_EXPERIMENTS = set()
+_MAX_VALIDATED_EXPERIMENTS = 4096
+# Validators of the QASM instructions by name, and for any name under None
+_QASM_INSTRUCTION_VALIDATORS = {}
 
 
 class QobjType(str, Enum):
@@ -31,13 +47,152 @@ class MeasReturnType(str, Enum):
     SINGLE = 'single'
 
 
-def validate_qobj_against_schema(qobj):
+def validate_qobj_against_schema(qobj, parallel=False):
     """Validates a QObj against the .json schema.
 
+    The experiments are validated one at a time against the experiment
+    part of the schema, and the rest of the qobj against the whole schema.
+    Experiments identical to ones that already passed validation are not
+    validated again.
+
     Args:
         qobj (Qobj): Qobj to be validated.
+        parallel (bool): validate the experiments in parallel processes.
+
+    Raises:
+        SchemaValidationError: if the qobj does not validate against the schema.
+    """
+    experiments = getattr(qobj, 'experiments', None)
+    if not isinstance(experiments, list) or not experiments:
+        validate_json_against_schema(qobj.as_dict(), 'qobj', err_msg=_QOBJ_ERR_MSG)
+        return
+
+    # Validate the qobj with a single placeholder experiment, which also
+    # establishes its type
+    qobj_head = copy.copy(qobj)
+    qobj_head.experiments = []
+    qobj_dict = qobj_head.as_dict()
+    qobj_dict['experiments'] = [{'instructions': []}]
+    validate_json_against_schema(qobj_dict, 'qobj', err_msg=_QOBJ_ERR_MSG)
+    qobj_type = qobj_dict['type']
+    schema_name = _experiment_schema_name(qobj_type)
+
+    digests = []
+    experiment_dicts = []
+    seen = set(_VALIDATED_EXPERIMENTS)
+    for experiment in experiments:
+        experiment_dict = experiment.as_dict()
+        digest = _experiment_digest(schema_name, experiment_dict)
+        if digest is None or digest not in seen:
+            seen.add(digest)
+            digests.append(digest)
+            experiment_dicts.append(experiment_dict)
+
+    if parallel:
+        valid = parallel_map(_is_valid_experiment, experiment_dicts, task_args=(qobj_type,))
+    else:
+        valid = [_is_valid_experiment(experiment_dict, qobj_type)
+                 for experiment_dict in experiment_dicts]
+
+    for digest, experiment_dict, is_valid in zip(digests, experiment_dicts, valid):
+        if not is_valid:
+            # Validate again to raise the error with its explanation
+            validate_json_against_schema(experiment_dict, schema_name,
+                                         err_msg=_QOBJ_ERR_MSG)
+        if digest is not None:
+            if len(_VALIDATED_EXPERIMENTS) >= _MAX_VALIDATED_EXPERIMENTS:
+                _VALIDATED_EXPERIMENTS.clear()
+            _VALIDATED_EXPERIMENTS.add(digest)
+
+
+def _experiment_schema_name(qobj_type):
+    """Return the name of the schema of the experiments of a qobj type,
+    creating it from the qobj schema the first time."""
+    schema_name = 'qobj_{}_experiment'.format(qobj_type.lower())
+    if schema_name not in _SCHEMAS:
+        qobj_schema = _SCHEMAS['qobj']
+        if qobj_type == QobjType.QASM:
+            qasm_schema = qobj_schema['oneOf'][0]['allOf'][1]
+            items = qasm_schema['properties']['experiments']['items']
+        else:
+            pulse_schema = qobj_schema['definitions']['qobj_openpulse']
+            items = pulse_schema['properties']['experiments']['items']
+        schema = dict(items, definitions=qobj_schema['definitions'])
+        schema['$schema'] = qobj_schema['$schema']
+        _get_validator(schema_name, schema=schema)
+        _SCHEMAS[schema_name] = schema
+    return schema_name
+
+
+def _experiment_digest(schema_name, experiment_dict):
+    """Return a digest identifying an experiment, or None if the
+    experiment can not be serialized to JSON."""
+    try:
+        data = json.dumps(experiment_dict, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1((schema_name + data).encode('utf-8')).hexdigest()
+
+
+def _qasm_instruction_validators():
+    """Return validators of the QASM instructions by name, built the first
+    time from the qobj schema.
+
+    The schema of an instruction is a ``oneOf`` over kinds of instructions,
+    told apart by their names. Validating an instruction only against the
+    kind of its name avoids trying all the others.
     """
-    validate_json_against_schema(
-        qobj.as_dict(), 'qobj',
-        err_msg='Qobj failed validation. Set Qiskit log level to DEBUG '
-                'for further information.')
+    if not _QASM_INSTRUCTION_VALIDATORS:
+        qobj_schema = _SCHEMAS['qobj']
+        definitions = qobj_schema['definitions']
+        instruction_schema = definitions['openqasm_instructions']
+        validator_class = jsonschema.validators.validator_for(qobj_schema)
+
+        kinds_by_name = {}
+        other_names = set()
+        dispatch = True
+        for kind in instruction_schema['oneOf']:
+            if '$ref' in kind:
+                kind = definitions[kind['$ref'].split('/')[-1]]
+            name_schema = kind.get('properties', {}).get('name', {})
+            if 'enum' in name_schema:
+                for name in name_schema['enum']:
+                    kinds_by_name.setdefault(name, []).append(kind)
+            elif 'enum' in name_schema.get('not', {}):
+                other_names.update(name_schema['not']['enum'])
+            else:
+                # A kind that is not told apart by name
+                dispatch = False
+
+        common = {key: value for key, value in instruction_schema.items()
+                  if key != 'oneOf'}
+        for name, kinds in kinds_by_name.items():
+            # The name must select exactly one kind of the oneOf
+            if dispatch and len(kinds) == 1 and name in other_names:
+                schema = dict(common, allOf=[kinds[0]], definitions=definitions)
+                _QASM_INSTRUCTION_VALIDATORS[name] = validator_class(schema)
+        _QASM_INSTRUCTION_VALIDATORS[None] = validator_class(
+            dict(instruction_schema, definitions=definitions))
+    return _QASM_INSTRUCTION_VALIDATORS
+
+
+def _is_valid_experiment(experiment_dict, qobj_type):
+    """Return whether an experiment validates against the schema of the
+    experiments of its qobj type."""
+    validator = _get_validator(_experiment_schema_name(qobj_type))
+    instructions = experiment_dict.get('instructions')
+    if qobj_type != QobjType.QASM or not isinstance(instructions, list):
+        return validator.is_valid(experiment_dict)
+
+    # The items of the instructions of a QASM experiment are
+    # openqasm_instructions, which are validated by name
+    if not validator.is_valid(dict(experiment_dict, instructions=[])):
+        return False
+    instruction_validators = _qasm_instruction_validators()
+    for instruction in instructions:
+        name = instruction.get('name') if isinstance(instruction, dict) else None
+        if not isinstance(name, str) or name not in instruction_validators:
+            name = None
+        if not instruction_validators[name].is_valid(instruction):
+            return False
+    return True
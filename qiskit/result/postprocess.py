@@ -71,6 +71,78 @@ def format_counts_memory(shot_memory, header=None):
     return shot_memory
 
 
+def _format_outcomes(outcomes, header):
+    """Format integer outcomes as the bitstrings ``format_counts_memory``
+    gives for them, converting all of them at once.
+
+    Args:
+        outcomes (np.ndarray): the integer outcomes.
+        header (dict): the experiment header dictionary.
+
+    Returns:
+        list[str]: the formatted outcomes, or None if they can not be
+            formatted in bulk.
+    """
+    memory_slots = header.get('memory_slots', None) if header else None
+    if not memory_slots or memory_slots > 63:
+        return None
+    if outcomes.size and (outcomes.min() < 0 or outcomes.max() >= 1 << memory_slots):
+        return None
+
+    # One row of '0' and '1' characters per outcome, most significant first
+    shifts = np.arange(memory_slots - 1, -1, -1, dtype=np.int64)
+    chars = ((outcomes[:, None] >> shifts) & 1).astype(np.uint8) + ord('0')
+
+    creg_sizes = header.get('creg_sizes', None)
+    if creg_sizes:
+        # Pick the columns of each register, with a column of spaces between
+        columns = []
+        running_index = 0
+        for position, (_, size) in enumerate(reversed(creg_sizes)):
+            if position:
+                columns.append(memory_slots)
+            columns.extend(range(running_index, min(running_index + size, memory_slots)))
+            running_index += size
+        spaces = np.full((len(outcomes), 1), ord(' '), dtype=np.uint8)
+        chars = np.hstack([chars, spaces])[:, columns]
+
+    if not chars.shape[1]:
+        return None
+    width = chars.shape[1]
+    return np.ascontiguousarray(chars).view('S{}'.format(width)).ravel().astype(str).tolist()
+
+
+def _format_keys(keys, header):
+    """Format hexadecimal outcomes in bulk, or return None if they can not be."""
+    if not all(key.startswith('0x') for key in keys):
+        return None
+    try:
+        outcomes = np.array([int(key, 16) for key in keys], dtype=np.int64)
+    except OverflowError:
+        return None
+    return _format_outcomes(outcomes, header)
+
+
+def counts_to_arrays(counts):
+    """Return a counts histogram as arrays of the integer outcomes and of
+    their counts, sorted by outcome.
+
+    Args:
+        counts (dict): counts histogram of multiple shots, with keys in
+            hexadecimal (``0x123``) or binary format.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): the outcomes and the counts.
+    """
+    if not counts:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    outcomes = np.array([int(key, 16) if key.startswith('0x') else int(key.replace(' ', ''), 2)
+                         for key in counts])
+    values = np.array(list(counts.values()), dtype=int)
+    order = np.argsort(outcomes, kind='stable')
+    return outcomes[order], values[order]
+
+
 def _list_to_complex_array(complex_list):
     """Convert nested list of shape (..., 2) to complex numpy array with shape (...)
 
@@ -143,10 +215,12 @@ def format_level_2_memory(memory, header=None):
     Returns:
         list[str]: List of bitstrings
     """
-    memory_list = []
-    for shot_memory in memory:
-        memory_list.append(format_counts_memory(shot_memory, header))
-    return memory_list
+    keys = list(dict.fromkeys(memory))
+    formatted = _format_keys(keys, header)
+    if formatted is None:
+        formatted = [format_counts_memory(key, header) for key in keys]
+    formatted = dict(zip(keys, formatted))
+    return [formatted[shot_memory] for shot_memory in memory]
 
 
 def format_counts(counts, header=None):
@@ -161,6 +235,10 @@ def format_counts(counts, header=None):
     Returns:
         dict: a formatted counts
     """
+    formatted = _format_keys(list(counts), header)
+    if formatted is not None:
+        return dict(zip(formatted, counts.values()))
+
     counts_dict = {}
     for key, val in counts.items():
         key = format_counts_memory(key, header)
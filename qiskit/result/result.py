@@ -14,6 +14,10 @@
 
 """Model for schema-conformant Results."""
 
+import copy
+
+import numpy as np
+
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.pulse.schedule import Schedule
 from qiskit.exceptions import QiskitError
@@ -22,6 +26,9 @@ from qiskit.validation.base import BaseModel, bind_schema
 from qiskit.result import postprocess
 from .models import ResultSchema
 
+# Widest experiment, in memory slots, whose counts are returned as a dense array
+_MAX_DENSE_COUNTS_BITS = 24
+
 
 @bind_schema(ResultSchema)
 class Result(BaseModel):
@@ -41,6 +48,10 @@ class Result(BaseModel):
             experiments of the input qobj
     """
 
+    # Formatted data of the experiments, kept out of the model fields. The
+    # data is formatted again if the data or header of an experiment changes.
+    __slots__ = ('_formatted',)
+
     def __init__(self, backend_name, backend_version, qobj_id, job_id, success,
                  results, **kwargs):
         self.backend_name = backend_name
@@ -49,6 +60,7 @@ class Result(BaseModel):
         self.job_id = job_id
         self.success = success
         self.results = results
+        self._formatted = {}
 
         super().__init__(**kwargs)
 
@@ -129,30 +141,27 @@ class Result(BaseModel):
         Raises:
             QiskitError: if there is no memory data for the circuit.
         """
+        exp_result = self._get_experiment(experiment)
+        meas_level = exp_result.meas_level
         try:
-            exp_result = self._get_experiment(experiment)
-
-            try:  # header is not available
-                header = exp_result.header.to_dict()
-            except (AttributeError, QiskitError):
-                header = None
-
-            meas_level = exp_result.meas_level
-
-            memory = self.data(experiment)['memory']
-
             if meas_level == 2:
-                return postprocess.format_level_2_memory(memory, header)
+                memory = self._get_formatted(exp_result, 'memory',
+                                             postprocess.format_level_2_memory)
             elif meas_level == 1:
-                return postprocess.format_level_1_memory(memory)
+                memory = self._get_formatted(exp_result, 'memory',
+                                             postprocess.format_level_1_memory,
+                                             use_header=False)
             elif meas_level == 0:
-                return postprocess.format_level_0_memory(memory)
+                memory = self._get_formatted(exp_result, 'memory',
+                                             postprocess.format_level_0_memory,
+                                             use_header=False)
             else:
                 raise QiskitError('Measurement level {0} is not supported'.format(meas_level))
-
-        except KeyError:
+        except AttributeError:
             raise QiskitError('No memory for experiment "{0}".'.format(experiment))
 
+        return memory.copy()
+
     def get_counts(self, experiment=None):
         """Get the histogram data of an experiment.
 
@@ -169,17 +178,57 @@ class Result(BaseModel):
         Raises:
             QiskitError: if there are no counts for the experiment.
         """
+        exp = self._get_experiment(experiment)
         try:
-            exp = self._get_experiment(experiment)
-            try:
-                header = exp.header.to_dict()
-            except (AttributeError, QiskitError):  # header is not available
-                header = None
-
-            return postprocess.format_counts(self.data(experiment)['counts'],
-                                             header)
-        except KeyError:
+            return dict(self._get_formatted(exp, 'counts', postprocess.format_counts))
+        except AttributeError:
+            raise QiskitError('No counts for experiment "{0}"'.format(experiment))
+
+    def get_counts_array(self, experiment=None, sparse=False):
+        """Get the histogram data of an experiment as integer arrays.
+
+        The outcomes are the integers whose binary digits are the measured
+        memory slots, with slot 0 as the least significant bit.
+
+        Args:
+            experiment (str or QuantumCircuit or Schedule or int or None): the index of the
+                experiment, as specified by ``data()``.
+            sparse (bool): return only the outcomes that were measured.
+
+        Returns:
+            np.ndarray or tuple(np.ndarray, np.ndarray): if ``sparse`` is False,
+                an array of 2^memory_slots counts indexed by outcome. Otherwise,
+                an array of the measured outcomes in increasing order and an
+                array of their counts.
+
+        Raises:
+            QiskitError: if there are no counts for the experiment, if an
+                outcome does not fit in the memory slots, or if the dense
+                array would have more than 2^24 entries (use ``sparse``).
+        """
+        exp = self._get_experiment(experiment)
+        try:
+            outcomes, values = self._get_formatted(exp, 'counts', postprocess.counts_to_arrays,
+                                                   use_header=False)
+        except AttributeError:
             raise QiskitError('No counts for experiment "{0}"'.format(experiment))
+        max_bits = int(outcomes.max()).bit_length() if outcomes.size else 0
+        try:
+            num_bits = exp.header.memory_slots
+        except AttributeError:
+            num_bits = max_bits
+        if max_bits > num_bits:
+            raise QiskitError('Counts of experiment "{0}" have outcomes wider than its {1} '
+                              'memory slots'.format(experiment, num_bits))
+        if sparse:
+            return outcomes.copy(), values.copy()
+
+        if num_bits > _MAX_DENSE_COUNTS_BITS:
+            raise QiskitError('Experiment "{0}" has too many memory slots ({1}) for dense '
+                              'counts, use sparse=True'.format(experiment, num_bits))
+        dense = np.zeros(1 << num_bits, dtype=values.dtype)
+        np.add.at(dense, outcomes, values)
+        return dense
 
     def get_statevector(self, experiment=None, decimals=None):
         """Get the final statevector of an experiment.
@@ -224,6 +273,46 @@ class Result(BaseModel):
         except KeyError:
             raise QiskitError('No unitary for experiment "{0}"'.format(experiment))
 
+    def _get_formatted(self, exp_result, kind, formatter, use_header=True):
+        """Return data of an experiment formatted for the user, formatting it
+        again only if the data or the header changed since the last time.
+
+        Args:
+            exp_result (ExperimentResult): the experiment.
+            kind (str): the name of the data, such as ``counts``.
+            formatter (callable): called with the data as simple types, and
+                the header dict if ``use_header`` is True, to format the data.
+            use_header (bool): pass the header to the formatter.
+
+        Returns:
+            object: the formatted data, which must not be modified.
+
+        Raises:
+            AttributeError: if the experiment has no data of the given kind.
+        """
+        raw_data = getattr(exp_result.data, kind)
+        data = raw_data.to_dict() if isinstance(raw_data, BaseModel) else raw_data
+        try:  # header is not available
+            header_dict = exp_result.header.to_dict()
+        except (AttributeError, QiskitError):
+            header_dict = None
+        formatted = getattr(self, '_formatted', None)
+        if formatted is None:
+            formatted = self._formatted = {}
+
+        # The data and header can be edited in place, so compare their contents
+        key = (id(exp_result), formatter)
+        cached = formatted.get(key)
+        if cached is not None and cached[0] == data and cached[1] == header_dict:
+            return cached[2]
+
+        if use_header:
+            value = formatter(data, header_dict)
+        else:
+            value = formatter(data)
+        formatted[key] = (copy.deepcopy(data), header_dict, value)
+        return value
+
     def _get_experiment(self, key=None):
         """Return a single experiment result from a given key.
 
@@ -48,10 +48,17 @@
 """
 Routines for running Python functions in parallel using process pools
 from the multiprocessing library.
+
+The worker processes are started on first use and reused by later calls,
+so repeated calls to ``parallel_map`` (e.g. from ``transpile``) do not pay
+the cost of forking and tearing down a pool each time.
 """
 
+import atexit
 import os
 import platform
+import sys
+import types
 from multiprocessing import Pool
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
@@ -63,9 +70,88 @@ os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# Default number of worker processes, can be set with QISKIT_NUM_PROCS
+NUM_PROCESSES = int(os.getenv('QISKIT_NUM_PROCS', CPU_COUNT))
+
+# The shared worker pool, its number of processes and a snapshot of the
+# objects defined in __main__ when its workers were forked.
+_POOL = None
+_POOL_SIZE = 0
+_POOL_MAIN = None
+
+
+class _ParallelTask:
+    """Picklable callable applying ``task`` with its shared arguments.
+
+    It is sent once per chunk of values, so arguments common to the whole
+    batch are not serialized again for every value.
+    """
+
+    def __init__(self, task, task_args, task_kwargs):
+        self.task = task
+        self.task_args = task_args
+        self.task_kwargs = task_kwargs
+
+    def __call__(self, value):
+        return self.task(value, *self.task_args, **self.task_kwargs)
+
+
+def _main_snapshot():
+    """Return the ids of the classes and functions defined in __main__.
+
+    Workers only see the ``__main__`` namespace as it was when they were
+    forked, so the pool has to be restarted if classes or functions were
+    (re)defined there since, as tasks referring to them are pickled by name.
+    """
+    main = sys.modules.get('__main__')
+    if main is None:
+        return {}
+    return {name: id(value) for name, value in vars(main).items()
+            if isinstance(value, (type, types.FunctionType))}
+
+
+def _get_pool(num_processes):
+    """Return the shared worker pool, starting it if needed.
+
+    Args:
+        num_processes (int): Number of worker processes the pool must have.
+
+    Returns:
+        Pool: the worker pool.
+    """
+    global _POOL, _POOL_SIZE, _POOL_MAIN  # pylint: disable=global-statement
+
+    main_snapshot = _main_snapshot()
+    if _POOL is not None and (_POOL_SIZE != num_processes or _POOL_MAIN != main_snapshot):
+        close_pool()
+    if _POOL is None:
+        _POOL = Pool(processes=num_processes)
+        _POOL_SIZE = num_processes
+        _POOL_MAIN = main_snapshot
+    return _POOL
+
+
+def close_pool():
+    """Terminate the worker pool used by ``parallel_map``, if it was started.
+
+    The pool is started again on the next call to ``parallel_map``.
+    """
+    global _POOL, _POOL_SIZE, _POOL_MAIN  # pylint: disable=global-statement
+
+    if _POOL is not None:
+        _POOL.terminate()
+        _POOL.join()
+    _POOL = None
+    _POOL_SIZE = 0
+    _POOL_MAIN = None
+
+
+atexit.register(close_pool)
+
 
 def parallel_map(  # pylint: disable=dangerous-default-value
-        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT):
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=NUM_PROCESSES,
+        chunksize=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
     is functionally equivalent to::
@@ -75,13 +161,20 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    The values are sent to a pool of worker processes that is started on the
+    first call and kept for the following ones. They are submitted in chunks,
+    and ``task_args`` and ``task_kwargs`` are sent along with each chunk
+    rather than with each value.
+
     Args:
         task (func): Function that is to be called for each value in ``values``.
         values (array_like): List or array of values for which the ``task``
                             function is to be evaluated.
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
-        num_processes (int): Number of processes to spawn.
+        num_processes (int): Number of processes in the worker pool.
+        chunksize (int): Number of values sent to a worker at a time. By
+            default the values are split in about four chunks per process.
 
     Returns:
         result: The result list contains the value of
@@ -110,28 +203,28 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     if platform.system() != 'Windows' and num_processes > 1 \
        and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
         os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+        if chunksize is None:
+            chunksize = -(-len(values) // (4 * num_processes))
         try:
-            pool = Pool(processes=num_processes)
-
-            async_res = [pool.apply_async(task, (value,) + task_args, task_kwargs,
-                                          _callback) for value in values]
+            pool = _get_pool(num_processes)
 
-            while not all([item.ready() for item in async_res]):
-                for item in async_res:
-                    item.wait(timeout=0.1)
-
-            pool.terminate()
-            pool.join()
+            # Results are collected in order as the workers complete them
+            results = []
+            for result in pool.imap(_ParallelTask(task, task_args, task_kwargs),
+                                    values, chunksize):
+                results.append(result)
+                _callback(result)
 
         except KeyboardInterrupt:
-            pool.terminate()
-            pool.join()
+            close_pool()
             Publisher().publish("terra.parallel.finish")
             raise QiskitError('Keyboard interrupt in parallel_map.')
 
+        finally:
+            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+
         Publisher().publish("terra.parallel.finish")
-        os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
-        return [ar.get() for ar in async_res]
+        return results
 
     # Cannot do parallel on Windows , if another parallel_map is running in parallel,
     # or len(values) == 1.
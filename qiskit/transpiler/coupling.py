@@ -19,6 +19,10 @@ The nodes of the graph correspond to physical qubits (represented as integers) a
 directed edges indicate which physical qubits are coupled and the permitted direction of
 CNOT gates. The object has a distance function that can be used to map quantum circuits
 onto a device with this coupling.
+
+The undirected distances and next hops between all the pairs of physical qubits are
+computed at once with ``scipy.sparse.csgraph`` and shared by all the coupling maps with
+the same qubits and edges.
 """
 import numpy as np
 import scipy.sparse as sp
@@ -26,6 +30,11 @@ import scipy.sparse.csgraph as cs
 import networkx as nx
 from qiskit.transpiler.exceptions import CouplingError
 
+# The distance tables of the coupling maps built in this process, keyed on their
+# physical qubits and edges. The tables are shared and must not be modified.
+_DISTANCE_TABLES = {}
+_DISTANCE_TABLES_SIZE = 64
+
 
 class CouplingMap:
     """
@@ -46,8 +55,11 @@ class CouplingMap:
 
         # the coupling map graph
         self.graph = nx.DiGraph()
-        # a dict of dicts from node pairs to distances
+        # a dense array of the undirected distances between physical qubits
         self._dist_matrix = None
+        # a dense array of the next physical qubit on a shortest undirected
+        # path, indexed by the target and the current physical qubit
+        self._next_hops = None
         # a sorted list of physical qubits (integers) in this coupling map
         self._qubit_list = None
         # a sorted list of physical qubits (integers) in this coupling map
@@ -85,6 +97,7 @@ class CouplingMap:
                 "The physical qubit %s is already in the coupling graph" % physical_qubit)
         self.graph.add_node(physical_qubit)
         self._dist_matrix = None  # invalidate
+        self._next_hops = None  # invalidate
         self._qubit_list = None  # invalidate
 
     def add_edge(self, src, dst):
@@ -100,6 +113,7 @@ class CouplingMap:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst)
         self._dist_matrix = None  # invalidate
+        self._next_hops = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     def subgraph(self, nodelist):
@@ -132,22 +146,46 @@ class CouplingMap:
         except nx.exception.NetworkXException:
             return False
 
+    def _distance_tables(self):
+        """Return the distance and next hop tables of the graph, and whether
+        the graph is connected.
+
+        The tables are computed with a breadth-first search from every
+        physical qubit, on the undirected graph, and are looked up in
+        ``_DISTANCE_TABLES`` first.
+        """
+        key = (tuple(self.physical_qubits), frozenset(self.graph.edges))
+        tables = _DISTANCE_TABLES.get(key)
+        if tables is None:
+            size = self.physical_qubits[-1] + 1 if self.physical_qubits else 0
+            edges = np.array(list(self.graph.edges), dtype=int).reshape(-1, 2)
+            mat = sp.coo_matrix((np.ones(len(edges), dtype=int), (edges[:, 0], edges[:, 1])),
+                                shape=(size, size)).tocsr()
+            dist, predecessors = cs.shortest_path(mat, directed=False, unweighted=True,
+                                                  return_predecessors=True)
+            qubits = np.array(self.physical_qubits, dtype=int)
+            connected = bool(qubits.size) and bool(
+                np.isfinite(dist[np.ix_(qubits, qubits)]).all())
+            tables = (dist, predecessors, connected)
+            if len(_DISTANCE_TABLES) >= _DISTANCE_TABLES_SIZE:
+                _DISTANCE_TABLES.clear()
+            _DISTANCE_TABLES[key] = tables
+        return tables
+
     def _compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        The distance map self._dist_matrix and the next hops self._next_hops
+        are taken from the shared distance tables of the graph.
+
+        Raises:
+            CouplingError: if the graph is not connected
         """
-        if not self.is_connected():
+        dist, predecessors, connected = self._distance_tables()
+        if not connected:
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        self._dist_matrix = dist
+        self._next_hops = predecessors
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -162,14 +200,38 @@ class CouplingMap:
         Raises:
             CouplingError: if the qubits do not exist in the CouplingMap
         """
-        if physical_qubit1 not in self.physical_qubits:
+        if physical_qubit1 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit1,))
-        if physical_qubit2 not in self.physical_qubits:
+        if physical_qubit2 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit2,))
         if self._dist_matrix is None:
             self._compute_distance_matrix()
         return self._dist_matrix[physical_qubit1, physical_qubit2]
 
+    def distances(self, physical_qubits1, physical_qubits2):
+        """Returns the undirected distances between pairs of physical qubits.
+
+        Args:
+            physical_qubits1 (array_like): Physical qubits
+            physical_qubits2 (array_like): Other physical qubits, paired with
+                physical_qubits1 element by element
+
+        Returns:
+            ndarray: The undirected distances, as integers
+
+        Raises:
+            CouplingError: if the qubits do not exist in the CouplingMap
+        """
+        physical_qubits1 = np.asarray(physical_qubits1, dtype=int)
+        physical_qubits2 = np.asarray(physical_qubits2, dtype=int)
+        for qubits in (physical_qubits1, physical_qubits2):
+            missing = np.setdiff1d(qubits, self.physical_qubits)
+            if missing.size:
+                raise CouplingError("%s not in coupling graph" % (missing[0],))
+        if self._dist_matrix is None:
+            self._compute_distance_matrix()
+        return self._dist_matrix[physical_qubits1, physical_qubits2].astype(int)
+
     def shortest_undirected_path(self, physical_qubit1, physical_qubit2):
         """Returns the shortest undirected path between physical_qubit1 and physical_qubit2.
         Args:
@@ -180,12 +242,20 @@ class CouplingMap:
         Raises:
             CouplingError: When there is no path between physical_qubit1, physical_qubit2.
         """
-        try:
-            return nx.shortest_path(self.graph.to_undirected(as_view=True), source=physical_qubit1,
-                                    target=physical_qubit2)
-        except nx.exception.NetworkXNoPath:
-            raise CouplingError(
-                "Nodes %s and %s are not connected" % (str(physical_qubit1), str(physical_qubit2)))
+        for physical_qubit in (physical_qubit1, physical_qubit2):
+            if physical_qubit not in self.graph:
+                raise CouplingError("%s not in coupling graph" % (physical_qubit,))
+        next_hops = self._next_hops
+        if next_hops is None:
+            next_hops = self._distance_tables()[1]
+        path = [physical_qubit1]
+        while path[-1] != physical_qubit2:
+            hop = next_hops[physical_qubit2, path[-1]]
+            if hop < 0:
+                raise CouplingError("Nodes %s and %s are not connected" % (
+                    str(physical_qubit1), str(physical_qubit2)))
+            path.append(int(hop))
+        return path
 
     @property
     def is_symmetric(self):
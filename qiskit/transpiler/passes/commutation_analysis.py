@@ -22,18 +22,29 @@ are grouped into a set of gates that commute.
 This pass also provides useful methods to determine if two gates
 can commute in the circuit.
 
-TODO: the current pass determines commutativity through matrix multiplication.
-A rule-based analysis would be potentially faster, but more limited.
+Commutativity is decided by rules for common pairs of gates and otherwise
+through matrix multiplication. The answers are cached for the whole process,
+keyed on the gates, their parameters and how their qubits overlap.
 """
 
 from collections import defaultdict
 import numpy as np
+from qiskit.circuit import ParameterExpression
 from qiskit.transpiler.exceptions import TranspilerError
 
 from qiskit.transpiler.basepasses import AnalysisPass
 
 _CUTOFF_PRECISION = 1E-10
 
+# Commutation of pairs of gates, by names, parameters and qubit pattern
+_COMMUTATION_CACHE = {}
+_COMMUTATION_CACHE_SIZE = 100000
+
+# Gates whose matrices are diagonal, and gates about the X axis
+_DIAGONAL_GATES = frozenset(['z', 't', 's', 'sdag', 'tdag', 'rz', 'u1', 'cz'])
+_X_AXIS_GATES = frozenset(['x', 'rx'])
+_CONTROLLED_GATES = frozenset(['cx', 'cy', 'cz'])
+
 
 class CommutationAnalysis(AnalysisPass):
     """An analysis pass to find commutation relations between DAG nodes."""
@@ -41,51 +52,55 @@ class CommutationAnalysis(AnalysisPass):
     def __init__(self):
         super().__init__()
         self.gates_on_wire = {}
+        # the commutation set written by the last run, and the change mark of
+        # the dag when that run started
+        self._commutation_set = None
+        self._change_mark = None
 
     def run(self, dag):
         """
         Run the pass on the DAG, and write the discovered commutation relations
         into the property_set.
-        """
-        # Initiate the commutation set
-        self.property_set['commutation_set'] = defaultdict(list)
 
-        # Build a dictionary to keep track of the gates on each qubit
-        for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
-            self.property_set['commutation_set'][wire_name] = []
-
-        # Add edges to the dictionary for each qubit
-        for node in dag.topological_op_nodes():
-            for (_, _, edge_data) in dag.edges(node):
+        If the commutation set in the property_set is the one of the last run,
+        only the relations on the wires changed since are recomputed.
+        """
+        wires = dag.wires
+        commutation_set = self.property_set['commutation_set']
+        if commutation_set is not None and commutation_set is self._commutation_set:
+            wires = dag.wires_changed_since(self._change_mark)
+        self._change_mark = dag.change_mark()
 
-                edge_name = edge_data['name']
-                self.property_set['commutation_set'][(node, edge_name)] = -1
+        if len(wires) == len(dag.wires):
+            # Initiate the commutation set
+            commutation_set = defaultdict(list)
 
-        for wire in dag.wires:
+        for wire in wires:
             wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
 
+            # Forget the relations of the gates that were on the wire
+            for com_set in commutation_set[wire_name]:
+                for gate in com_set:
+                    del commutation_set[(gate, wire_name)]
+            current_comm_set = commutation_set[wire_name] = []
+
             for current_gate in dag.nodes_on_wire(wire):
 
-                current_comm_set = self.property_set['commutation_set'][wire_name]
                 if not current_comm_set:
                     current_comm_set.append([current_gate])
 
                 if current_gate not in current_comm_set[-1]:
                     prev_gate = current_comm_set[-1][-1]
-                    does_commute = False
-                    try:
-                        does_commute = _commute(current_gate, prev_gate)
-                    except TranspilerError:
-                        pass
-                    if does_commute:
+                    if _commute(current_gate, prev_gate):
                         current_comm_set[-1].append(current_gate)
 
                     else:
                         current_comm_set.append([current_gate])
 
                 temp_len = len(current_comm_set)
-                self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
+                commutation_set[(current_gate, wire_name)] = temp_len - 1
+
+        self.property_set['commutation_set'] = self._commutation_set = commutation_set
 
 
 def _gate_master_def(name, params=None):
@@ -227,17 +242,110 @@ def _kron_list(args):
 def _matrix_commute(node1, node2):
     # Good for composite gates or any future
     # user-defined gate of equal or less than 2 qubits.
-    ret = False
-    if set(node1.qargs) & set(node2.qargs) == set():
-        ret = True
-    if _calc_product(node1, node2) is not None:
-        ret = np.allclose(_calc_product(node1, node2),
-                          _calc_product(node2, node1),
-                          atol=_CUTOFF_PRECISION)
-    return ret
+    return np.allclose(_calc_product(node1, node2),
+                       _calc_product(node2, node1),
+                       atol=_CUTOFF_PRECISION)
+
+
+def _rule_commute(name1, qargs1, name2, qargs2):
+    """Return whether two gates commute, from the positions of their qubits,
+    or None if no rule applies.
+
+    Only the gates known to ``_gate_master_def`` are decided by rules, so that
+    the answers are those the matrices would give.
+    """
+    if not set(qargs1) & set(qargs2):
+        return True
+    if name1 in _DIAGONAL_GATES and name2 in _DIAGONAL_GATES:
+        return True
+    if name1 == 'cx' and name2 == 'cx':
+        return qargs1[0] != qargs2[1] and qargs2[0] != qargs1[1]
+    if name2 == 'cx':
+        name1, qargs1, name2, qargs2 = name2, qargs2, name1, qargs1
+    if name1 == 'cx':
+        # Gates about the X axis commute on the target of a cx, and diagonal
+        # gates away from it. Otherwise, small enough angles still commute.
+        if name2 in _X_AXIS_GATES and qargs2[0] == qargs1[1]:
+            return True
+        if name2 in _DIAGONAL_GATES and qargs1[1] not in qargs2:
+            return True
+    return None
+
+
+def _single_qubit_commute(name1, matrix1, qargs1, name2, matrix2, qargs2):
+    """Return whether a single qubit gate commutes with a single qubit gate or
+    a controlled gate, or None for other pairs.
+
+    The matrices are built on the qubits of the pair only, as in
+    ``_calc_product``, without going through the names of the wires.
+    """
+    if len(qargs1) == 1 and len(qargs2) == 1:
+        pass
+    elif len(qargs1) == 1 and name2 in _CONTROLLED_GATES:
+        matrix1 = _on_controlled_gate_qubit(matrix1, qargs1[0] == qargs2[0])
+        matrix2 = _controlled_gate_matrix(name2)
+    elif len(qargs2) == 1 and name1 in _CONTROLLED_GATES:
+        matrix1 = _controlled_gate_matrix(name1)
+        matrix2 = _on_controlled_gate_qubit(matrix2, qargs2[0] == qargs1[0])
+    else:
+        return None
+    return np.allclose(matrix2.dot(matrix1), matrix1.dot(matrix2),
+                       atol=_CUTOFF_PRECISION)
+
+
+def _controlled_gate_matrix(name):
+    """Return the matrix of a controlled gate, with the control first."""
+    return (np.kron(_gate_master_def(name='P0'), _gate_master_def(name='Id')) +
+            np.kron(_gate_master_def(name='P1'), _gate_master_def(name=name[1])))
+
+
+def _on_controlled_gate_qubit(matrix, on_control):
+    """Return the matrix of a single qubit gate on the control or the target
+    of a controlled gate."""
+    if on_control:
+        return np.kron(matrix, _gate_master_def(name='Id'))
+    return np.kron(_gate_master_def(name='Id'), matrix)
 
 
 def _commute(node1, node2):
+    """Return whether two DAG nodes commute. Nodes that are not gates known
+    to ``_gate_master_def``, or whose parameters are unbound, do not."""
     if node1.type != "op" or node2.type != "op":
         return False
-    return _matrix_commute(node1, node2)
+    # The matrices of gates with unbound parameters are unknown
+    if any(isinstance(param, ParameterExpression)
+           for param in node1.op.params + node2.op.params):
+        return False
+
+    # The relative positions of the qubits of the gates
+    qubits = {}
+    qargs1 = tuple(qubits.setdefault(qubit, len(qubits)) for qubit in node1.qargs)
+    qargs2 = tuple(qubits.setdefault(qubit, len(qubits)) for qubit in node2.qargs)
+    key = (node1.name, tuple(node1.op.params), qargs1,
+           node2.name, tuple(node2.op.params), qargs2)
+    try:
+        return _COMMUTATION_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable parameters, such as arrays
+        key = None
+
+    try:
+        matrix1 = _gate_master_def(node1.name, node1.op.params)
+        matrix2 = _gate_master_def(node2.name, node2.op.params)
+    except TranspilerError:
+        does_commute = False
+    else:
+        does_commute = _rule_commute(node1.name, qargs1, node2.name, qargs2)
+        if does_commute is None:
+            does_commute = _single_qubit_commute(node1.name, matrix1, qargs1,
+                                                 node2.name, matrix2, qargs2)
+        if does_commute is None:
+            does_commute = _matrix_commute(node1, node2)
+
+    if key is not None:
+        if len(_COMMUTATION_CACHE) >= _COMMUTATION_CACHE_SIZE:
+            _COMMUTATION_CACHE.clear()
+        _COMMUTATION_CACHE[key] = does_commute
+    return does_commute
@@ -36,6 +36,8 @@ class CommutativeCancellation(TransformationPass):
     def __init__(self):
         super().__init__()
         self.requires.append(CommutationAnalysis())
+        # the change mark of the dag when the pass last started on it
+        self._change_mark = None
 
     def run(self, dag):
         """Run the CommutativeCancellation pass on a dag
@@ -52,23 +54,43 @@ class CommutativeCancellation(TransformationPass):
 
         q_gate_list = ['cx', 'cy', 'cz', 'h', 'x', 'y', 'z']
 
+        # The gate sets of a wire only change with the gates on the wire, and
+        # those of two qubit gates with the gates on their second wire. The
+        # sets on the wires that did not change since the pass last started
+        # were left as they are then, and are left alone again.
+        changed_wires = set(dag.wires_changed_since(self._change_mark))
+        self._change_mark = dag.change_mark()
+        wires = set(changed_wires)
+        for wire in changed_wires:
+            wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
+            for com_set in self.property_set['commutation_set'][wire_name]:
+                for node in com_set:
+                    if node.type == 'op' and len(node.qargs) == 2 and node.qargs[1] == wire:
+                        wires.add(node.qargs[0])
+
         # Gate sets to be cancelled
         cancellation_sets = defaultdict(lambda: [])
 
         for wire in dag.wires:
+            if wire not in wires:
+                continue
             wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
             wire_commutation_set = self.property_set['commutation_set'][wire_name]
+            wire_changed = wire in changed_wires
 
             for com_set_idx, com_set in enumerate(wire_commutation_set):
                 if com_set[0].type in ['in', 'out']:
                     continue
                 for node in com_set:
                     num_qargs = len(node.qargs)
+                    if num_qargs == 1 and not wire_changed:
+                        continue
                     if num_qargs == 1 and node.name in q_gate_list:
                         cancellation_sets[(node.name, wire_name, com_set_idx)].append(node)
                     if num_qargs == 1 and node.name in ['u1', 'rz', 't', 's']:
                         cancellation_sets[('z_rotation', wire_name, com_set_idx)].append(node)
-                    elif num_qargs == 2 and node.qargs[0] == wire:
+                    elif num_qargs == 2 and node.qargs[0] == wire \
+                            and node.qargs[1] in changed_wires:
                         second_op_name = "{0}[{1}]".format(str(node.qargs[1][0].name),
                                                            str(node.qargs[1][1]))
                         q2_key = (node.name, wire_name, second_op_name,
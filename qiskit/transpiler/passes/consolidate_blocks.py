@@ -75,9 +75,14 @@ class ConsolidateBlocks(TransformationPass):
                 for nd in block:
                     nodes_seen.add(nd)
                     subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
-                unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
-                new_dag.apply_operation_back(
-                    unitary, sorted(block_qargs, key=lambda x: block_index_map[x]))
+                if subcirc.parameters:
+                    # blocks with unbound parameters can not be simulated
+                    for nd in block:
+                        new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
+                else:
+                    unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
+                    new_dag.apply_operation_back(
+                        unitary, sorted(block_qargs, key=lambda x: block_index_map[x]))
                 del blocks[0]
             else:
                 # the node could belong to some future block, but in that case
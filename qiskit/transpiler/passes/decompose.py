@@ -16,6 +16,13 @@
 
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
+from qiskit.circuit.instruction import _rule_key
+
+# The rules of gates decomposed in this process, as dags keyed on the gate and
+# its parameters. The dags are substituted with copies of their instructions
+# and must not be modified.
+_DECOMPOSITION_CACHE = {}
+_DECOMPOSITION_CACHE_SIZE = 1000
 
 
 class Decompose(TransformationPass):
@@ -40,19 +47,48 @@ class Decompose(TransformationPass):
             DAGCircuit: output dag where gate was expanded.
         """
         # Walk through the DAG and expand each non-basis node
+        substitutions = []
         for node in dag.op_nodes(self.gate):
+            decomposition = _decomposition(node.op)
             # opaque or built-in gates are not decomposable
-            if not node.op.definition:
+            if decomposition is None:
                 continue
-            # TODO: allow choosing among multiple decomposition rules
-            rule = node.op.definition
-            # hacky way to build a dag on the same register as the rule is defined
-            # TODO: need anonymous rules to address wires by index
-            decomposition = DAGCircuit()
-            decomposition.add_qreg(rule[0][1][0][0])
-            if rule[0][2]:
-                decomposition.add_creg(rule[0][2][0][0])
-            for inst in rule:
-                decomposition.apply_operation_back(*inst)
-            dag.substitute_node_with_dag(node, decomposition)
+            substitutions.append((node, decomposition))
+        dag.substitute_nodes_with_dags(substitutions)
         return dag
+
+
+def _decomposition(op):
+    """Return the rule of op, from ``_DECOMPOSITION_CACHE`` when op was
+    decomposed before.
+
+    Returns:
+        DAGCircuit or None: the rule, on the registers it is defined on, or
+            None if op has no rule.
+    """
+    key = _rule_key(op)
+    try:
+        return _DECOMPOSITION_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable parameters, such as arrays
+        key = None
+
+    # TODO: allow choosing among multiple decomposition rules
+    rule = op.definition
+    if not rule:
+        return None
+    # hacky way to build a dag on the same register as the rule is defined
+    # TODO: need anonymous rules to address wires by index
+    decomposition = DAGCircuit()
+    decomposition.add_qreg(rule[0][1][0][0])
+    if rule[0][2]:
+        decomposition.add_creg(rule[0][2][0][0])
+    for inst in rule:
+        decomposition.apply_operation_back(*inst)
+    if key is not None:
+        if len(_DECOMPOSITION_CACHE) >= _DECOMPOSITION_CACHE_SIZE:
+            _DECOMPOSITION_CACHE.clear()
+        _DECOMPOSITION_CACHE[key] = decomposition
+    return decomposition
@@ -20,6 +20,7 @@ a cx is not in the coupling map possibilities, it inserts one or more swaps in f
 compatible.
 """
 
+from qiskit.circuit.gate import Gate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
@@ -75,10 +76,15 @@ class BasicSwap(TransformationPass):
 
         current_layout = self.initial_layout.copy()
 
-        for layer in dag.serial_layers():
-            subdag = layer['graph']
+        for qreg in dag.qregs.values():
+            new_dag.add_qreg(qreg)
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
 
-            for gate in subdag.twoQ_gates():
+        for layer in dag.light_serial_layers():
+            gate, _ = layer[0]
+
+            if len(gate.qargs) == 2 and isinstance(gate.op, Gate):
                 physical_q0 = current_layout[gate.qargs[0]]
                 physical_q1 = current_layout[gate.qargs[1]]
                 if self.coupling_map.distance(physical_q0, physical_q1) != 1:
@@ -112,6 +118,8 @@ class BasicSwap(TransformationPass):
                         current_layout.swap(path[swap], path[swap + 1])
 
             edge_map = current_layout.combine_into_edge_map(self.initial_layout)
-            new_dag.extend_back(subdag, edge_map)
+            new_dag.apply_operation_back(gate.op.copy(),
+                                         [edge_map[qubit] for qubit in gate.qargs],
+                                         gate.cargs, gate.condition)
 
         return new_dag
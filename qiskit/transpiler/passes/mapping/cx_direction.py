@@ -21,6 +21,7 @@ from math import pi
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 
+from qiskit.circuit import QuantumRegister
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.layout import Layout
 from qiskit.extensions.standard import U2Gate
@@ -61,43 +62,47 @@ class CXDirection(TransformationPass):
             TranspilerError: If the circuit cannot be mapped just by flipping the
                 cx nodes.
         """
-        new_dag = DAGCircuit()
-
         if self.layout is None:
             # LegacySwap renames the register in the DAG and does not match the property set
             self.layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
-        for layer in dag.serial_layers():
-            subdag = layer['graph']
-
-            for cnot_node in subdag.named_nodes('cx', 'CX'):
-                control = cnot_node.qargs[0]
-                target = cnot_node.qargs[1]
-
-                physical_q0 = self.layout[control]
-                physical_q1 = self.layout[target]
-                if self.coupling_map.distance(physical_q0, physical_q1) != 1:
-                    raise TranspilerError('The circuit requires a connection between physical '
-                                          'qubits %s and %s' % (physical_q0, physical_q1))
-
-                if (physical_q0, physical_q1) not in self.coupling_map.get_edges():
-                    # A flip needs to be done
-
-                    # Create the involved registers
-                    if control[0] not in subdag.qregs.values():
-                        subdag.add_qreg(control[0])
-                    if target[0] not in subdag.qregs.values():
-                        subdag.add_qreg(target[0])
-
-                    # Add H gates around
-                    subdag.apply_operation_back(U2Gate(0, pi), [target], [])
-                    subdag.apply_operation_back(U2Gate(0, pi), [control], [])
-                    subdag.apply_operation_front(U2Gate(0, pi), [target], [])
-                    subdag.apply_operation_front(U2Gate(0, pi), [control], [])
-
-                    # Flips the CX
-                    cnot_node.qargs[0], cnot_node.qargs[1] = target, control
-
-            new_dag.extend_back(subdag)
-
-        return new_dag
+        edges = set(self.coupling_map.get_edges())
+        flipped_cx = {}
+        substitutions = []
+        for cnot_node in dag.named_nodes('cx', 'CX'):
+            control = cnot_node.qargs[0]
+            target = cnot_node.qargs[1]
+
+            physical_q0 = self.layout[control]
+            physical_q1 = self.layout[target]
+            if self.coupling_map.distance(physical_q0, physical_q1) != 1:
+                raise TranspilerError('The circuit requires a connection between physical '
+                                      'qubits %s and %s' % (physical_q0, physical_q1))
+
+            if (physical_q0, physical_q1) not in edges:
+                # A flip needs to be done
+                if cnot_node.name not in flipped_cx:
+                    flipped_cx[cnot_node.name] = _flipped_cx_dag(cnot_node.op)
+                substitutions.append((cnot_node, flipped_cx[cnot_node.name]))
+
+        dag.substitute_nodes_with_dags(substitutions)
+        return dag
+
+
+def _flipped_cx_dag(cnot):
+    """Return a dag of the cx gate cnot flipped between H gates, on the
+    control and then the target qubit."""
+    qreg = QuantumRegister(2, 'q')
+    flipped = DAGCircuit()
+    flipped.add_qreg(qreg)
+
+    # Add H gates around
+    flipped.apply_operation_back(U2Gate(0, pi), [qreg[0]], [])
+    flipped.apply_operation_back(U2Gate(0, pi), [qreg[1]], [])
+
+    # Flips the CX
+    flipped.apply_operation_back(cnot, [qreg[1], qreg[0]], [])
+
+    flipped.apply_operation_back(U2Gate(0, pi), [qreg[0]], [])
+    flipped.apply_operation_back(U2Gate(0, pi), [qreg[1]], [])
+    return flipped
@@ -17,6 +17,7 @@
 
 cimport cython
 from libcpp.set cimport set as cset
+from libcpp.vector cimport vector
 from .utils cimport NLayout, EdgeCollection
 
 @cython.boundscheck(False)
@@ -45,8 +46,8 @@ cdef double compute_cost(double[:, ::1] dist, unsigned int * logic_to_phys,
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef compute_random_scaling(double[:, ::1] scale, double[:, ::1] cdist2,
-                            double * rand, unsigned int num_qubits):
+cdef void compute_random_scaling(double[:, ::1] scale, double[:, ::1] cdist2,
+                                 double * rand, unsigned int num_qubits) nogil:
     """ Computes the symmetric random scaling (perturbation) matrix, 
     and places the values in the 'scale' array.
 
@@ -64,37 +65,39 @@ cdef compute_random_scaling(double[:, ::1] scale, double[:, ::1] cdist2,
             idx += 1
 
 
+cdef inline void swap_layout(vector[unsigned int]& logic_to_phys,
+                             vector[unsigned int]& phys_to_logic,
+                             unsigned int idx1, unsigned int idx2) nogil:
+    """ Swaps two physical qubits in a layout held in vectors, as
+    NLayout.swap does.
+    """
+    cdef unsigned int temp1, temp2
+    temp1 = phys_to_logic[idx1]
+    temp2 = phys_to_logic[idx2]
+    phys_to_logic[idx1] = temp2
+    phys_to_logic[idx2] = temp1
+    logic_to_phys[phys_to_logic[idx1]] = idx1
+    logic_to_phys[phys_to_logic[idx2]] = idx2
+
+
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
-               int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist, 
-               int[::1] edges, double[:, ::1] scale, object rng):
-    """ A single iteration of the tchastic swap mapping routine.
-
-    Args:
-        num_qubits (int): The number of physical qubits.
-        int_layout (NLayout): The numeric (integer) representation of 
-                              the initial_layout.
-        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
-        gates (ndarray): Int array with integers giving qubits on which
-                         two-qubits gates act on.
-        cdist2 (ndarray): Array of doubles that gives the square of the 
-                          distance graph.
-        cdist (ndarray): Array of doubles that gives the distance graph.
-        edges (ndarray): Int array of edges in coupling map.
-        scale (ndarray): A double array that holds the perturbed cdist2 array.
-        rng (RandomState): An instance of the NumPy RandomState.
+cdef unsigned int run_trial(unsigned int num_qubits,
+                            vector[unsigned int]& trial_l2p,
+                            vector[unsigned int]& trial_p2l,
+                            cset[unsigned int]& input_qubit_set,
+                            int[::1] gates, double[:, ::1] scale,
+                            double[:, ::1] cdist, int[::1] edges,
+                            vector[unsigned int]& opt_edges) nogil:
+    """ Runs the swap search of a trial on the layout held in trial_l2p
+    and trial_p2l, without holding the GIL.
 
     Returns:
-        double: Best distance achieved in this trial.
-        EdgeCollection: Collection of optimal edges found.
-        NLayout: The optimal layout found.
         int: The number of depth steps required in mapping.
     """
-    cdef EdgeCollection opt_edges = EdgeCollection()
-    cdef NLayout optimal_layout, new_layout, trial_layout = int_layout.copy()
-    
+    cdef vector[unsigned int] new_l2p, new_p2l, optimal_l2p, optimal_p2l
+
     cdef unsigned int num_gates = gates.shape[0]//2
     cdef unsigned int num_edges = edges.shape[0]//2
     
@@ -107,19 +110,7 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
     cdef unsigned int optimal_start, optimal_end, optimal_start_qubit, optimal_end_qubit
     
     cdef size_t idx
-    
-    # Compute randomized distance
-    cdef double[::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
-                                             size=num_qubits*(num_qubits+1)//2)
-    
-    compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
-    
-    # Convert int qubit array to c++ set
     cdef cset[unsigned int] qubit_set
-    cdef cset[unsigned int] input_qubit_set
-    
-    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
-        input_qubit_set.insert(int_qubit_subset[idx])
     
     # Loop over depths from 1 up to a maximum depth
     while depth_step < depth_max:
@@ -127,7 +118,7 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # While there are still qubits available
         while not qubit_set.empty():
             # Compute the objective function
-            min_cost = compute_cost(scale, trial_layout.logic_to_phys,
+            min_cost = compute_cost(scale, trial_l2p.data(),
                                    gates, num_gates)
             # Try to decrease objective function
             cost_reduced = 0
@@ -137,38 +128,42 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
             for idx in range(num_edges):
                 start_edge = edges[2*idx]
                 end_edge = edges[2*idx+1]
-                start_qubit = trial_layout.phys_to_logic[start_edge]
-                end_qubit =  trial_layout.phys_to_logic[end_edge]
+                start_qubit = trial_p2l[start_edge]
+                end_qubit =  trial_p2l[end_edge]
                 # Are the qubits available?
                 if  qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
                     # Try this edge to reduce the cost
                     if need_copy:
-                        new_layout = trial_layout.copy()
+                        new_l2p = trial_l2p
+                        new_p2l = trial_p2l
                         need_copy = 0
-                    new_layout.swap(start_edge, end_edge)
+                    swap_layout(new_l2p, new_p2l, start_edge, end_edge)
                     # Compute the objective function
-                    new_cost = compute_cost(scale, new_layout.logic_to_phys,
+                    new_cost = compute_cost(scale, new_l2p.data(),
                                    gates, num_gates)
                     # Record progress if we succceed
                     if new_cost < min_cost:
                         cost_reduced = True
                         min_cost = new_cost
-                        optimal_layout = new_layout
+                        optimal_l2p = new_l2p
+                        optimal_p2l = new_p2l
                         optimal_start = start_edge
                         optimal_end = end_edge
                         optimal_start_qubit = start_qubit
                         optimal_end_qubit = end_qubit
                         need_copy = 1
                     else:
-                        new_layout.swap(start_edge, end_edge)
+                        swap_layout(new_l2p, new_p2l, start_edge, end_edge)
 
             # After going over all edges
             # Were there any good swap choices?
             if cost_reduced:
                 qubit_set.erase(optimal_start_qubit)
                 qubit_set.erase(optimal_end_qubit)
-                trial_layout = optimal_layout
-                opt_edges.add(optimal_start, optimal_end)
+                trial_l2p.swap(optimal_l2p)
+                trial_p2l.swap(optimal_p2l)
+                opt_edges.push_back(optimal_start)
+                opt_edges.push_back(optimal_end)
             else:
                 break
 
@@ -176,7 +171,7 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # failed to improve the cost.
 
         # Compute the coupling graph distance
-        dist = compute_cost(cdist, trial_layout.logic_to_phys,
+        dist = compute_cost(cdist, trial_l2p.data(),
                                    gates, num_gates)
         # If all gates can be applied now, we are finished.
         # Otherwise we need to consider a deeper swap circuit
@@ -186,8 +181,71 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # Increment the depth
         depth_step += 1
 
-    # Either we have succeeded at some depth d < dmax or failed
-    dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+    return depth_step
+
+
+@cython.nonecheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
+               int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist, 
+               int[::1] edges, double[:, ::1] scale, double[::1] rand):
+    """ A single iteration of the tchastic swap mapping routine.
+
+    The search runs without holding the GIL, so trials with their own
+    scale arrays can run in concurrent threads.
+
+    Args:
+        num_qubits (int): The number of physical qubits.
+        int_layout (NLayout): The numeric (integer) representation of 
+                              the initial_layout.
+        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        gates (ndarray): Int array with integers giving qubits on which
+                         two-qubits gates act on.
+        cdist2 (ndarray): Array of doubles that gives the square of the 
+                          distance graph.
+        cdist (ndarray): Array of doubles that gives the distance graph.
+        edges (ndarray): Int array of edges in coupling map.
+        scale (ndarray): A double array that holds the perturbed cdist2 array.
+        rand (ndarray): Array of doubles of length num_qubits*(num_qubits+1)//2
+                        that randomly perturb the distances of this trial.
+
+    Returns:
+        double: Best distance achieved in this trial.
+        EdgeCollection: Collection of optimal edges found.
+        NLayout: The optimal layout found.
+        int: The number of depth steps required in mapping.
+    """
+    cdef EdgeCollection opt_edges = EdgeCollection()
+    cdef NLayout trial_layout = NLayout(int_layout.l2p_len, int_layout.p2l_len)
+    cdef vector[unsigned int] trial_l2p, trial_p2l
+    cdef unsigned int num_gates = gates.shape[0]//2
+    cdef unsigned int depth_step
+    cdef double dist
+    cdef size_t idx
+
+    trial_l2p.assign(int_layout.logic_to_phys,
+                     int_layout.logic_to_phys + int_layout.l2p_len)
+    trial_p2l.assign(int_layout.phys_to_logic,
+                     int_layout.phys_to_logic + int_layout.p2l_len)
+    
+    # Convert int qubit array to c++ set
+    cdef cset[unsigned int] input_qubit_set
+    
+    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
+        input_qubit_set.insert(int_qubit_subset[idx])
+
+    with nogil:
+        # Compute randomized distance
+        compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
+        depth_step = run_trial(num_qubits, trial_l2p, trial_p2l, input_qubit_set,
+                               gates, scale, cdist, edges, opt_edges._edges)
+        # Either we have succeeded at some depth d < dmax or failed
+        dist = compute_cost(cdist, trial_l2p.data(), gates, num_gates)
+
+    for idx in range(trial_l2p.size()):
+        trial_layout.logic_to_phys[idx] = trial_l2p[idx]
+    for idx in range(trial_p2l.size()):
+        trial_layout.phys_to_logic[idx] = trial_p2l[idx]
     
     return dist, opt_edges, trial_layout, depth_step
@@ -28,6 +28,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.circuit import QuantumRegister
 
 from qiskit.extensions.standard import SwapGate
+from qiskit.transpiler.passes.mapping.utils import partition_layer, apply_layer
 
 
 class LegacySwap(TransformationPass):
@@ -76,7 +77,7 @@ class LegacySwap(TransformationPass):
             raise TranspilerError("Not enough qubits in CouplingGraph")
 
         # Schedule the input circuit
-        layerlist = list(dag.layers())
+        layerlist = list(dag.light_layers())
 
         if self.initial_layout is None and self.property_set["layout"]:
             self.initial_layout = self.property_set["layout"]
@@ -123,17 +124,6 @@ class LegacySwap(TransformationPass):
         for creg in dag.cregs.values():
             dagcircuit_output.add_creg(creg)
 
-        # Make a trivial wire mapping between the subcircuits
-        # returned by swap_mapper_layer_update and the circuit
-        # we are building
-        identity_wire_map = {}
-        q = QuantumRegister(self.coupling_map.size(), 'q')
-        for j in range(self.coupling_map.size()):
-            identity_wire_map[(q, j)] = (q, j)
-        for creg in dag.cregs.values():
-            for j in range(creg.size):
-                identity_wire_map[(creg, j)] = (creg, j)
-
         first_layer = True  # True until first layer is output
 
         # Iterate over layers
@@ -141,17 +131,18 @@ class LegacySwap(TransformationPass):
 
             # Attempt to find a permutation for this layer
             success_flag, best_circ, best_d, best_layout, trivial_flag \
-                = self.layer_permutation(layer["partition"], layout, qubit_subset)
+                = self.layer_permutation(partition_layer(layer), layout, qubit_subset)
 
             # If this fails, try one gate at a time in this layer
             if not success_flag:
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = [(pair,) for pair in layer]
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
 
                     success_flag, best_circ, best_d, best_layout, trivial_flag \
-                        = self.layer_permutation(serial_layer["partition"], layout, qubit_subset)
+                        = self.layer_permutation(partition_layer(serial_layer), layout,
+                                                 qubit_subset)
 
                     # Give up if we fail again
                     if not success_flag:
@@ -167,14 +158,13 @@ class LegacySwap(TransformationPass):
                     # Update the record of qubit positions for each inner iteration
                     layout = best_layout
                     # Update the QASM
-                    dagcircuit_output.compose_back(
-                        self.swap_mapper_layer_update(j,
-                                                      first_layer,
-                                                      best_layout,
-                                                      best_d,
-                                                      best_circ,
-                                                      serial_layerlist),
-                        identity_wire_map)
+                    self.swap_mapper_layer_update(dagcircuit_output,
+                                                  j,
+                                                  first_layer,
+                                                  best_layout,
+                                                  best_d,
+                                                  best_circ,
+                                                  serial_layerlist)
                     # Update initial layout
                     if first_layer:
                         initial_layout = layout
@@ -185,14 +175,13 @@ class LegacySwap(TransformationPass):
                 layout = best_layout
 
                 # Update the QASM
-                dagcircuit_output.compose_back(
-                    self.swap_mapper_layer_update(i,
-                                                  first_layer,
-                                                  best_layout,
-                                                  best_d,
-                                                  best_circ,
-                                                  layerlist),
-                    identity_wire_map)
+                self.swap_mapper_layer_update(dagcircuit_output,
+                                              i,
+                                              first_layer,
+                                              best_layout,
+                                              best_d,
+                                              best_circ,
+                                              layerlist)
                 # Update initial layout
                 if first_layer:
                     initial_layout = layout
@@ -203,7 +192,7 @@ class LegacySwap(TransformationPass):
         if first_layer:
             layout = initial_layout
             for i, layer in enumerate(layerlist):
-                dagcircuit_output.compose_back(layer["graph"], layout)
+                apply_layer(dagcircuit_output, layer, layout)
 
         return dagcircuit_output
 
@@ -358,23 +347,20 @@ class LegacySwap(TransformationPass):
 
         return True, best_circ, best_d, best_layout, False
 
-    def swap_mapper_layer_update(self, i, first_layer, best_layout, best_d,
-                                 best_circ, layer_list):
-        """Update the QASM string for an iteration of swap_mapper.
+    def swap_mapper_layer_update(self, dagcircuit_output, i, first_layer, best_layout,
+                                 best_d, best_circ, layer_list):
+        """Update the output DAGCircuit for an iteration of swap_mapper.
 
+        dagcircuit_output = the output DAGCircuit
         i = layer number
         first_layer = True if this is the first layer with multi-qubit gates
         best_layout = layout returned from swap algorithm
         best_d = depth returned from swap algorithm
         best_circ = swap circuit returned from swap algorithm
-        layer_list = list of circuit objects for each layer
-
-        Return DAGCircuit object to append to the output DAGCircuit.
+        layer_list = list of layers from DAGCircuit.light_layers()
         """
         layout = best_layout
-        dagcircuit_output = DAGCircuit()
         QR = QuantumRegister(self.coupling_map.size(), 'q')
-        dagcircuit_output.add_qreg(QR)
         # Identity wire-map for composing the circuits
         identity_wire_map = {(QR, j): (QR, j) for j in range(self.coupling_map.size())}
 
@@ -384,7 +370,7 @@ class LegacySwap(TransformationPass):
         if first_layer:
             # Output all layers up to this point
             for j in range(i + 1):
-                dagcircuit_output.compose_back(layer_list[j]["graph"], layout)
+                apply_layer(dagcircuit_output, layer_list[j], layout)
         # Otherwise, we output the current layer and the associated swap gates.
         else:
             # Output any swaps
@@ -392,5 +378,4 @@ class LegacySwap(TransformationPass):
                 dagcircuit_output.compose_back(best_circ, identity_wire_map)
 
             # Output this layer
-            dagcircuit_output.compose_back(layer_list[i]["graph"], layout)
-        return dagcircuit_output
+            apply_layer(dagcircuit_output, layer_list[i], layout)
@@ -47,8 +47,6 @@ https://medium.com/qiskit/improving-a-quantum-compiler-48410d7a7084
 
 """
 
-from copy import deepcopy
-
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
@@ -90,7 +88,7 @@ class LookaheadSwap(TransformationPass):
             compatible with the DAG
         """
         coupling_map = self._coupling_map
-        ordered_virtual_gates = list(dag.serial_layers())
+        ordered_virtual_gates = [layer[0] for layer in dag.light_serial_layers()]
 
         if self.initial_layout is None:
             if self.property_set["layout"]:
@@ -123,7 +121,7 @@ class LookaheadSwap(TransformationPass):
         mapped_dag = _copy_circuit_metadata(dag, coupling_map)
 
         for node in mapped_gates:
-            mapped_dag.apply_operation_back(op=node.op, qargs=node.qargs, cargs=node.cargs)
+            mapped_dag.apply_operation_back(op=node.op.copy(), qargs=node.qargs, cargs=node.cargs)
 
         return mapped_dag
 
@@ -134,7 +132,7 @@ def _search_forward_n_swaps(layout, gates, coupling_map,
 
     Arguments:
         layout (Layout): Map from virtual qubit index to physical qubit index.
-        gates (list): Gates to be mapped.
+        gates (list): Gates to be mapped, as (node, support) pairs.
         coupling_map (CouplingMap): CouplingMap of the target backend.
         depth (int): Number of SWAP layers to search before choosing a result.
         width (int): Number of SWAPs to consider at each layer.
@@ -191,7 +189,7 @@ def _map_free_gates(layout, gates, coupling_map):
 
     Args:
         layout (Layout): Map from virtual qubit index to physical qubit index.
-        gates (list): Gates to be mapped.
+        gates (list): Gates to be mapped, as (node, support) pairs.
         coupling_map (CouplingMap): CouplingMap for target device topology.
 
     Returns:
@@ -207,10 +205,11 @@ def _map_free_gates(layout, gates, coupling_map):
     remaining_gates = []
 
     for gate in gates:
+        node, qubits = gate
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
-        if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+        if not qubits:
+            qubits = node.qargs
 
             if not qubits:
                 continue
@@ -223,8 +222,6 @@ def _map_free_gates(layout, gates, coupling_map):
                 mapped_gates.append(mapped_gate)
             continue
 
-        qubits = gate['partition'][0]
-
         if blocked_qubits.intersection(qubits):
             blocked_qubits.update(qubits)
             remaining_gates.append(gate)
@@ -249,9 +246,12 @@ def _calc_layout_distance(gates, coupling_map, layout, max_gates=None):
     if max_gates is None:
         max_gates = 50 + 10 * len(coupling_map.physical_qubits)
 
-    return sum(coupling_map.distance(*[layout[q] for q in gate['partition'][0]])
-               for gate in gates[:max_gates]
-               if gate['partition'] and len(gate['partition'][0]) == 2)
+    pairs = [[layout[q] for q in gate[1]]
+             for gate in gates[:max_gates]
+             if len(gate[1]) == 2]
+    if not pairs:
+        return 0
+    return coupling_map.distances(*zip(*pairs)).sum()
 
 
 def _score_step(step):
@@ -282,16 +282,13 @@ def _copy_circuit_metadata(source_dag, coupling_map):
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
 
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    node = gate[0]
 
-    # Workaround until #1816, apply mapped to qargs to both DAGNode and op
+    # The op is shared with the input DAG until the mapped gate is output.
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
-    mapped_qargs = [(device_qreg, layout[a]) for a in mapped_op_node.qargs]
-    mapped_op_node.qargs = mapped_op_node.op.qargs = mapped_qargs
-
-    mapped_op_node.pop('name')
+    mapped_qargs = [(device_qreg, layout[a]) for a in node.qargs]
 
-    return mapped_op_node
+    return DAGNode({'op': node.op, 'qargs': mapped_qargs, 'cargs': node.cargs, 'type': 'op'})
 
 
 def _swap_ops_from_edge(edge, layout):
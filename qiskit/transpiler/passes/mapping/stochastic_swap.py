@@ -16,6 +16,7 @@
 A pass implementing the default Qiskit stochastic mapper.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pprint import pformat
 from math import inf
@@ -26,6 +27,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
 from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.passes.mapping.utils import partition_layer, apply_layer
 # pylint: disable=no-name-in-module
 from .cython.stochastic_swap.utils import nlayout_from_layout
 # pylint: disable=no-name-in-module
@@ -50,7 +52,7 @@ class StochasticSwap(TransformationPass):
     """
 
     def __init__(self, coupling_map, initial_layout=None,
-                 trials=20, seed=None):
+                 trials=20, seed=None, num_threads=1):
         """
         Map a DAGCircuit onto a `coupling_map` using swap gates.
 
@@ -74,6 +76,11 @@ class StochasticSwap(TransformationPass):
             initial_layout (Layout): initial layout of qubits in mapping
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            num_threads (int): number of threads running the trials of a
+                layer concurrently. With more than one thread, the random
+                numbers of all the trials of a layer are drawn before they
+                run, so the result for a seed does not depend on the number
+                of threads but can differ from the one with a single thread.
         """
         super().__init__()
         self.coupling_map = coupling_map
@@ -81,8 +88,10 @@ class StochasticSwap(TransformationPass):
         self.input_layout = None
         self.trials = trials
         self.seed = seed
+        self.num_threads = num_threads
         self.qregs = None
         self.rng = None
+        self.executor = None
 
     def run(self, dag):
         """
@@ -120,7 +129,15 @@ class StochasticSwap(TransformationPass):
         self.rng = np.random.RandomState(self.seed)
         logger.debug("StochasticSwap RandomState seeded with seed=%s", self.seed)
 
-        new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
+        if self.num_threads > 1:
+            with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+                self.executor = executor
+                try:
+                    new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
+                finally:
+                    self.executor = None
+        else:
+            new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
         # self.property_set["layout"] = self.initial_layout
         return new_dag
 
@@ -161,12 +178,14 @@ class StochasticSwap(TransformationPass):
         return _layer_permutation(layer_partition, self.initial_layout,
                                   layout, qubit_subset,
                                   coupling, trials,
-                                  self.qregs, self.rng)
+                                  self.qregs, self.rng, self.executor)
 
-    def _layer_update(self, i, first_layer, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+    def _layer_update(self, dagcircuit_output, i, first_layer, best_layout,
+                      best_depth, best_circuit, layer_list):
+        """Append a new mapped layer to the output DAGCircuit.
 
+        dagcircuit_output (DAGCircuit) = the output DAGCircuit that the
+            _mapper method is building
         i (int) = layer number
         first_layer (bool) = True if this is the first layer in the
             circuit with any multi-qubit gates
@@ -174,19 +193,12 @@ class StochasticSwap(TransformationPass):
         best_depth (int) = depth returned from _layer_permutation
         best_circuit (DAGCircuit) = swap circuit returned
             from _layer_permutation
-        layer_list (list) = list of DAGCircuit objects for each layer,
-            output of DAGCircuit layers() method
-
-        Return a DAGCircuit object to append to the output DAGCircuit
-        that the _mapper method is building.
+        layer_list (list) = list of layers, output of DAGCircuit
+            light_layers() or light_serial_layers() methods
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", pformat(layout))
         logger.debug("layer_update: self.initial_layout = %s", pformat(self.initial_layout))
-        dagcircuit_output = DAGCircuit()
-        for register in layout.get_virtual_bits().keys():
-            if register[0] not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(register[0])
 
         # If this is the first layer with multi-qubit gates,
         # output all layers up to this point and ignore any
@@ -194,12 +206,9 @@ class StochasticSwap(TransformationPass):
         if first_layer:
             logger.debug("layer_update: first multi-qubit gate layer")
             # Output all layers up to this point
+            edge_map = layout.combine_into_edge_map(self.initial_layout)
             for j in range(i + 1):
-                # Make qubit edge map and extend by classical bits
-                edge_map = layout.combine_into_edge_map(self.initial_layout)
-                for bit in dagcircuit_output.clbits():
-                    edge_map[bit] = bit
-                dagcircuit_output.compose_back(layer_list[j]["graph"], edge_map)
+                apply_layer(dagcircuit_output, layer_list[j], edge_map)
         # Otherwise, we output the current layer and the associated swap gates.
         else:
             # Output any swaps
@@ -209,14 +218,9 @@ class StochasticSwap(TransformationPass):
                 dagcircuit_output.extend_back(best_circuit)
             else:
                 logger.debug("layer_update: there are no swaps in this layer")
-            # Make qubit edge map and extend by classical bits
-            edge_map = layout.combine_into_edge_map(self.initial_layout)
-            for bit in dagcircuit_output.clbits():
-                edge_map[bit] = bit
             # Output this layer
-            dagcircuit_output.compose_back(layer_list[i]["graph"], edge_map)
-
-        return dagcircuit_output
+            edge_map = layout.combine_into_edge_map(self.initial_layout)
+            apply_layer(dagcircuit_output, layer_list[i], edge_map)
 
     def _mapper(self, circuit_graph, coupling_graph,
                 trials=20):
@@ -243,11 +247,11 @@ class StochasticSwap(TransformationPass):
             TranspilerError: if there was any error during the mapping
                 or with the parameters.
         """
-        # Schedule the input circuit by calling layers()
-        layerlist = list(circuit_graph.layers())
+        # Schedule the input circuit by calling light_layers()
+        layerlist = list(circuit_graph.light_layers())
         logger.debug("schedule:")
         for i, v in enumerate(layerlist):
-            logger.debug("    %d: %s", i, v["partition"])
+            logger.debug("    %d: %s", i, partition_layer(v))
 
         if self.initial_layout is not None:
             qubit_subset = self.initial_layout.get_virtual_bits().keys()
@@ -279,14 +283,6 @@ class StochasticSwap(TransformationPass):
         for creg in circuit_graph.cregs.values():
             dagcircuit_output.add_creg(creg)
 
-        # Make a trivial wire mapping between the subcircuits
-        # returned by _layer_update and the circuit we build
-        identity_wire_map = {}
-        for qubit in circuit_graph.qubits():
-            identity_wire_map[qubit] = qubit
-        for bit in circuit_graph.clbits():
-            identity_wire_map[bit] = bit
-
         first_layer = True  # True until first layer is output
         logger.debug("initial_layout = %s", layout)
 
@@ -295,7 +291,7 @@ class StochasticSwap(TransformationPass):
 
             # Attempt to find a permutation for this layer
             success_flag, best_circuit, best_depth, best_layout, trivial_flag \
-                = self._layer_permutation(layer["partition"], layout,
+                = self._layer_permutation(partition_layer(layer), layout,
                                           qubit_subset, coupling_graph,
                                           trials)
             logger.debug("mapper: layer %d", i)
@@ -306,14 +302,14 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = [(pair,) for pair in layer]
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
 
                     success_flag, best_circuit, best_depth, best_layout, trivial_flag = \
                         self._layer_permutation(
-                            serial_layer["partition"],
+                            partition_layer(serial_layer),
                             layout, qubit_subset,
                             coupling_graph,
                             trials)
@@ -341,14 +337,13 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.extend_back(
-                        self._layer_update(j,
-                                           first_layer,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist),
-                        identity_wire_map)
+                    self._layer_update(dagcircuit_output,
+                                       j,
+                                       first_layer,
+                                       best_layout,
+                                       best_depth,
+                                       best_circuit,
+                                       serial_layerlist)
                     if first_layer:
                         first_layer = False
 
@@ -360,14 +355,13 @@ class StochasticSwap(TransformationPass):
                     self.initial_layout = layout
 
                 # Update the DAG
-                dagcircuit_output.extend_back(
-                    self._layer_update(i,
-                                       first_layer,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist),
-                    identity_wire_map)
+                self._layer_update(dagcircuit_output,
+                                   i,
+                                   first_layer,
+                                   best_layout,
+                                   best_depth,
+                                   best_circuit,
+                                   layerlist)
 
                 if first_layer:
                     first_layer = False
@@ -387,13 +381,13 @@ class StochasticSwap(TransformationPass):
             layout = self.initial_layout
             for i, layer in enumerate(layerlist):
                 edge_map = layout.combine_into_edge_map(self.initial_layout)
-                dagcircuit_output.compose_back(layer["graph"], edge_map)
+                apply_layer(dagcircuit_output, layer, edge_map)
 
         return dagcircuit_output
 
 
 def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
-                       coupling, trials, qregs, rng):
+                       coupling, trials, qregs, rng, executor=None):
     """Find a swap circuit that implements a permutation for this layer.
 
     Args:
@@ -412,6 +406,8 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
         trials (int): Number of attempts the randomized algorithm makes.
         qregs (OrderedDict): Ordered dict of registers from input DAG.
         rng (RandomState): Random number generator.
+        executor (Executor): Executor running the trials concurrently, or
+            None to run them one after the other.
 
     Returns:
         Tuple: success_flag, best_circuit, best_depth, best_layout, trivial_flag
@@ -436,8 +432,8 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
     logger.debug("layer_permutation: gates = %s", pformat(gates))
 
     # Can we already apply the gates? If so, there is no work to do.
-    dist = sum([coupling.distance(layout[g[0]], layout[g[1]])
-                for g in gates])
+    dist = coupling.distances([layout[g[0]] for g in gates],
+                              [layout[g[1]] for g in gates]).sum()
     logger.debug("layer_permutation: distance = %s", dist)
     if dist == len(gates):
         logger.debug("layer_permutation: nothing to do")
@@ -473,14 +469,26 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
             slice_circuit.add_qreg(register[0])
     edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
     cdist = coupling._dist_matrix
-    for trial in range(trials):
+    num_rand = num_qubits * (num_qubits + 1) // 2
+
+    def run_trial(rand, scale=None):
+        if scale is None:
+            scale = np.zeros((num_qubits, num_qubits))
+        return swap_trial(num_qubits, int_layout, int_qubit_subset,
+                          int_gates, cdist2, cdist, edges, scale, rand)
+
+    if executor is None:
+        trial_results = (run_trial(1.0 + rng.normal(0.0, 1.0 / num_qubits, size=num_rand),
+                                   scale)
+                         for _ in range(trials))
+    else:
+        rands = 1.0 + rng.normal(0.0, 1.0 / num_qubits, size=(trials, num_rand))
+        trial_results = executor.map(run_trial, rands)
+
+    for trial, trial_result in enumerate(trial_results):
         logger.debug("layer_permutation: trial %s", trial)
         # This is one Trial --------------------------------------
-        dist, optim_edges, trial_layout, depth_step = swap_trial(num_qubits, int_layout,
-                                                                 int_qubit_subset,
-                                                                 int_gates, cdist2,
-                                                                 cdist, edges, scale,
-                                                                 rng)
+        dist, optim_edges, trial_layout, depth_step = trial_result
 
         logger.debug("layer_permutation: final distance for this trial = %s", dist)
         if dist == len(gates) and depth_step < best_depth:
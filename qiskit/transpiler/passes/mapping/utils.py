@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Utilities shared by the mapping passes."""
+
+
+def partition_layer(layer):
+    """Return the partition of a layer of DAGCircuit.light_layers(), the list
+    of the qubit lists of its gates."""
+    return [list(support) for _, support in layer if support]
+
+
+def apply_layer(dagcircuit_output, layer, wire_map):
+    """Append the op nodes of a layer of DAGCircuit.light_layers() to
+    dagcircuit_output, mapping their wires and conditions with wire_map.
+
+    Wires missing from wire_map are kept as they are.
+    """
+    # pylint: disable=protected-access
+    for node, _ in layer:
+        condition = dagcircuit_output._map_condition(wire_map, node.condition)
+        dagcircuit_output.apply_operation_back(
+            node.op, [wire_map.get(qubit, qubit) for qubit in node.qargs],
+            [wire_map.get(clbit, clbit) for clbit in node.cargs], condition)
@@ -18,8 +18,6 @@ Transpiler pass to optimize chains of single-qubit u1, u2, u3 gates by combining
 a single gate.
 """
 
-from itertools import groupby
-
 import numpy as np
 
 from qiskit.transpiler.exceptions import TranspilerError
@@ -30,18 +28,31 @@ from qiskit.circuit.gate import Gate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.quantum_info.operators.quaternion import quaternion_from_euler
 from qiskit.dagcircuit import DAGCircuit
-from qiskit.circuit import QuantumRegister, Parameter
+from qiskit.circuit import QuantumRegister, ParameterExpression
 
 _CHOP_THRESHOLD = 1e-15
 
 
 class Optimize1qGates(TransformationPass):
     """Simplify runs of single qubit gates in the ["u1", "u2", "u3", "cx", "id"] basis."""
+
+    def __init__(self):
+        super().__init__()
+        # the change mark of the dag when the pass last started on it
+        self._change_mark = None
+
     def run(self, dag):
         """Return a new circuit that has been optimized."""
-        runs = dag.collect_runs(["u1", "u2", "u3", "id"])
+        # The runs on the wires that did not change since the pass last
+        # started were left as they are then, and are left alone again.
+        wires = dag.wires_changed_since(self._change_mark)
+        self._change_mark = dag.change_mark()
+        runs = dag.collect_runs(["u1", "u2", "u3", "id"], wires)
         runs = _split_runs_on_parameters(runs)
         for run in runs:
+            parameterized = any(_is_dagnode_parameterized(node) for node in run)
+            if parameterized and len(run) == 1:
+                continue
             right_name = "u1"
             right_parameters = (0, 0, 0)  # (theta, phi, lambda)
 
@@ -62,8 +73,9 @@ class Optimize1qGates(TransformationPass):
                     left_name = "u1"  # replace id with u1
                     left_parameters = (0, 0, 0)
                 # If there are any sympy objects coming from the gate convert
-                # to numpy.
-                left_parameters = tuple([float(x) for x in left_parameters])
+                # to numpy. Unbound parameters are kept as expressions.
+                left_parameters = tuple([x if isinstance(x, ParameterExpression) else float(x)
+                                         for x in left_parameters])
                 # Compose gates
                 name_tuple = (left_name, right_name)
                 if name_tuple == ("u1", "u1"):
@@ -138,6 +150,10 @@ class Optimize1qGates(TransformationPass):
                 # then these final simplifications will not occur.
                 # TODO After we refactor, we should have separate passes for
                 # exact and approximate rewriting.
+                # 4. The value of expressions of unbound parameters is unknown,
+                # so runs with parameters are not simplified.
+                if parameterized:
+                    continue
 
                 # Y rotation is 0 mod 2*pi, so the gate is a u1
                 if np.mod(right_parameters[0], (2 * np.pi)) == 0 \
@@ -177,6 +193,9 @@ class Optimize1qGates(TransformationPass):
             if right_name == "u3":
                 new_op = U3Gate(*right_parameters)
 
+            if len(run) == 1 and _is_same_gate(run[0], new_op):
+                continue
+
             if right_name != 'nop':
                 new_dag = DAGCircuit()
                 new_dag.add_qreg(run_qarg[0])
@@ -236,20 +255,42 @@ class Optimize1qGates(TransformationPass):
         return out_angles
 
 
-def _split_runs_on_parameters(runs):
-    """Finds runs containing parameterized gates and splits them into sequential
-    runs excluding the parameterized gates.
-    """
+def _is_same_gate(node, op):
+    """Return whether the gate of node is op, with the same float parameters."""
+    return (node.name == op.name
+            and all(isinstance(param, float) for param in node.op.params)
+            and node.op.params == op.params)
 
-    def _is_dagnode_parameterized(node):
-        return any(isinstance(param, Parameter) for param in node.op.params)
 
+def _is_dagnode_parameterized(node):
+    return any(isinstance(param, ParameterExpression) for param in node.op.params)
+
+
+def _split_runs_on_parameters(runs):
+    """Splits runs containing parameterized gates into sequential runs that can
+    be combined without evaluating the parameters.
+
+    Composing u1's with any gate, or a u2 or u3 with a u1, only adds angles, so
+    it also applies to expressions of parameters. Composing u2's and u3's with
+    each other needs numeric angles, so a run with parameterized gates holds at
+    most one u2 or u3.
+    """
     out = []
     for run in runs:
-        groups = groupby(run, _is_dagnode_parameterized)
-
-        for group_is_parameterized, gates in groups:
-            if not group_is_parameterized:
-                out.append(list(gates))
+        group = []
+        group_is_parameterized = False
+        group_rotations = 0
+        for node in run:
+            is_parameterized = group_is_parameterized or _is_dagnode_parameterized(node)
+            rotations = group_rotations + (node.name in ("u2", "u3"))
+            if group and is_parameterized and rotations > 1:
+                out.append(group)
+                group = []
+                is_parameterized = _is_dagnode_parameterized(node)
+                rotations = int(node.name in ("u2", "u3"))
+            group.append(node)
+            group_is_parameterized = is_parameterized
+            group_rotations = rotations
+        out.append(group)
 
     return out
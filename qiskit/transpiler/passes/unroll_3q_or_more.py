@@ -35,6 +35,7 @@ class Unroll3qOrMore(TransformationPass):
         Raises:
             QiskitError: if a 3q+ gate is not decomposable
         """
+        substitutions = []
         for node in dag.threeQ_or_more_gates():
             # TODO: allow choosing other possible decompositions
             rule = node.op.definition
@@ -50,5 +51,6 @@ class Unroll3qOrMore(TransformationPass):
             for inst in rule:
                 decomposition.apply_operation_back(*inst)
             decomposition = self.run(decomposition)  # recursively unroll
-            dag.substitute_node_with_dag(node, decomposition)
+            substitutions.append((node, decomposition))
+        dag.substitute_nodes_with_dags(substitutions)
         return dag
@@ -17,7 +17,14 @@
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.exceptions import QiskitError
-from qiskit.circuit import Parameter
+from qiskit.circuit import ParameterExpression
+from qiskit.circuit.instruction import _rule_key
+
+# The rules of gates unrolled in this process, as dags keyed on the gate, its
+# parameters and the basis. The dags are substituted with copies of their
+# instructions and must not be modified.
+_UNROLL_CACHE = {}
+_UNROLL_CACHE_SIZE = 1000
 
 
 class Unroller(TransformationPass):
@@ -48,6 +55,7 @@ class Unroller(TransformationPass):
             DAGCircuit: output unrolled dag
         """
         # Walk through the DAG and expand each non-basis node
+        substitutions = []
         for node in dag.op_nodes():
             basic_insts = ['measure', 'reset', 'barrier', 'snapshot']
             if node.name in basic_insts:
@@ -58,27 +66,55 @@ class Unroller(TransformationPass):
             if node.name in self.basis:  # If already a base, ignore.
                 continue
 
-            # TODO: allow choosing other possible decompositions
-            try:
-                rule = node.op.definition
-            except TypeError as err:
-                if any(isinstance(p, Parameter) for p in node.op.params):
-                    raise QiskitError('Unrolling gates parameterized by expressions '
-                                      'is currently unsupported.')
-                raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
-
-            if not rule:
-                raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
-                                  "No rule to expand instruction %s." %
-                                  (str(self.basis), node.op.name))
-
-            # hacky way to build a dag on the same register as the rule is defined
-            # TODO: need anonymous rules to address wires by index
-            decomposition = DAGCircuit()
-            decomposition.add_qreg(rule[0][1][0][0])
-            for inst in rule:
-                decomposition.apply_operation_back(*inst)
-
-            unrolled_dag = self.run(decomposition)  # recursively unroll ops
-            dag.substitute_node_with_dag(node, unrolled_dag)
+            substitutions.append((node, self._unrolled_dag(node.op)))
+        dag.substitute_nodes_with_dags(substitutions)
         return dag
+
+    def _unrolled_dag(self, op):
+        """Return the rule of op unrolled to the basis, from ``_UNROLL_CACHE``
+        when it was unrolled before.
+
+        Returns:
+            DAGCircuit: the unrolled rule, on the register it is defined on.
+
+        Raises:
+            QiskitError: if op cannot be unrolled to the basis.
+        """
+        key = _rule_key(op)
+        if key is not None:
+            key += (tuple(self.basis),)
+        try:
+            return _UNROLL_CACHE[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable parameters, such as arrays
+            key = None
+
+        # TODO: allow choosing other possible decompositions
+        try:
+            rule = op.definition
+        except TypeError as err:
+            if any(isinstance(p, ParameterExpression) for p in op.params):
+                raise QiskitError('Unrolling gates parameterized by expressions '
+                                  'is currently unsupported.')
+            raise QiskitError('Error decomposing node {}: {}'.format(op.name, err))
+
+        if not rule:
+            raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
+                              "No rule to expand instruction %s." %
+                              (str(self.basis), op.name))
+
+        # hacky way to build a dag on the same register as the rule is defined
+        # TODO: need anonymous rules to address wires by index
+        decomposition = DAGCircuit()
+        decomposition.add_qreg(rule[0][1][0][0])
+        for inst in rule:
+            decomposition.apply_operation_back(*inst)
+
+        unrolled_dag = self.run(decomposition)  # recursively unroll ops
+        if key is not None:
+            if len(_UNROLL_CACHE) >= _UNROLL_CACHE_SIZE:
+                _UNROLL_CACHE.clear()
+            _UNROLL_CACHE[key] = unrolled_dag
+        return unrolled_dag
@@ -13,6 +13,7 @@
 
 """PassManager class for the transpiler."""
 
+import time
 from functools import partial
 from collections import OrderedDict
 from qiskit.dagcircuit import DAGCircuit
@@ -56,6 +57,16 @@ class PassManager():
         # passes already run that have not been invalidated
         self.valid_passes = set()
 
+        # the callback of the current run, called after each pass, and the
+        # state it is given: the iteration of the running flow controller and
+        # the number of passes run so far
+        self._callback = None
+        self._circuit_name = None
+        self._iteration = 1
+        self._count = 0
+        # the last dag measured for the callback, with its size and depth
+        self._measured = (None, 0, 0)
+
         # pass manager's overriding options for the passes it runs (for debugging)
         self.passmanager_options = {'ignore_requires': ignore_requires,
                                     'ignore_preserves': ignore_preserves,
@@ -127,11 +138,31 @@ class PassManager():
         self.valid_passes = set()
         self.property_set.clear()
 
-    def run(self, circuit):
+    def run(self, circuit, callback=None):
         """Run all the passes on a QuantumCircuit
 
         Args:
             circuit (QuantumCircuit): circuit to transform via all the registered passes
+            callback (callable): function called after every pass that runs, with
+                the keyword arguments:
+
+                * pass_ (BasePass): the pass
+                * dag (DAGCircuit): the DAG after the pass
+                * property_set (PropertySet): the property set after the pass
+                * circuit_name (str): the name of the circuit
+                * time (float): the wall time taken by the pass, in seconds
+                * cpu_time (float): the CPU time taken by the pass, in seconds
+                * size_before, size_after (int): the size of the DAG before and
+                  after the pass
+                * depth_before, depth_after (int): the depth of the DAG before
+                  and after the pass
+                * iteration (int): the iteration of the ``do_while`` loop the
+                  pass runs in, 1 outside loops
+                * count (int): the number of passes run before this one
+                * written (list[str]): the keys of the property set that the
+                  pass set
+
+                ``PassProfiler`` is such a function that collects this data.
 
         Returns:
             QuantumCircuit: Transformed circuit.
@@ -140,10 +171,22 @@ class PassManager():
         dag = circuit_to_dag(circuit)
         del circuit
         self.reset()  # Reset passmanager instance before starting
-
-        for passset in self.working_list:
-            for pass_ in passset:
-                dag = self._do_pass(pass_, dag, passset.options)
+        self._callback = callback
+        self._circuit_name = name
+        self._measured = (None, 0, 0)
+        if callback is not None:
+            self.property_set.track_writes()
+        self._count = 0
+
+        try:
+            for passset in self.working_list:
+                for pass_ in passset:
+                    self._iteration = passset.iteration
+                    dag = self._do_pass(pass_, dag, passset.options)
+        finally:
+            self._callback = None
+            self._measured = (None, 0, 0)
+            self.property_set.track_writes(False)
 
         circuit = dag_to_circuit(dag)
         circuit.name = name
@@ -170,25 +213,70 @@ class PassManager():
 
         # Run the pass itself, if not already run
         if pass_ not in self.valid_passes:
-            if pass_.is_transformation_pass:
-                pass_.property_set = self.fenced_property_set
-                new_dag = pass_.run(dag)
-                if not isinstance(new_dag, DAGCircuit):
-                    raise TranspilerError("Transformation passes should return a transformed dag."
-                                          "The pass %s is returning a %s" % (type(pass_).__name__,
-                                                                             type(new_dag)))
-                dag = new_dag
-            elif pass_.is_analysis_pass:
-                pass_.property_set = self.property_set
-                pass_.run(FencedDAGCircuit(dag))
+            if self._callback is None:
+                dag = self._run_pass(pass_, dag)
             else:
-                raise TranspilerError("I dont know how to handle this type of pass")
+                dag = self._run_pass_with_callback(pass_, dag)
 
             # update the valid_passes property
             self._update_valid_passes(pass_, options['ignore_preserves'])
 
         return dag
 
+    def _run_pass(self, pass_, dag):
+        """Run a pass on the dag.
+
+        Args:
+            pass_ (BasePass): Pass to run.
+            dag (DAGCircuit): The dag on which the pass is ran.
+        Returns:
+            DAGCircuit: The transformed dag in case of a transformation pass.
+            The same input dag in case of an analysis pass.
+        Raises:
+            TranspilerError: If the pass is not a proper pass instance.
+        """
+        if pass_.is_transformation_pass:
+            pass_.property_set = self.fenced_property_set
+            new_dag = pass_.run(dag)
+            if not isinstance(new_dag, DAGCircuit):
+                raise TranspilerError("Transformation passes should return a transformed dag."
+                                      "The pass %s is returning a %s" % (type(pass_).__name__,
+                                                                         type(new_dag)))
+            dag = new_dag
+        elif pass_.is_analysis_pass:
+            pass_.property_set = self.property_set
+            pass_.run(FencedDAGCircuit(dag))
+        else:
+            raise TranspilerError("I dont know how to handle this type of pass")
+        return dag
+
+    def _run_pass_with_callback(self, pass_, dag):
+        """Run a pass on the dag, measuring it for the callback of the run."""
+        # the dag is not changed between passes, so it was measured after
+        # the previous pass if it is the same object
+        measured_dag, size_before, depth_before = self._measured
+        if measured_dag is not dag:
+            size_before, depth_before = dag.size(), dag.depth()
+        self.property_set.written_keys()
+        start, cpu_start = time.perf_counter(), time.process_time()
+
+        new_dag = self._run_pass(pass_, dag)
+
+        elapsed, cpu_elapsed = time.perf_counter() - start, time.process_time() - cpu_start
+        if new_dag is dag and pass_.is_analysis_pass:
+            size_after, depth_after = size_before, depth_before
+        else:
+            size_after, depth_after = new_dag.size(), new_dag.depth()
+        self._measured = (new_dag, size_after, depth_after)
+        written = sorted(self.property_set.written_keys())
+        self._callback(pass_=pass_, dag=new_dag, property_set=self.property_set,
+                       circuit_name=self._circuit_name, time=elapsed, cpu_time=cpu_elapsed,
+                       size_before=size_before, size_after=size_after,
+                       depth_before=depth_before, depth_after=depth_after,
+                       iteration=self._iteration, count=self._count, written=written)
+        self._count += 1
+        return new_dag
+
     def _update_valid_passes(self, pass_, ignore_preserves):
         self.valid_passes.add(pass_)
         if not pass_.is_analysis_pass:  # Analysis passes preserve all
@@ -224,6 +312,11 @@ class FlowController():
         for pass_ in self.passes:
             yield pass_
 
+    @property
+    def iteration(self):
+        """The iteration of the ``do_while`` loop the passes run in, 1 outside loops."""
+        return getattr(self.passes, 'iteration', 1)
+
     def dump_passes(self):
         """
         Fetches the passes added to this flow controller.
@@ -306,10 +399,17 @@ class DoWhileController(FlowController):
                  **partial_controller):
         self.do_while = do_while
         self.max_iteration = options['max_iteration']
+        self._iteration = 1
         super().__init__(passes, options, **partial_controller)
 
+    @property
+    def iteration(self):
+        """The iteration of the loop, from 1."""
+        return self._iteration
+
     def __iter__(self):
-        for _ in range(self.max_iteration):
+        for iteration in range(self.max_iteration):
+            self._iteration = iteration + 1
             for pass_ in self.passes:
                 yield pass_
 
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+A collector of the time and effect of the passes run by a PassManager.
+"""
+
+import json
+from collections import OrderedDict
+
+
+class PassProfiler:
+    """Collects a record for every pass run by ``PassManager.run``.
+
+    A profiler is a callback of ``PassManager.run``, and can be given to
+    ``transpile`` to profile all the circuits it transpiles, also when they
+    are transpiled in parallel::
+
+        profiler = PassProfiler()
+        transpile(circuits, backend, profiler=profiler)
+        print(profiler.to_json())
+
+    Each record is a dict with the keys ``circuit``, ``pass``, ``count``,
+    ``iteration``, ``time``, ``cpu_time``, ``size_before``, ``size_after``,
+    ``depth_before``, ``depth_after`` and ``property_set_keys``.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, pass_, circuit_name, time, cpu_time, size_before, size_after,
+                 depth_before, depth_after, iteration, count, written, **_):
+        # pylint: disable=redefined-outer-name
+        self.records.append({'circuit': circuit_name,
+                             'pass': pass_.name(),
+                             'count': count,
+                             'iteration': iteration,
+                             'time': time,
+                             'cpu_time': cpu_time,
+                             'size_before': size_before,
+                             'size_after': size_after,
+                             'depth_before': depth_before,
+                             'depth_after': depth_after,
+                             'property_set_keys': sorted(written)})
+
+    def add_records(self, records):
+        """Add the records collected by another profiler, e.g. in another process.
+
+        Args:
+            records (list[dict]): the records to add.
+        """
+        self.records.extend(records)
+
+    def clear(self):
+        """Remove all the records."""
+        self.records = []
+
+    def summary(self):
+        """Aggregate the records per pass.
+
+        Returns:
+            OrderedDict: for each pass name, in the order the passes first ran,
+                a dict with the number of ``calls``, the total ``time`` and
+                ``cpu_time``, the ``max_time`` of a call, the total
+                ``size_change`` and ``depth_change``, and the ``max_iteration``.
+        """
+        summary = OrderedDict()
+        for record in self.records:
+            entry = summary.get(record['pass'])
+            if entry is None:
+                entry = summary[record['pass']] = {'calls': 0, 'time': 0., 'cpu_time': 0.,
+                                                   'max_time': 0., 'size_change': 0,
+                                                   'depth_change': 0, 'max_iteration': 1}
+            entry['calls'] += 1
+            entry['time'] += record['time']
+            entry['cpu_time'] += record['cpu_time']
+            entry['max_time'] = max(entry['max_time'], record['time'])
+            entry['size_change'] += record['size_after'] - record['size_before']
+            entry['depth_change'] += record['depth_after'] - record['depth_before']
+            entry['max_iteration'] = max(entry['max_iteration'], record['iteration'])
+        return summary
+
+    def to_dict(self):
+        """Return the records and their summary.
+
+        Returns:
+            dict: with the ``records`` and the ``summary``.
+        """
+        return {'records': list(self.records), 'summary': self.summary()}
+
+    def to_json(self, **kwargs):
+        """Return the records and their summary as a JSON string.
+
+        Args:
+            **kwargs: arguments given to ``json.dumps``.
+
+        Returns:
+            str: the JSON of ``to_dict()``.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
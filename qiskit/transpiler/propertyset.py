@@ -19,5 +19,30 @@ about the current state of the circuit """
 class PropertySet(dict):
     """ A default dictionary-like object """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the keys set since the last call to written_keys(), when tracked
+        self._written = None
+
     def __missing__(self, key):
         return None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if self._written is not None:
+            self._written.add(key)
+
+    def track_writes(self, track=True):
+        """ Start, or stop, recording the keys that are set """
+        self._written = set() if track else None
+
+    def written_keys(self):
+        """ Return the keys set since the last call, and record from scratch.
+
+        Returns:
+            set: the keys set, empty if the writes are not tracked.
+        """
+        if self._written is None:
+            return set()
+        written, self._written = self._written, set()
+        return written
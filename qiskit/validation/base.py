@@ -30,11 +30,13 @@ together by using ``bind_schema``::
         pass
 """
 
+import threading
+from contextlib import contextmanager
 from functools import wraps
 from types import SimpleNamespace, MethodType
 
 from marshmallow import ValidationError
-from marshmallow import Schema, post_dump, post_load
+from marshmallow import Schema, post_dump, post_load, missing
 from marshmallow import fields as _fields
 from marshmallow.utils import is_collection
 
@@ -197,7 +199,7 @@ class _SchemaBinder:
 
         # Append the methods to the Model class.
         model_cls._validate = self._validate
-        model_cls.__init__ = self._validate_after_init(model_cls.__init__)
+        model_cls.__init__ = self._validate_after_init(model_cls.__init__, self._schema_cls)
 
         # Add a Schema that performs minimal validation to the Model.
         model_cls.shallow_schema = self._create_validation_schema(self._schema_cls)
@@ -240,16 +242,23 @@ class _SchemaBinder:
                 ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs)
 
     @staticmethod
-    def _validate_after_init(init_method):
+    def _validate_after_init(init_method, schema_cls):
         """Add validation after instantiation."""
 
         @wraps(init_method)
         def _decorated(self, **kwargs):
-            try:
-                _ = self.shallow_schema.validate(kwargs)
-            except ValidationError as ex:
-                raise ModelValidationError(
-                    ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
+            # The arguments are validated by the schema of the class of the
+            # instance. When the __init__ of a model calls the one of its base
+            # model, they are not validated again against the schema of the
+            # base model, whose fields are a subset of the derived ones.
+            shallow_schema = self.shallow_schema
+            if not _VALIDATION_STATE.skip and (type(shallow_schema) is schema_cls or
+                                               not isinstance(shallow_schema, schema_cls)):
+                try:
+                    _ = shallow_schema.validate(kwargs)
+                except ValidationError as ex:
+                    raise ModelValidationError(
+                        ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
 
             init_method(self, **kwargs)
 
@@ -298,9 +307,94 @@ def bind_schema(schema):
     return _SchemaBinder(schema)
 
 
+class _ValidationState(threading.local):
+    """Per thread switch for skipping the validation of models."""
+    skip = False
+
+
+_VALIDATION_STATE = _ValidationState()
+
+
+@contextmanager
+def skip_validation():
+    """Context manager for building models from trusted data.
+
+    Inside the context, the arguments of the models being instantiated are
+    not validated, and ``from_dict`` builds the models without going through
+    marshmallow. It only affects the current thread. The models can be
+    validated later with ``validate()``::
+
+        with skip_validation():
+            result = Result.from_dict(result_dict)
+    """
+    previous = _VALIDATION_STATE.skip
+    _VALIDATION_STATE.skip = True
+    try:
+        yield
+    finally:
+        _VALIDATION_STATE.skip = previous
+
+
+def _field_loader(field):
+    """Return a function making the value of field from trusted data.
+
+    Returns None for the fields whose data is used as is.
+    """
+    # pylint: disable=cyclic-import
+    from qiskit.validation.fields import Complex, InstructionParameter, DictParameters
+
+    if isinstance(field, _fields.Nested):
+        schema = field.schema
+        if field.many:
+            return lambda value: [_load_unvalidated(schema, item) for item in value]
+        return lambda value: _load_unvalidated(schema, value)
+    if isinstance(field, _fields.List):
+        item_loader = _field_loader(field.container)
+        if item_loader is None:
+            return list
+        return lambda value: [item_loader(item) for item in value]
+    if isinstance(field, _fields.Number):
+        return field.num_type
+    if isinstance(field, Complex):
+        return lambda value: complex(*value)
+    if isinstance(field, (_fields.String, _fields.Boolean, _fields.Raw, _fields.Dict,
+                          InstructionParameter, DictParameters)):
+        return None
+    return field.deserialize
+
+
+def _load_unvalidated(schema, data):
+    """Build the model of schema from the trusted dict data.
+
+    It gives the same model as ``schema.load(data)`` for valid data, without
+    validating the fields. The loaders of the fields are cached in the schema.
+    """
+    if '_unvalidated_loaders' not in schema.__dict__:
+        schema._unvalidated_loaders = {name: _field_loader(field)
+                                       for name, field in schema.fields.items()}
+        schema._unvalidated_defaults = {name: field.missing
+                                        for name, field in schema.fields.items()
+                                        if field.missing is not missing}
+    loaders = schema._unvalidated_loaders
+
+    kwargs = {}
+    for key, value in data.items():
+        loader = loaders.get(key)
+        if loader is not None and value is not None:
+            value = loader(value)
+        kwargs[key] = value
+    for name, default in schema._unvalidated_defaults.items():
+        if name not in kwargs:
+            kwargs[name] = default() if callable(default) else default
+
+    return schema.model_cls(**kwargs)
+
+
 def _base_model_from_kwargs(cls, kwargs):
     """Helper for BaseModel.__reduce__, expanding kwargs."""
-    return cls(**kwargs)
+    # The model was already validated or trusted when it was pickled
+    with skip_validation():
+        return cls(**kwargs)
 
 
 class BaseModel(SimpleNamespace):
@@ -339,12 +433,25 @@ class BaseModel(SimpleNamespace):
         return data
 
     @classmethod
-    def from_dict(cls, dict_):
+    def from_dict(cls, dict_, validate=True):
         """Deserialize a dict of simple types into an instance of this class.
 
         Note that this method requires that the model is bound with
         ``@bind_schema``.
+
+        Args:
+            dict_ (dict): the serialized model.
+            validate (bool): if False, or inside ``skip_validation()``, the
+                dict is trusted and the model is built without validating it,
+                which is much faster for large models.
+
+        Returns:
+            BaseModel: the model.
         """
+        if not validate or _VALIDATION_STATE.skip:
+            with skip_validation():
+                return _load_unvalidated(cls.schema, dict_)
+
         try:
             data, _ = cls.schema.load(dict_)
         except ValidationError as ex:
@@ -357,6 +464,33 @@ class BaseModel(SimpleNamespace):
         """Serialize the model into a Python dict of simple types."""
         return self.to_dict()
 
+    def validate(self):
+        """Validate the model and its nested models against the schema.
+
+        For checking models that were built inside ``skip_validation()`` or
+        with ``from_dict(..., validate=False)``.
+
+        Raises:
+            ModelValidationError: if the model is not valid.
+        """
+        # The types of the attributes are checked first, as serializing the
+        # model for the full validation converts some of them.
+        self._validate_types()
+        self._validate()
+
+    def _validate_types(self):
+        """Check the types of the attributes of the model and nested models."""
+        try:
+            _ = self.shallow_schema.validate(self.__dict__)
+        except ValidationError as ex:
+            raise ModelValidationError(
+                ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
+
+        for value in self.__dict__.values():
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, BaseModel):
+                    item._validate_types()
+
 
 class ObjSchema(BaseSchema):
     """Generic object schema."""
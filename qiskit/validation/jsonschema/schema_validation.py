@@ -68,7 +68,8 @@ def _get_validator(name, schema=None, check_schema=True,
             `_VALIDATORS` dict.
         schema (dict): JSON schema `dict`. If not provided searches for schema
             in `_SCHEMAS`.
-        check_schema (bool): Verify schema is valid.
+        check_schema (bool): Verify schema is valid. The check is only done
+            when the validator is created, as the validators are cached.
         validator_class (jsonschema.IValidator): jsonschema IValidator instance.
             Default behavior is to determine this from the schema `$schema`
             field.
@@ -93,15 +94,13 @@ def _get_validator(name, schema=None, check_schema=True,
         if validator_class is None:
             validator_class = jsonschema.validators.validator_for(schema)
 
+        if check_schema:
+            validator_class.check_schema(schema)
+
         # Generate and store validator in _VALIDATORS
         _VALIDATORS[name] = validator_class(schema, **validator_kwargs)
 
-    validator = _VALIDATORS[name]
-
-    if check_schema:
-        validator.check_schema(schema)
-
-    return validator
+    return _VALIDATORS[name]
 
 
 def _load_schemas_and_validators():
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Qobj assembly throughput.
+Times assembling random circuits into a qobj, serially and in parallel
+processes, for several numbers of circuits and widths.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a measured circuit of random h, u3, cx and conditional x gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr)
+    for kind in rng.randint(4, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.h(qr[qubits[0]])
+        elif kind == 1:
+            circuit.u3(*rng.uniform(0, 2 * np.pi, 3).tolist(), qr[qubits[0]])
+        elif kind == 2:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+        else:
+            circuit.x(qr[qubits[0]]).c_if(cr, 1)
+    circuit.measure(qr, cr)
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for assembling circuits into a qobj.")
+    parser.add_argument('--n_circuits', type=int, nargs='+', default=[10, 100, 1000],
+                        help='numbers of circuits')
+    parser.add_argument('--n_qubits', type=int, nargs='+', default=[5, 65], help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=100, help='num gates per circuit')
+    args = parser.parse_args()
+
+    print("{:>8} {:>8} {:>20} {:>20}".format('circuits', 'qubits', 'serial (circ / s)',
+                                             'parallel (circ / s)'))
+    for n_qubits in args.n_qubits:
+        for n_circuits in args.n_circuits:
+            circuits = [random_circuit(n_qubits, args.n_gates, seed)
+                        for seed in range(n_circuits)]
+            rates = []
+            for parallel in [False, True]:
+                start = time.time()
+                assemble(circuits, parallel=parallel)
+                rates.append(n_circuits / (time.time() - start))
+            print("{:>8} {:>8} {:>20.1f} {:>20.1f}".format(n_circuits, n_qubits, *rates))
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Gate fusion in the BasicAer statevector simulator.
+Compares the number of full statevector passes and the simulation time
+of random and QFT circuits with and without gate fusion.
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit, BasicAer
+from qiskit.compiler import transpile, assemble
+
+
+def random_circuit(n_qubits, depth, seed):
+    """Return a random circuit of u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr, name='random')
+    for _ in range(depth):
+        for qubit in range(n_qubits):
+            circuit.u3(*rng.uniform(0, 2 * math.pi, 3), qr[qubit])
+        for control in range(rng.randint(2), n_qubits - 1, 2):
+            circuit.cx(qr[control], qr[control + 1])
+    return circuit
+
+
+def qft_circuit(n_qubits):
+    """Return a QFT circuit."""
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr, name='qft')
+    for j in range(n_qubits):
+        circuit.h(qr[j])
+        for k in range(j + 1, n_qubits):
+            circuit.cu1(math.pi / float(2 ** (k - j)), qr[k], qr[j])
+    return circuit
+
+
+def measure(backend, qobj, backend_options):
+    """Return (number of statevector passes, simulation seconds)."""
+    backend._set_options(qobj_config=qobj.config, backend_options=backend_options)
+    experiment = qobj.experiments[0]
+    passes = sum(1 for kind, _, _ in backend._get_compiled_experiment(experiment)
+                 if kind == 'unitary')
+    start = time.time()
+    backend._run_job('fusion', qobj)
+    return passes, time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for gate fusion in the statevector simulator.")
+    parser.add_argument('--n_qubits', type=int, nargs='+', default=[12, 16, 20],
+                        help='num qubits')
+    parser.add_argument('--depth', type=int, default=20, help='depth of random circuits')
+    parser.add_argument('--max_qubit', type=int, nargs='+', default=[2, 3],
+                        help='fusion_max_qubit values to compare')
+    args = parser.parse_args()
+
+    simulator = BasicAer.get_backend('statevector_simulator')
+    print("{:>8} {:>7} {:>9} {:>8} {:>10}".format(
+        'circuit', 'qubits', 'fusion', 'passes', 'time (s)'))
+    for n_qubits in args.n_qubits:
+        for circ in [random_circuit(n_qubits, args.depth, seed=42), qft_circuit(n_qubits)]:
+            qobj = assemble(transpile(circ, simulator))
+            settings = [('off', {})] + [
+                (str(max_qubit), {'fusion_enable': True, 'fusion_max_qubit': max_qubit})
+                for max_qubit in args.max_qubit]
+            for label, options in settings:
+                n_passes, seconds = measure(simulator, qobj, options)
+                print("{:>8} {:>7} {:>9} {:>8} {:>10.3f}".format(
+                    circ.name, n_qubits, label, n_passes, seconds))
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Circuit construction and assembly throughput.
+Times building large circuits of parameterized gates, printing them to
+OpenQASM and assembling them, and reports the memory held by the circuit.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import assemble
+
+
+def build_circuit(n_qubits, n_gates, seed):
+    """Return a circuit of n_gates random u1, u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    angles = rng.uniform(0, 2 * np.pi, (n_gates, 3)).tolist()
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for index, kind in enumerate(rng.randint(3, size=n_gates)):
+        qubit = qr[index % n_qubits]
+        if kind == 0:
+            circuit.u1(angles[index][0], qubit)
+        elif kind == 1:
+            circuit.u3(*angles[index], qubit)
+        else:
+            circuit.cx(qubit, qr[(index + 1) % n_qubits])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for circuit construction and assembly.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, nargs='+', default=[10000, 100000],
+                        help='num gates')
+    args = parser.parse_args()
+
+    print("{:>8} {:>10} {:>10} {:>12} {:>12}".format(
+        'gates', 'build (s)', 'qasm (s)', 'assemble (s)', 'memory (MB)'))
+    for n_gates in args.n_gates:
+        tracemalloc.start()
+        start = time.time()
+        circ = build_circuit(args.n_qubits, n_gates, seed=42)
+        build_time = time.time() - start
+        memory = tracemalloc.get_traced_memory()[0] / 2 ** 20
+        tracemalloc.stop()
+
+        start = time.time()
+        circ.qasm()
+        qasm_time = time.time() - start
+
+        start = time.time()
+        assemble(circ)
+        assemble_time = time.time() - start
+        print("{:>8} {:>10.3f} {:>10.3f} {:>12.3f} {:>12.1f}".format(
+            n_gates, build_time, qasm_time, assemble_time, memory))
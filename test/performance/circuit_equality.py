@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Circuit equality time.
+Times comparing random circuits, and their DAGs, with a copy whose gates on
+different qubits were appended in another order, with == and with their
+fingerprints.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+
+
+def random_circuits(n_qubits, n_gates, seed):
+    """Return a random circuit of u3 and cx gates, and the same circuit with
+    its gates appended layer by layer, from the last qubit of each layer to
+    the first."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for kind in rng.randint(2, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.u3(*rng.uniform(0, 2 * np.pi, 3).tolist(), qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+
+    layered = QuantumCircuit(qr)
+    for layer in circuit_to_dag(circuit).layers():
+        for node in sorted(layer['graph'].op_nodes(), key=lambda node: node.qargs[0][1],
+                           reverse=True):
+            layered.append(node.op, node.qargs, node.cargs)
+    return circuit, layered
+
+
+def timed(function, pairs):
+    """Return the seconds taken to call function on every pair."""
+    start = time.time()
+    for first, second in pairs:
+        function(first, second)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for comparing circuits.")
+    parser.add_argument('--n_circuits', type=int, default=5, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=2000, help='num gates per circuit')
+    args = parser.parse_args()
+
+    circuit_pairs = [random_circuits(args.n_qubits, args.n_gates, seed)
+                     for seed in range(args.n_circuits)]
+    dag_pairs = [(circuit_to_dag(first), circuit_to_dag(second))
+                 for first, second in circuit_pairs]
+
+    print("{:>28} {:>10}".format('', 'time (s)'))
+    for name, function, pairs in [
+            ('QuantumCircuit ==', lambda first, second: first == second, circuit_pairs),
+            ('DAGCircuit ==', lambda first, second: first == second, dag_pairs),
+            ('QuantumCircuit fingerprint',
+             lambda first, second: first.fingerprint() == second.fingerprint(), circuit_pairs),
+            ('DAGCircuit fingerprint',
+             lambda first, second: first.fingerprint() == second.fingerprint(), dag_pairs)]:
+        print("{:>28} {:>10.3f}".format(name, timed(function, pairs)))
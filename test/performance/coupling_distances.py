@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Coupling map distance time.
+Times building coupling maps of a grid of qubits, as transpile does for
+every circuit, and querying the distances between random pairs of qubits.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit.transpiler import CouplingMap
+
+
+def grid_coupling_list(rows, columns):
+    """Return the coupling list of a grid of qubits."""
+    coupling_list = []
+    for row in range(rows):
+        for column in range(columns):
+            qubit = row * columns + column
+            if column + 1 < columns:
+                coupling_list.append([qubit, qubit + 1])
+            if row + 1 < rows:
+                coupling_list.append([qubit, qubit + columns])
+    return coupling_list
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for coupling map distances.")
+    parser.add_argument('--n_maps', type=int, default=20, help='num coupling maps')
+    parser.add_argument('--size', type=int, default=10, help='grid rows and columns')
+    parser.add_argument('--n_queries', type=int, default=10000,
+                        help='num distance queries per coupling map')
+    args = parser.parse_args()
+
+    coupling_list = grid_coupling_list(args.size, args.size)
+    rng = np.random.RandomState(42)
+    pairs = rng.randint(args.size ** 2, size=(args.n_queries, 2)).tolist()
+    start = time.time()
+    for _ in range(args.n_maps):
+        coupling = CouplingMap(coupling_list)
+        for qubit1, qubit2 in pairs:
+            coupling.distance(qubit1, qubit2)
+    elapsed = time.time() - start
+    print("{:>10} {:>10} {:>12}".format('maps', 'qubits', 'time (s)'))
+    print("{:>10} {:>10} {:>12.3f}".format(args.n_maps, args.size ** 2, elapsed))
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+DAG layers time and memory.
+Times listing the layers and the serial layers of a random circuit, with
+the DAGCircuit layers and the light layers, and mapping it onto a 20 qubit
+device with StochasticSwap, with the peak memory allocated by each.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.test.mock import FakeTokyo
+from qiskit.transpiler import CouplingMap, Layout
+from qiskit.transpiler.passes import StochasticSwap
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of 1 qubit gates and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for kind in rng.randint(3, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.h(qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    return circuit
+
+
+def measure(function):
+    """Return the seconds taken by function and the peak memory it allocated, in MB."""
+    tracemalloc.start()
+    start = time.time()
+    function()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for DAG layers and swap mappers.")
+    parser.add_argument('--n_gates', type=int, default=5000, help='num gates')
+    args = parser.parse_args()
+
+    coupling = CouplingMap(FakeTokyo().configuration().coupling_map)
+    dag = circuit_to_dag(random_circuit(coupling.size(), args.n_gates, seed=42))
+    benchmarks = [
+        ('layers', lambda: list(dag.layers())),
+        ('serial_layers', lambda: list(dag.serial_layers())),
+        ('light_layers', lambda: list(dag.light_layers())),
+        ('light_serial_layers', lambda: list(dag.light_serial_layers())),
+        ('StochasticSwap', lambda: StochasticSwap(
+            coupling, Layout.generate_trivial_layout(*dag.qregs.values()), seed=42).run(dag)),
+    ]
+    print("{:>20} {:>10} {:>10}".format('', 'time (s)', 'peak (MB)'))
+    for name, function in benchmarks:
+        print("{:>20} {:>10.3f} {:>10.1f}".format(name, *measure(function)))
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+DAGCircuit build and traversal.
+Compares the array-backed DAGCircuit storage against the networkx
+MultiDiGraph storage it replaced, in time and peak RSS.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import networkx as nx
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister
+from qiskit.dagcircuit import DAGCircuit, DAGNode
+from qiskit.extensions.standard import HGate, CnotGate, U1Gate
+
+
+def random_ops(n_qubits, n_gates, seed):
+    """Return a list of (op, qargs) for a random h/u1/cx circuit."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    ops = []
+    for _ in range(n_gates):
+        kind = rng.randint(3)
+        if kind == 0:
+            ops.append((HGate(), [qr[rng.randint(n_qubits)]]))
+        elif kind == 1:
+            ops.append((U1Gate(0.1), [qr[rng.randint(n_qubits)]]))
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            ops.append((CnotGate(), [qr[int(control)], qr[int(target)]]))
+    return qr, ops
+
+
+def build_dagcircuit(qr, ops):
+    """Build with the DAGCircuit API."""
+    dag = DAGCircuit()
+    dag.add_qreg(qr)
+    dag.add_creg(ClassicalRegister(qr.size, 'c'))
+    for op, qargs in ops:
+        dag.apply_operation_back(op, qargs, [])
+    return dag
+
+
+def traverse_dagcircuit(dag):
+    """Topologically traverse a DAGCircuit."""
+    return sum(1 for _ in dag.topological_op_nodes())
+
+
+def build_networkx(qr, ops):
+    """Build with the networkx MultiDiGraph storage used before."""
+    graph = nx.MultiDiGraph()
+    output_map = {}
+    node_id = 0
+    for wire in qr:
+        node_id += 1
+        inp = DAGNode({'type': 'in', 'name': '%s[%s]' % (wire[0].name, wire[1]),
+                       'wire': wire}, nid=node_id)
+        node_id += 1
+        outp = DAGNode({'type': 'out', 'name': '%s[%s]' % (wire[0].name, wire[1]),
+                        'wire': wire}, nid=node_id)
+        graph.add_edge(inp, outp, name='%s[%s]' % (wire[0].name, wire[1]), wire=wire)
+        output_map[wire] = outp
+    for op, qargs in ops:
+        node_id += 1
+        node = DAGNode({'type': 'op', 'op': op, 'name': op.name, 'qargs': qargs,
+                        'cargs': [], 'condition': None}, nid=node_id)
+        graph.add_node(node)
+        for wire in qargs:
+            pred = list(graph.predecessors(output_map[wire]))[0]
+            name = '%s[%s]' % (wire[0].name, wire[1])
+            graph.add_edge(pred, node, name=name, wire=wire)
+            graph.remove_edge(pred, output_map[wire])
+            graph.add_edge(node, output_map[wire], name=name, wire=wire)
+    return graph
+
+
+def traverse_networkx(graph):
+    """Topologically traverse a networkx graph as DAGCircuit used to."""
+    return sum(1 for node in nx.lexicographical_topological_sort(graph,
+                                                                 key=lambda x: str(x.qargs))
+               if node.type == 'op')
+
+
+def _measure(storage, n_qubits, n_gates, queue):
+    """Run in a child process so each measurement gets its own peak RSS."""
+    qr, ops = random_ops(n_qubits, n_gates, seed=42)
+    build, traverse = {'dagcircuit': (build_dagcircuit, traverse_dagcircuit),
+                       'networkx': (build_networkx, traverse_networkx)}[storage]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.time()
+    graph = build(qr, ops)
+    build_time = time.time() - start
+    start = time.time()
+    traverse(graph)
+    traverse_time = time.time() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((build_time, traverse_time, (rss_after - rss_before) / 1024))
+
+
+def measure(storage, n_qubits, n_gates):
+    """Return (build seconds, traverse seconds, peak RSS increase in MB)."""
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_measure,
+                                      args=(storage, n_qubits, n_gates, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for DAGCircuit construction and traversal.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='num gates')
+    args = parser.parse_args()
+
+    print("{:>8} {:>11} {:>10} {:>10} {:>10}".format(
+        'gates', 'storage', 'build (s)', 'trav. (s)', 'RSS (MB)'))
+    for gates in args.n_gates:
+        for name in ['networkx', 'dagcircuit']:
+            build_t, traverse_t, rss = measure(name, args.n_qubits, gates)
+            print("{:>8} {:>11} {:>10.3f} {:>10.3f} {:>10.1f}".format(
+                gates, name, build_t, traverse_t, rss))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Optimization level 3 transpile time.
+Times transpiling random circuits for a 16 qubit device at optimization
+level 3, one circuit after the other.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.test.mock import FakeRueschlikon
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of 1 qubit gates and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for kind in rng.randint(6, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.h(qr[qubits[0]])
+        elif kind == 1:
+            circuit.rz(rng.uniform(0, 2 * np.pi), qr[qubits[0]])
+        elif kind == 2:
+            circuit.x(qr[qubits[0]])
+        elif kind == 3:
+            circuit.t(qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for transpiling at optimization level 3.")
+    parser.add_argument('--n_circuits', type=int, default=5, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=8, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=300, help='num gates per circuit')
+    args = parser.parse_args()
+
+    config = FakeRueschlikon().configuration()
+    circuits = [random_circuit(args.n_qubits, args.n_gates, seed)
+                for seed in range(args.n_circuits)]
+    start = time.time()
+    for circ in circuits:
+        transpile(circ, basis_gates=config.basis_gates, coupling_map=config.coupling_map,
+                  optimization_level=3, seed_transpiler=42)
+    elapsed = time.time() - start
+    print("{:>10} {:>10} {:>12}".format('circuits', 'gates', 'time (s)'))
+    print("{:>10} {:>10} {:>12.2f}".format(args.n_circuits, args.n_gates, elapsed))
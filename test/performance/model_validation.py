@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Building Qobj and Result models from large dicts.
+Times from_dict with and without validation, and validating the models
+built without it afterwards.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.qobj import QasmQobj
+from qiskit.result import Result
+
+
+def qobj_dict(n_circuits, n_qubits, n_gates, seed):
+    """Return the dict of a qobj of random circuits."""
+    rng = np.random.RandomState(seed)
+    circuits = []
+    for _ in range(n_circuits):
+        qr = QuantumRegister(n_qubits, 'q')
+        cr = ClassicalRegister(n_qubits, 'c')
+        circuit = QuantumCircuit(qr, cr)
+        for kind in rng.randint(2, size=n_gates):
+            qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+            if kind == 0:
+                circuit.u3(*rng.uniform(0, 2 * np.pi, 3).tolist(), qr[qubits[0]])
+            else:
+                circuit.cx(qr[qubits[0]], qr[qubits[1]])
+        circuit.measure(qr, cr)
+        circuits.append(circuit)
+    return assemble(circuits).to_dict()
+
+
+def result_dict(n_experiments, n_qubits, shots, seed):
+    """Return the dict of a result with counts and per-shot memory."""
+    rng = np.random.RandomState(seed)
+    results = []
+    for index in range(n_experiments):
+        memory = [hex(value) for value in rng.randint(2 ** n_qubits, size=shots)]
+        counts = {}
+        for value in memory:
+            counts[value] = counts.get(value, 0) + 1
+        results.append({'shots': shots, 'success': True,
+                        'data': {'counts': counts, 'memory': memory},
+                        'header': {'name': 'circuit%d' % index, 'memory_slots': n_qubits}})
+    return {'backend_name': 'backend', 'backend_version': '1.0.0', 'qobj_id': 'id',
+            'job_id': 'id', 'success': True, 'results': results}
+
+
+def timings(model_cls, data):
+    """Return the times of validated and unvalidated from_dict and of validate()."""
+    start = time.time()
+    model_cls.from_dict(data)
+    validated = time.time() - start
+    start = time.time()
+    model = model_cls.from_dict(data, validate=False)
+    unvalidated = time.time() - start
+    start = time.time()
+    model.validate()
+    return validated, unvalidated, time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for building models with and without validation.")
+    parser.add_argument('--n_experiments', type=int, default=300, help='num experiments')
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=200, help='num gates per circuit')
+    parser.add_argument('--shots', type=int, default=1024, help='num shots per experiment')
+    args = parser.parse_args()
+
+    print("{:>8} {:>16} {:>18} {:>14}".format('model', 'from_dict (s)',
+                                              'unvalidated (s)', 'validate (s)'))
+    payload = qobj_dict(args.n_experiments, args.n_qubits, args.n_gates, seed=42)
+    print("{:>8} {:>16.3f} {:>18.3f} {:>14.3f}".format('qobj', *timings(QasmQobj, payload)))
+    payload = result_dict(args.n_experiments, args.n_qubits, args.shots, seed=42)
+    print("{:>8} {:>16.3f} {:>18.3f} {:>14.3f}".format('result', *timings(Result, payload)))
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Node substitution time.
+Times the passes that replace gates with their rules, on random circuits of
+Toffoli and cu3 gates, and CXDirection on random cx gates of a 16 qubit device.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.test.mock import FakeRueschlikon
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.passes import Unroller, Decompose, Unroll3qOrMore, CXDirection
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of ccx and cu3 gates. The cu3 angles are
+    multiples of pi/4."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for index in range(n_gates):
+        qubits = [qr[qubit] for qubit in rng.choice(n_qubits, 3, replace=False).tolist()]
+        if index % 2:
+            circuit.ccx(*qubits)
+        else:
+            circuit.cu3(*(rng.randint(8, size=3) * np.pi / 4).tolist(), qubits[0], qubits[1])
+    return circuit
+
+
+def random_cx_circuit(coupling_map, n_gates, seed):
+    """Return a random circuit of cx gates along the edges of a coupling map,
+    half of them against the direction of the edge."""
+    rng = np.random.RandomState(seed)
+    edges = coupling_map.get_edges()
+    qr = QuantumRegister(coupling_map.size(), 'q')
+    circuit = QuantumCircuit(qr)
+    for edge in rng.randint(len(edges), size=n_gates).tolist():
+        control, target = edges[edge]
+        if rng.randint(2):
+            control, target = target, control
+        circuit.cx(qr[control], qr[target])
+    return circuit
+
+
+def pass_time(pass_, circuits):
+    """Return the seconds taken to run a pass on the dags of the circuits."""
+    dags = [circuit_to_dag(circuit) for circuit in circuits]
+    start = time.time()
+    for dag in dags:
+        pass_.run(dag)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for passes that substitute nodes.")
+    parser.add_argument('--n_circuits', type=int, default=5, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=8, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=500, help='num gates per circuit')
+    args = parser.parse_args()
+
+    circs = [random_circuit(args.n_qubits, args.n_gates, seed)
+             for seed in range(args.n_circuits)]
+    cmap = CouplingMap(FakeRueschlikon().configuration().coupling_map)
+    cx_circs = [random_cx_circuit(cmap, 10 * args.n_gates, seed)
+                for seed in range(args.n_circuits)]
+
+    print("{:>14} {:>10}".format('pass', 'time (s)'))
+    for pass_name, pass_instance, pass_circs in [
+            ('Unroller', Unroller(['u1', 'u2', 'u3', 'cx']), circs),
+            ('Decompose', Decompose(), circs),
+            ('Unroll3qOrMore', Unroll3qOrMore(), circs),
+            ('CXDirection', CXDirection(cmap), cx_circs)]:
+        print("{:>14} {:>10.3f}".format(pass_name, pass_time(pass_instance, pass_circs)))
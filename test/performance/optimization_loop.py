@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Optimization loop iteration time.
+Times each iteration of the depth fixed point loop of a preset pass manager
+on random circuits, as profiled by a PassProfiler.
+"""
+
+import argparse
+from collections import defaultdict
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.test.mock import FakeRueschlikon
+from qiskit.transpiler import PassProfiler
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of 1 qubit gates and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for kind in rng.randint(7, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.h(qr[qubits[0]])
+        elif kind == 1:
+            circuit.rz(rng.uniform(0, 2 * np.pi), qr[qubits[0]])
+        elif kind == 2:
+            circuit.x(qr[qubits[0]])
+        elif kind == 3:
+            circuit.t(qr[qubits[0]])
+        elif kind == 4:
+            circuit.z(qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the iterations of the optimization loop.")
+    parser.add_argument('--n_circuits', type=int, default=5, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=16, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=2000, help='num gates per circuit')
+    parser.add_argument('--level', type=int, default=2, help='optimization level')
+    args = parser.parse_args()
+
+    config = FakeRueschlikon().configuration()
+    circuits = [random_circuit(args.n_qubits, args.n_gates, seed)
+                for seed in range(args.n_circuits)]
+    profiler = PassProfiler()
+    transpile(circuits, basis_gates=config.basis_gates, coupling_map=config.coupling_map,
+              optimization_level=args.level, seed_transpiler=42, profiler=profiler)
+
+    # Passes run in the loop are the ones run again after its first iteration
+    in_loop = {record['pass'] for record in profiler.records if record['iteration'] > 1}
+    times = defaultdict(float)
+    circuits_per_iteration = defaultdict(set)
+    for record in profiler.records:
+        if record['pass'] in in_loop:
+            times[record['iteration']] += record['time']
+            circuits_per_iteration[record['iteration']].add(record['circuit'])
+
+    print("{:>10} {:>10} {:>12}".format('iteration', 'circuits', 'time (s)'))
+    for iteration in sorted(times):
+        print("{:>10} {:>10} {:>12.3f}".format(
+            iteration, len(circuits_per_iteration[iteration]), times[iteration]))
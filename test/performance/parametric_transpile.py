@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Transpiling parameterized circuits once and binding many times.
+Compares binding each point and transpiling every bound circuit with
+transpiling the parameterized circuit once and binding the transpiled
+template for every point, both followed by assembly.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import ParameterVector
+from qiskit.compiler import transpile, assemble
+
+
+def ryrz_circuit(n_qubits, depth):
+    """Return a RyRz ansatz with controlled-Rz entanglers and its parameters."""
+    theta = ParameterVector('θ', length=(3 * n_qubits - 1) * depth)
+    theta_iter = iter(theta)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr, name='ryrz')
+    for _ in range(depth):
+        for qubit in qr:
+            circuit.ry(next(theta_iter), qubit)
+            circuit.rz(next(theta_iter), qubit)
+        for control in range(n_qubits - 1):
+            circuit.crz(next(theta_iter), qr[control], qr[control + 1])
+    circuit.measure(qr, cr)
+    return circuit, list(theta)
+
+
+def bind_then_transpile(circuit, binds, transpile_args):
+    """Bind every point, then transpile and assemble the bound circuits."""
+    bound = [circuit.bind_parameters(values) for values in binds]
+    return assemble(transpile(bound, **transpile_args))
+
+
+def transpile_then_bind(circuit, binds, transpile_args):
+    """Transpile once, then bind the template for every point and assemble."""
+    template = transpile(circuit, **transpile_args)
+    return assemble(template.bind_parameters_batch(binds))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for transpiling parameterized circuits.")
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--depth', type=int, default=4, help='ansatz depth')
+    parser.add_argument('--n_binds', type=int, nargs='+', default=[1, 10, 100],
+                        help='numbers of parameter assignments')
+    parser.add_argument('--optimization_level', type=int, default=1)
+    args = parser.parse_args()
+
+    ansatz, parameters = ryrz_circuit(args.n_qubits, args.depth)
+    coupling_map = [[i, i + 1] for i in range(args.n_qubits - 1)]
+    transpile_kwargs = {'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                        'coupling_map': coupling_map,
+                        'optimization_level': args.optimization_level,
+                        'seed_transpiler': 42}
+    rng = np.random.RandomState(42)
+
+    print("{:>8} {:>20} {:>20}".format('binds', 'bind+transpile (s)', 'transpile+bind (s)'))
+    for n_binds in args.n_binds:
+        points = [dict(zip(parameters, rng.uniform(0, 2 * np.pi, len(parameters))))
+                  for _ in range(n_binds)]
+        timings = []
+        for method in [bind_then_transpile, transpile_then_bind]:
+            start = time.time()
+            method(ansatz, points, transpile_kwargs)
+            timings.append(time.time() - start)
+        print("{:>8} {:>20.3f} {:>20.3f}".format(n_binds, *timings))
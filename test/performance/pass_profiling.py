@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Pass profiling overhead and report.
+Times transpiling random circuits with and without a PassProfiler, and
+prints the passes that took the most time.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.test.mock import FakeRueschlikon
+from qiskit.transpiler import PassProfiler
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of 1 qubit gates and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for kind in rng.randint(4, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.h(qr[qubits[0]])
+        elif kind == 1:
+            circuit.rz(rng.uniform(0, 2 * np.pi), qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    return circuit
+
+
+def transpile_time(circuits, config, level, profiler=None):
+    """Return the seconds taken to transpile the circuits."""
+    start = time.time()
+    transpile(circuits, basis_gates=config.basis_gates, coupling_map=config.coupling_map,
+              optimization_level=level, seed_transpiler=42, profiler=profiler)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for profiling the transpiler passes.")
+    parser.add_argument('--n_circuits', type=int, default=5, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=8, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=300, help='num gates per circuit')
+    parser.add_argument('--level', type=int, default=3, help='optimization level')
+    parser.add_argument('--top', type=int, default=5, help='num passes to report')
+    args = parser.parse_args()
+
+    backend_config = FakeRueschlikon().configuration()
+    circs = [random_circuit(args.n_qubits, args.n_gates, seed)
+             for seed in range(args.n_circuits)]
+    pass_profiler = PassProfiler()
+    plain = transpile_time(circs, backend_config, args.level)
+    profiled = transpile_time(circs, backend_config, args.level, pass_profiler)
+    print("{:>10} {:>10} {:>12}".format('circuits', 'plain (s)', 'profiled (s)'))
+    print("{:>10} {:>10.2f} {:>12.2f}".format(args.n_circuits, plain, profiled))
+
+    print("{:>32} {:>6} {:>10} {:>10}".format('pass', 'calls', 'time (s)', 'cpu (s)'))
+    passes = sorted(pass_profiler.summary().items(), key=lambda item: -item[1]['time'])
+    for name, entry in passes[:args.top]:
+        print("{:>32} {:>6} {:>10.3f} {:>10.3f}".format(
+            name, entry['calls'], entry['time'], entry['cpu_time']))
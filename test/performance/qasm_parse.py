@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+OpenQASM parsing throughput.
+Times QuantumCircuit.from_qasm_str on many small programs and on a few
+large ones.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+
+
+def random_qasm(n_qubits, n_gates, seed):
+    """Return the OpenQASM of a random circuit of h, u3 and cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr)
+    for kind in rng.randint(3, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.h(qr[qubits[0]])
+        elif kind == 1:
+            circuit.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    circuit.measure(qr, cr)
+    return circuit.qasm()
+
+
+def throughput(programs):
+    """Return the programs parsed per second."""
+    start = time.time()
+    for program in programs:
+        QuantumCircuit.from_qasm_str(program)
+    return len(programs) / (time.time() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for parsing OpenQASM.")
+    parser.add_argument('--n_small', type=int, default=1000,
+                        help='number of small programs')
+    parser.add_argument('--n_large', type=int, default=5, help='number of large programs')
+    parser.add_argument('--large_gates', type=int, default=5000,
+                        help='num gates of the large programs')
+    args = parser.parse_args()
+
+    small = [random_qasm(3, 10, seed) for seed in range(args.n_small)]
+    large = [random_qasm(20, args.large_gates, seed) for seed in range(args.n_large)]
+
+    print("{:>8} {:>8} {:>16}".format('programs', 'gates', 'programs / s'))
+    print("{:>8} {:>8} {:>16.1f}".format(args.n_small, 10, throughput(small)))
+    print("{:>8} {:>8} {:>16.2f}".format(args.n_large, args.large_gates, throughput(large)))
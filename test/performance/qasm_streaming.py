@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Converting large OpenQASM files to circuits.
+Compares the time and the peak memory of building the whole AST, converting
+it to a DAG and then to a circuit, with the streaming conversion of the
+program read from a string and from a file.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from qiskit import QuantumCircuit
+from qiskit.converters import ast_to_dag, dag_to_circuit
+from qiskit.qasm import Qasm
+
+from qasm_parse import random_qasm
+
+
+def from_ast(path):
+    """Parse the whole file to an AST, then convert it to a DAG and a circuit."""
+    return dag_to_circuit(ast_to_dag(Qasm(filename=path).parse()))
+
+
+def from_str(path):
+    """Read the whole file and convert the string to a circuit."""
+    with open(path) as ifile:
+        return QuantumCircuit.from_qasm_str(ifile.read())
+
+
+def from_file(path):
+    """Convert the file to a circuit, reading it a chunk at a time."""
+    return QuantumCircuit.from_qasm_file(path)
+
+
+def measure(method, path):
+    """Return the time in s and the peak memory in MB of method(path)."""
+    tracemalloc.start()
+    start = time.time()
+    method(path)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for converting OpenQASM to circuits.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, nargs='+', default=[10000, 50000],
+                        help='num gates')
+    args = parser.parse_args()
+
+    print("{:>8} {:>10} {:>10} {:>12}".format('gates', 'method', 'time (s)', 'memory (MB)'))
+    for n_gates in args.n_gates:
+        with tempfile.NamedTemporaryFile('w', suffix='.qasm', delete=False) as qasm_file:
+            qasm_file.write(random_qasm(args.n_qubits, n_gates, seed=42))
+        try:
+            for conversion in [from_ast, from_str, from_file]:
+                print("{:>8} {:>10} {:>10.3f} {:>12.1f}".format(
+                    n_gates, conversion.__name__, *measure(conversion, qasm_file.name)))
+        finally:
+            os.remove(qasm_file.name)
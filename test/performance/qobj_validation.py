@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Qobj schema validation time.
+Times validate_qobj_against_schema on a qobj of many random circuits, the
+first time and again on the same experiments.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.qobj import validate_qobj_against_schema
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of u3 and cx gates, with final measurements."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr)
+    for kind in rng.randint(2, size=n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        if kind == 0:
+            circuit.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubits[0]])
+        else:
+            circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def validation_time(qobj, parallel=False):
+    """Return the seconds taken to validate a qobj."""
+    start = time.time()
+    validate_qobj_against_schema(qobj, parallel=parallel)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for qobj schema validation.")
+    parser.add_argument('--n_circuits', type=int, default=100, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=500, help='num gates per circuit')
+    parser.add_argument('--parallel', action='store_true',
+                        help='validate the experiments in parallel')
+    args = parser.parse_args()
+
+    circuits = [random_circuit(args.n_qubits, args.n_gates, seed)
+                for seed in range(args.n_circuits)]
+    qobj = assemble(circuits)
+
+    print("{:>10} {:>10} {:>12}".format('circuits', 'first (s)', 'again (s)'))
+    print("{:>10} {:>10.3f} {:>12.3f}".format(
+        args.n_circuits, validation_time(qobj, args.parallel),
+        validation_time(qobj, args.parallel)))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Result counts and memory formatting time.
+Times Result.get_counts and Result.get_memory on experiments with all the
+outcomes of their memory slots, the first time and when called again.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit.result import Result
+
+
+def build_result(n_experiments, memory_slots, shots, seed):
+    """Return a result whose experiments have counts of every outcome and
+    the memory of every shot."""
+    rng = np.random.RandomState(seed)
+    half = memory_slots // 2
+    header = {'memory_slots': memory_slots,
+              'creg_sizes': [['c0', half], ['c1', memory_slots - half]]}
+    results = []
+    for index in range(n_experiments):
+        counts = rng.randint(1, 100, size=2 ** memory_slots).tolist()
+        memory = rng.randint(2 ** memory_slots, size=shots).tolist()
+        results.append({
+            'shots': shots, 'success': True, 'meas_level': 2,
+            'header': dict(header, name='experiment_{}'.format(index)),
+            'data': {'counts': {hex(outcome): count for outcome, count in enumerate(counts)},
+                     'memory': [hex(outcome) for outcome in memory]}})
+    return Result.from_dict({'backend_name': 'backend', 'backend_version': '1.0.0',
+                             'qobj_id': 'id', 'job_id': 'id', 'success': True,
+                             'results': results}, validate=False)
+
+
+def timed(function, result):
+    """Return the seconds taken to call function for every experiment."""
+    start = time.time()
+    for index in range(len(result.results)):
+        function(index)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for formatting result counts and memory.")
+    parser.add_argument('--n_experiments', type=int, default=20, help='num experiments')
+    parser.add_argument('--memory_slots', type=int, default=16, help='num memory slots')
+    parser.add_argument('--shots', type=int, default=8192, help='num shots')
+    args = parser.parse_args()
+
+    res = build_result(args.n_experiments, args.memory_slots, args.shots, seed=42)
+    print("{:>12} {:>10} {:>10}".format('', 'first (s)', 'again (s)'))
+    for name, method in [('get_counts', res.get_counts), ('get_memory', res.get_memory)]:
+        print("{:>12} {:>10.3f} {:>10.3f}".format(name, timed(method, res), timed(method, res)))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+StochasticSwap time against the number of threads.
+Times mapping a single random circuit onto a 20 qubit device with the trials
+of each layer run in 1, 2, 4, ... threads.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.test.mock import FakeTokyo
+from qiskit.transpiler import CouplingMap, Layout
+from qiskit.transpiler.passes import StochasticSwap
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Return a random circuit of cx gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False).tolist()
+        circuit.cx(qr[qubits[0]], qr[qubits[1]])
+    return circuit
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for StochasticSwap with threads.")
+    parser.add_argument('--n_gates', type=int, default=500, help='num cx gates')
+    parser.add_argument('--max_threads', type=int, default=4, help='max num threads')
+    args = parser.parse_args()
+
+    coupling = CouplingMap(FakeTokyo().configuration().coupling_map)
+    circ = random_circuit(coupling.size(), args.n_gates, seed=42)
+    dag = circuit_to_dag(circ)
+    print("{:>10} {:>12}".format('threads', 'time (s)'))
+    num_threads = 1
+    while num_threads <= args.max_threads:
+        layout = Layout.generate_trivial_layout(*dag.qregs.values())
+        start = time.time()
+        StochasticSwap(coupling, layout, seed=42, num_threads=num_threads).run(dag)
+        print("{:>10} {:>12.3f}".format(num_threads, time.time() - start))
+        num_threads *= 2
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Unroller and Decompose time.
+Times unrolling to u1, u2, u3 and cx, and decomposing one level, random
+circuits made mostly of Toffoli gates or of cu3 gates.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import Unroller, Decompose
+
+
+def random_circuit(n_qubits, n_gates, gate, seed):
+    """Return a random circuit of ccx or cu3 gates, with a cx gate every
+    tenth gate. The cu3 angles are multiples of pi/4."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    for index in range(n_gates):
+        qubits = [qr[qubit] for qubit in rng.choice(n_qubits, 3, replace=False).tolist()]
+        if index % 10 == 9:
+            circuit.cx(qubits[0], qubits[1])
+        elif gate == 'ccx':
+            circuit.ccx(*qubits)
+        else:
+            circuit.cu3(*(rng.randint(8, size=3) * np.pi / 4).tolist(), qubits[0], qubits[1])
+    return circuit
+
+
+def pass_time(pass_, circuits):
+    """Return the seconds taken to run a pass on the dags of the circuits."""
+    dags = [circuit_to_dag(circuit) for circuit in circuits]
+    start = time.time()
+    for dag in dags:
+        pass_.run(dag)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for unrolling and decomposing gates.")
+    parser.add_argument('--n_circuits', type=int, default=10, help='num circuits')
+    parser.add_argument('--n_qubits', type=int, default=8, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=500, help='num gates per circuit')
+    args = parser.parse_args()
+
+    print("{:>6} {:>10} {:>10}".format('gate', 'pass', 'time (s)'))
+    for name in ['ccx', 'cu3']:
+        circs = [random_circuit(args.n_qubits, args.n_gates, name, seed)
+                 for seed in range(args.n_circuits)]
+        for pass_name, pass_instance in [('Unroller', Unroller(['u1', 'u2', 'u3', 'cx'])),
+                                         ('Decompose', Decompose())]:
+            print("{:>6} {:>10} {:>10.3f}".format(name, pass_name,
+                                                  pass_time(pass_instance, circs)))
@@ -14,7 +14,9 @@
 
 """Test QASM simulator."""
 
+import copy
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 
@@ -60,6 +62,15 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
                   '110 110': shots / 8, '001 001': shots / 8}
         self.assertDictAlmostEqual(counts, target, threshold)
 
+    def test_compiled_experiment_reused(self):
+        """Test running the same qobj again does not compile it again."""
+        self.qobj.config.seed_simulator = self.seed
+        first = self.backend._run_job('first', self.qobj)
+        with patch.object(QasmSimulatorPy, '_compile_experiment',
+                          side_effect=AssertionError('compiled again')):
+            second = self.backend._run_job('second', copy.deepcopy(self.qobj))
+        self.assertEqual(first.get_counts('test'), second.get_counts('test'))
+
     def test_if_statement(self):
         """Test if statements."""
         shots = 100
@@ -160,6 +171,27 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         for mem in memory:
             self.assertIn(mem, ['10 00', '10 11'])
 
+    def test_memory_beyond_64_bits(self):
+        """Test sampled memory wider than a 64-bit integer."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(70, 'cr')
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.measure(qr[0], cr[0])
+        circ.measure(qr[1], cr[69])
+
+        shots = 50
+        job = execute(circ, backend=self.backend, shots=shots, memory=True,
+                      seed_simulator=self.seed)
+        result = job.result()
+        outcomes = ['0' * 70, '1' + '0' * 68 + '1']
+        self.assertEqual(set(result.get_counts()), set(outcomes))
+        self.assertEqual(sum(result.get_counts().values()), shots)
+        self.assertEqual(len(result.get_memory()), shots)
+        for mem in result.get_memory():
+            self.assertIn(mem, outcomes)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,6 +17,8 @@ import unittest
 
 import numpy as np
 
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile, assemble
 from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
@@ -58,6 +60,25 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
         # state is 1/sqrt(2)|00> + 1/sqrt(2)|11>, up to a global phase
         self.assertTrue(success)
 
+    def test_gate_fusion(self):
+        """Test gate fusion does not change the final state vector"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        for layer in range(3):
+            for qubit in range(4):
+                circuit.u3(0.1 * layer, 0.2 * qubit, 0.3, qr[qubit])
+            circuit.cx(qr[layer], qr[layer + 1])
+            circuit.h(qr[3 - layer])
+            circuit.cx(qr[3], qr[0])
+        qobj = assemble(transpile(circuit, self.backend))
+        expected = self.backend.run(qobj).result().get_statevector()
+
+        for max_qubit in [1, 2, 3]:
+            with self.subTest(fusion_max_qubit=max_qubit):
+                backend_options = {'fusion_enable': True, 'fusion_max_qubit': max_qubit}
+                result = self.backend.run(qobj, backend_options=backend_options).result()
+                np.testing.assert_allclose(result.get_statevector(), expected, atol=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -158,6 +158,53 @@ class TestCircuitOperations(QiskitTestCase):
 
         self.assertEqual(qc, qc.copy())
 
+    def test_circuit_equality(self):
+        """Test circuits are equal regardless of the order of gates on different qubits
+        """
+        qr = QuantumRegister(3)
+        cr = ClassicalRegister(3)
+        qc1 = QuantumCircuit(qr, cr)
+        qc1.h(qr[0])
+        qc1.x(qr[1])
+        qc1.cx(qr[0], qr[1])
+        qc1.u3(0.1, 0.2, 0.3, qr[2])
+        qc1.measure(qr, cr)
+        qc2 = QuantumCircuit(qr, cr)
+        qc2.u3(0.1, 0.2, 0.3, qr[2])
+        qc2.measure(qr[2], cr[2])
+        qc2.x(qr[1])
+        qc2.h(qr[0])
+        qc2.cx(qr[0], qr[1])
+        qc2.measure(qr[0], cr[0])
+        qc2.measure(qr[1], cr[1])
+        self.assertEqual(qc1, qc2)
+        self.assertEqual(qc1.fingerprint(), qc2.fingerprint())
+        self.assertEqual(len({qc1.fingerprint(), qc2.fingerprint()}), 1)
+
+        qc2.data[0][0].params[0] = 0.4
+        self.assertNotEqual(qc1, qc2)
+        self.assertNotEqual(qc1.fingerprint(), qc2.fingerprint())
+
+    def test_circuit_equality_custom_gates(self):
+        """Test circuits with composite gates of the same name compare their definitions
+        """
+        qr = QuantumRegister(2)
+        sub1 = QuantumCircuit(qr, name='sub')
+        sub1.cx(qr[0], qr[1])
+        sub2 = QuantumCircuit(qr, name='sub')
+        sub2.cx(qr[1], qr[0])
+        qc1 = QuantumCircuit(qr)
+        qc1.append(sub1.to_instruction(), qr[:])
+        qc2 = QuantumCircuit(qr)
+        qc2.append(sub2.to_instruction(), qr[:])
+        self.assertNotEqual(qc1, qc2)
+        self.assertNotEqual(qc1.fingerprint(), qc2.fingerprint())
+
+        qc2 = QuantumCircuit(qr)
+        qc2.append(sub1.to_instruction(), qr[:])
+        self.assertEqual(qc1, qc2)
+        self.assertEqual(qc1.fingerprint(), qc2.fingerprint())
+
 
 class TestCircuitBuilding(QiskitTestCase):
     """QuantumCircuit tests."""
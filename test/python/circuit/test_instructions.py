@@ -14,8 +14,12 @@
 
 """Test Qiskit's Instruction class."""
 
+import pickle
 import unittest
 
+import numpy
+import sympy
+
 from qiskit.circuit import Gate
 from qiskit.circuit import Parameter
 from qiskit.circuit import Instruction
@@ -70,6 +74,25 @@ class TestInstructions(QiskitTestCase):
         self.assertNotEqual(Instruction('u', 1, 0, [0.3, phi, 0.4]),
                             Instruction('u', 1, 0, [theta, phi, 0.5]))
 
+    def test_numeric_parameters_not_sympy(self):
+        """Test concrete parameters are stored as numbers and symbolic ones as sympy."""
+        instruction = Instruction('u', 1, 0, [1, 0.5, numpy.float64(0.25), 1j,
+                                              sympy.Float(0.125), sympy.pi / 2])
+        self.assertEqual([type(param) for param in instruction.params[:5]],
+                         [int, float, float, complex, float])
+        self.assertEqual(instruction.params[5], sympy.pi / 2)
+        self.assertEqual(pickle.loads(pickle.dumps(instruction)), instruction)
+
+    def test_numeric_parameters_qasm(self):
+        """Test numeric parameters are printed to OpenQASM as sympy numbers."""
+        qr = QuantumRegister(1, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 2, sympy.pi / 2, qr[0])
+        circuit.append(Instruction('u', 1, 0, [1 - 2j]), [qr[0]])
+        self.assertEqual(circuit.qasm().splitlines()[3:],
+                         ['u3(0.100000000000000,2,pi/2) q[0];',
+                          'u(1.0 - 2.0*I) q[0];'])
+
     def circuit_instruction_circuit_roundtrip(self):
         """test converting between circuit and instruction and back
         preserves the circuit"""
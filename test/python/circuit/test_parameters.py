@@ -17,9 +17,10 @@ import numpy
 
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
-from qiskit.circuit import Gate, Parameter, ParameterVector
+from qiskit.circuit import Gate, Parameter, ParameterVector, ParameterExpression
 from qiskit.compiler import transpile
 from qiskit.compiler import assemble
+from qiskit.quantum_info import Operator, process_fidelity
 from qiskit.test import QiskitTestCase
 from qiskit.exceptions import QiskitError
 
@@ -97,6 +98,48 @@ class TestParameters(QiskitTestCase):
         self.assertEqual(pqc.data[0][0].params[0], 2)
         self.assertEqual(pqc.data[1][0].params[1], 2)
 
+    def test_bind_parameters_batch(self):
+        """Test batch binding gives the same circuits as binding one by one."""
+        theta = Parameter('θ')
+        x = Parameter('x')
+        qr = QuantumRegister(2)
+        qc = QuantumCircuit(qr)
+        qc.h(qr[0])
+        qc.rx(theta, qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.u3(0, theta, x, qr[1])
+
+        binds = [{theta: 0.1, x: 0.2}, {theta: 0.3, x: 0.4}]
+        bound = qc.bind_parameters_batch(binds)
+
+        self.assertEqual(len(bound), 2)
+        for bound_qc, bind in zip(bound, binds):
+            self.assertEqual(bound_qc, qc.bind_parameters(bind))
+            self.assertEqual(bound_qc.parameters, set())
+            # Instructions without parameters are shared, the others are not
+            self.assertIs(bound_qc.data[0][0], qc.data[0][0])
+            self.assertIsNot(bound_qc.data[1][0], qc.data[1][0])
+        self.assertEqual(qc.parameters, {theta, x})
+        self.assertEqual(qc.data[3][0].params[1], theta)
+
+    def test_bind_parameters_batch_partial(self):
+        """Test batch binding a subset of the parameters with a dict of values."""
+        theta = Parameter('θ')
+        x = Parameter('x')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr)
+        qc.u3(0, theta, x, qr)
+
+        bound = qc.bind_parameters_batch({theta: numpy.array([1, 2, 3])})
+
+        self.assertEqual([pqc.data[1][0].params[1] for pqc in bound], [1, 2, 3])
+        for pqc in bound:
+            self.assertEqual(pqc.parameters, {x})
+            self.assertEqual(pqc.bind_parameters({x: 5}).data[1][0].params[2], 5)
+        self.assertRaises(QiskitError, qc.bind_parameters_batch, {theta: [1, 2], x: [1]})
+        self.assertRaises(QiskitError, qc.bind_parameters_batch, [{Parameter('y'): 1}])
+
     def test_raise_if_assigning_params_not_in_circuit(self):
         """Verify binding parameters which are not present in the circuit raises an error."""
         x = Parameter('x')
@@ -246,3 +289,110 @@ class TestParameters(QiskitTestCase):
         for vec in paramvecs:
             for param in vec:
                 self.assertIn(param, qc_aer.parameters)
+
+    def test_transpile_once_bind_many(self):
+        """A circuit transpiled with unbound parameters binds to the same circuits
+        as transpiling each bound circuit."""
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+        qr = QuantumRegister(3)
+        qc = QuantumCircuit(qr)
+        qc.h(qr)
+        qc.ry(theta, qr[0])
+        qc.rz(phi, qr[0])
+        qc.crz(theta, qr[0], qr[1])
+        qc.cu3(theta, phi, 0.3, qr[1], qr[2])
+        qc.rx(2 * theta + phi, qr[2])
+        qc.cx(qr[0], qr[2])
+
+        values = {theta: [0.4, 1.2, -0.3], phi: [1.1, 0.0, 2.5]}
+        bound = [qc.bind_parameters({theta: t, phi: p})
+                 for t, p in zip(values[theta], values[phi])]
+        for optimization_level in [0, 1]:
+            with self.subTest(optimization_level=optimization_level):
+                kwargs = {'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                          'coupling_map': [[0, 1], [1, 2]],
+                          'optimization_level': optimization_level,
+                          'seed_transpiler': 42}
+                template = transpile(qc, **kwargs)
+                self.assertEqual(template.parameters, {theta, phi})
+
+                circuits = template.bind_parameters_batch(values)
+                expected = transpile(bound, **kwargs)
+                for circuit, expected_circuit in zip(circuits, expected):
+                    self.assertEqual(circuit.parameters, set())
+                    if optimization_level == 0:
+                        self.assertEqual(circuit, expected_circuit)
+                    self.assertAlmostEqual(
+                        process_fidelity(Operator(circuit), Operator(expected_circuit)), 1)
+
+        qobj = assemble(template, parameter_binds=[{theta: 0.4, phi: 1.1}])
+        self.assertEqual(len(qobj.experiments), 1)
+
+
+class TestParameterExpressions(QiskitTestCase):
+    """Test expressions of Parameters."""
+
+    def test_expressions_of_parameters(self):
+        """Verify arithmetic with parameters gives expressions of them."""
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+
+        expr = 2 * theta - phi / 2 + 1
+        self.assertIsInstance(expr, ParameterExpression)
+        self.assertEqual(expr.parameters, {theta, phi})
+        self.assertEqual(str(-theta), '-θ')
+
+        partially_bound = expr.bind({theta: 0.5})
+        self.assertEqual(partially_bound.parameters, {phi})
+        self.assertEqual(float(partially_bound.bind({phi: 4})), 0.0)
+
+    def test_raise_if_casting_unbound_expression(self):
+        """Verify casting an expression with unbound parameters to float raises."""
+        theta = Parameter('θ')
+        self.assertRaises(TypeError, float, theta + 1)
+        self.assertRaises(QiskitError, (theta + 1).bind, {Parameter('φ'): 1})
+
+    def test_raise_if_combining_parameters_with_same_name(self):
+        """Verify expressions of different parameters with the same name raise."""
+        self.assertRaises(QiskitError, lambda: Parameter('θ') + Parameter('θ'))
+
+    def test_parameter_equality(self):
+        """Verify parameters are equal only to themselves, and expressions to
+        equivalent expressions."""
+        theta = Parameter('θ')
+        self.assertNotEqual(theta, Parameter('θ'))
+        self.assertEqual(theta, theta + 0)
+        self.assertEqual(2 * (theta + 1), 2 * theta + 2)
+        self.assertEqual((theta + 1).bind({theta: 1}), 2)
+
+    def test_bind_expression_in_circuit(self):
+        """Verify parameters in expressions are tracked and bound in circuits."""
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.u3(2 * theta, theta + phi, 0, qr)
+        qc.rz(phi, qr)
+        self.assertEqual(qc.parameters, {theta, phi})
+
+        partial = qc.bind_parameters({theta: 0.5})
+        self.assertEqual(partial.parameters, {phi})
+        self.assertEqual(float(partial.data[0][0].params[0]), 1.0)
+
+        bound = partial.bind_parameters({phi: 0.25})
+        self.assertEqual(bound.parameters, set())
+        self.assertEqual([float(p) for p in bound.data[0][0].params], [1.0, 0.75, 0.0])
+        self.assertEqual(float(bound.data[1][0].params[0]), 0.25)
+
+    def test_substitute_parameter_in_expression(self):
+        """Verify parameters in expressions can be replaced with other parameters."""
+        theta = Parameter('θ')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(2 * theta, qr)
+
+        phi = Parameter('φ')
+        instruction = qc.to_instruction(parameter_map={theta: phi})
+        self.assertEqual(instruction.params, [phi])
+        self.assertEqual(instruction.definition[0][0].params[0].parameters, {phi})
@@ -257,6 +257,51 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertEqual(qobj.experiments[5].instructions[0].params, [1])
         self.assertEqual(qobj.experiments[5].instructions[1].params, [1])
 
+    def test_assemble_circuits_with_same_registers(self):
+        """Verify circuits with the same registers are assembled with their own headers."""
+        qr1 = QuantumRegister(2, 'q1')
+        qr2 = QuantumRegister(3, 'q2')
+        cr = ClassicalRegister(3, 'c')
+        qc1 = QuantumCircuit(qr1, qr2, cr, name='qc1')
+        qc1.cx(qr2[2], qr1[1])
+        qc1.x(qr1[0]).c_if(cr, 5)
+        qc2 = QuantumCircuit(qr1, qr2, cr, name='qc2')
+        qc2.measure(qr2, cr)
+        qc3 = QuantumCircuit(qr2, qr1, cr, name='qc3')
+        qc3.cx(qr2[2], qr1[1])
+
+        qobj = assemble([qc1, qc2, qc3])
+
+        self.assertEqual([expt.header.name for expt in qobj.experiments], ['qc1', 'qc2', 'qc3'])
+        self.assertIsNot(qobj.experiments[0].config, qobj.experiments[1].config)
+        self.assertIsNot(qobj.experiments[0].header.qubit_labels,
+                         qobj.experiments[1].header.qubit_labels)
+        self.assertEqual(qobj.experiments[0].instructions[0].qubits, [4, 1])
+        self.assertEqual(qobj.experiments[0].instructions[1].mask, '0x7')
+        self.assertEqual(qobj.experiments[0].instructions[1].val, '0x5')
+        self.assertEqual([instruction.memory for instruction in qobj.experiments[1].instructions],
+                         [[0], [1], [2]])
+        self.assertEqual(qobj.experiments[2].instructions[0].qubits, [2, 4])
+        self.assertEqual(qobj.experiments[2].header.qubit_labels,
+                         [['q2', 0], ['q2', 1], ['q2', 2], ['q1', 0], ['q1', 1]])
+
+    def test_assemble_circuits_in_parallel(self):
+        """Verify assembling circuits in parallel gives the same qobj."""
+        circuits = []
+        for index in range(4):
+            qr = QuantumRegister(index + 1)
+            cr = ClassicalRegister(index + 1)
+            circuit = QuantumCircuit(qr, cr)
+            circuit.h(qr)
+            circuit.x(qr[0]).c_if(cr, 1)
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+
+        qobj = assemble(circuits, qobj_id='qobj', parallel=True)
+        self.assertEqual(qobj.to_dict(), assemble(circuits, qobj_id='qobj').to_dict())
+        self.assertEqual(qobj.config.n_qubits, 4)
+        self.assertEqual(qobj.config.memory_slots, 4)
+
 
 class TestPulseAssembler(QiskitTestCase):
     """Tests for assembling schedules to qobj."""
@@ -14,6 +14,7 @@
 
 """Compiler Test."""
 
+import math
 import unittest
 
 from qiskit import BasicAer
@@ -189,7 +190,7 @@ class TestCompiler(QiskitTestCase):
 
         self.assertEqual(compiled_instruction.name, 'u2')
         self.assertEqual(compiled_instruction.qubits, [12])
-        self.assertEqual(str(compiled_instruction.params), str([0, 3.14159265358979]))
+        self.assertEqual(compiled_instruction.params, [0, math.pi])
 
     def test_compile_pass_manager(self):
         """Test compile with and without an empty pass manager."""
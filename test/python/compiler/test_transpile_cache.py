@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the transpile cache"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import transpile, TranspileCache
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeMelbourne
+from qiskit.transpiler import PassManager
+
+# The transpile function shadows its module in qiskit.compiler
+transpile_module = sys.modules['qiskit.compiler.transpile']
+transpile_cache_module = sys.modules['qiskit.compiler.transpile_cache']
+
+
+def _bell(name=None, theta=None):
+    qr = QuantumRegister(2, 'q')
+    cr = ClassicalRegister(2, 'c')
+    circuit = QuantumCircuit(qr, cr, name=name)
+    circuit.h(qr[0])
+    if theta is not None:
+        circuit.rz(theta, qr[1])
+    circuit.cx(qr[0], qr[1])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Test the transpile cache."""
+
+    coupling_map = [[0, 1], [1, 2]]
+    basis_gates = ['u1', 'u2', 'u3', 'cx']
+
+    def _transpile(self, circuits, cache, **kwargs):
+        kwargs.setdefault('coupling_map', self.coupling_map)
+        return transpile(circuits, basis_gates=self.basis_gates, seed_transpiler=1,
+                         cache=cache, **kwargs)
+
+    def test_hit_ignores_circuit_name(self):
+        """A circuit differing only in name is served from the cache."""
+        cache = TranspileCache()
+        first = self._transpile(_bell('first'), cache)
+        second = self._transpile(_bell('second'), cache)
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.name, 'second')
+        self.assertEqual(first.name, 'first')
+        self.assertEqual(first, second)
+
+    def test_same_as_uncached(self):
+        """Cached results are the same as transpiling without a cache."""
+        cache = TranspileCache()
+        self._transpile(_bell(), cache)
+        expected = self._transpile(_bell(), None)
+        self.assertEqual(self._transpile(_bell(), cache), expected)
+
+    def test_miss_on_different_target(self):
+        """Changing the coupling map or the optimization level misses."""
+        cache = TranspileCache()
+        self._transpile(_bell(), cache)
+        self._transpile(_bell(), cache, coupling_map=[[1, 0], [1, 2]])
+        self._transpile(_bell(), cache, optimization_level=1)
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+        self.assertEqual(len(cache), 3)
+
+    def test_miss_on_different_circuit(self):
+        """Changing an instruction misses."""
+        cache = TranspileCache()
+        circuit = _bell()
+        self._transpile(circuit, cache)
+        circuit.x(circuit.qregs[0][1])
+        self._transpile(circuit, cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_backend_properties(self):
+        """Circuits transpiled for a backend with properties are cached."""
+        cache = TranspileCache()
+        backend = FakeMelbourne()
+        transpile(_bell(), backend, seed_transpiler=1, cache=cache)
+        transpile([_bell(), _bell()], backend, seed_transpiler=1, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_duplicates_in_batch_transpiled_once(self):
+        """Identical circuits missing in one call are transpiled once and copied."""
+        cache = TranspileCache()
+        theta = Parameter('theta')
+        circuits = [_bell('first', Parameter('theta')), _bell('second', theta), _bell('third')]
+        with mock.patch.object(transpile_module, '_transpile_circuits',
+                               side_effect=transpile_module._transpile_circuits) as batch:
+            result = self._transpile(circuits, cache)
+
+        self.assertEqual(len(batch.call_args[0][0]), 2)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 3, 2))
+        self.assertEqual([circuit.name for circuit in result], ['first', 'second', 'third'])
+        self.assertEqual(result[1].parameters, {theta})
+        self.assertIsNot(result[0].data, result[1].data)
+        self.assertEqual(result[1], self._transpile(_bell(theta=theta), None))
+
+    def test_lru_eviction(self):
+        """The least recently used circuit is evicted."""
+        cache = TranspileCache(maxsize=2)
+        self._transpile(_bell(), cache)
+        self._transpile(_bell(), cache, optimization_level=1)
+        self._transpile(_bell(), cache)
+        self._transpile(_bell(), cache, optimization_level=2)
+        self.assertEqual(len(cache), 2)
+        self._transpile(_bell(), cache)
+        self._transpile(_bell(), cache, optimization_level=1)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_parameters_rebound(self):
+        """A hit uses the parameters of the circuit being transpiled."""
+        cache = TranspileCache()
+        self._transpile(_bell(theta=Parameter('theta')), cache)
+        theta = Parameter('theta')
+        result = self._transpile(_bell(theta=theta), cache)
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(result.parameters, {theta})
+        self.assertEqual(result.bind_parameters({theta: 0.5}).parameters, set())
+
+    def test_pass_manager_not_cached(self):
+        """Transpiling with a custom pass manager bypasses the cache."""
+        cache = TranspileCache()
+        self._transpile(_bell(), cache, pass_manager=PassManager())
+        self._transpile(_bell(), cache, pass_manager=PassManager())
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_disk_store(self):
+        """A new cache on the same directory starts warm."""
+        with tempfile.TemporaryDirectory() as directory:
+            expected = self._transpile(_bell(), TranspileCache(directory=directory))
+
+            cache = TranspileCache(directory=directory)
+            result = self._transpile(_bell(), cache)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+            self.assertEqual(result, expected)
+
+    def test_disk_store_version(self):
+        """Circuits stored by another Qiskit version are not used."""
+        with tempfile.TemporaryDirectory() as directory:
+            self._transpile(_bell(), TranspileCache(directory=directory))
+
+            cache = TranspileCache(directory=directory)
+            with mock.patch.object(transpile_cache_module, '__version__', '0.0.0'):
+                self._transpile(_bell(), cache)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_disk_store_unloadable(self):
+        """Stored circuits that can not be loaded are misses and are replaced."""
+        with tempfile.TemporaryDirectory() as directory:
+            expected = self._transpile(_bell(), TranspileCache(directory=directory))
+            for file_name in os.listdir(directory):
+                with open(os.path.join(directory, file_name), 'wb') as file:
+                    file.write(b'cqiskit.no_such_module\nCircuit\n.')
+
+            cache = TranspileCache(directory=directory)
+            self.assertEqual(self._transpile(_bell(), cache), expected)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+            cache = TranspileCache(directory=directory)
+            self.assertEqual(self._transpile(_bell(), cache), expected)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
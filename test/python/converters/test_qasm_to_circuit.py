@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the streaming OpenQASM converters."""
+
+import unittest
+from unittest.mock import patch
+
+from qiskit.converters import ast_to_dag, dag_to_circuit, qasm_to_circuit, qasm_to_dag
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit import qasm
+from qiskit.qasm.qasm import _statement_chunks
+from qiskit.test import QiskitTestCase, Path
+
+
+class TestQasmToCircuit(QiskitTestCase):
+    """Test OpenQASM to circuit and DAG without building the AST."""
+
+    def setUp(self):
+        self.qasm_files = [self._get_resource_path(name, Path.QASMS)
+                           for name in ['example.qasm', 'example_if.qasm',
+                                        'move_measurements.qasm']]
+
+    def test_qasm_to_circuit(self):
+        """Test the circuit is the one built from the AST."""
+        for qasm_file in self.qasm_files:
+            with self.subTest(qasm_file=qasm_file):
+                expected = dag_to_circuit(ast_to_dag(qasm.Qasm(filename=qasm_file).parse()))
+                self.assertEqual(qasm_to_circuit(qasm.Qasm(filename=qasm_file)), expected)
+                with open(qasm_file) as ifile:
+                    qasm_str = ifile.read()
+                self.assertEqual(qasm_to_circuit(qasm.Qasm(data=qasm_str)), expected)
+
+    def test_qasm_to_dag(self):
+        """Test the DAG is the one built from the AST."""
+        for qasm_file in self.qasm_files:
+            with self.subTest(qasm_file=qasm_file):
+                expected = ast_to_dag(qasm.Qasm(filename=qasm_file).parse())
+                self.assertEqual(qasm_to_dag(qasm.Qasm(filename=qasm_file)), expected)
+
+    def test_instructions_in_program_order(self):
+        """Test the instructions of the circuit are in the order of the program."""
+        circuit = qasm_to_circuit(qasm.Qasm(data='OPENQASM 2.0;\n'
+                                                 'include "qelib1.inc";\n'
+                                                 'qreg q[2];\n'
+                                                 'x q[1];\n'
+                                                 'h q[0];\n'
+                                                 'U(0.1,0,0) q[1];\n'))
+        qr = QuantumRegister(2, 'q')
+        self.assertEqual([(instruction.name, qargs) for instruction, qargs, _ in circuit.data],
+                         [('x', [qr[1]]), ('h', [qr[0]]), ('U', [qr[1]])])
+
+    def test_file_parsed_in_chunks(self):
+        """Test parsing a file a statement at a time gives the same circuit."""
+        qasm_file = self._get_resource_path('example_if.qasm', Path.QASMS)
+        expected = qasm_to_circuit(qasm.Qasm(filename=qasm_file))
+        with patch('qiskit.qasm.qasm._CHUNK_SIZE', 1):
+            self.assertEqual(qasm_to_circuit(qasm.Qasm(filename=qasm_file)), expected)
+
+    def test_statement_chunks(self):
+        """Test chunks end on top-level statements."""
+        lines = ['OPENQASM 2.0;\n',
+                 'gate g a // {\n',
+                 '{\n',
+                 '  x a;\n',
+                 '}\n',
+                 'qreg q[1]; g\n',
+                 '  q[0];\n',
+                 '// the end;\n']
+        self.assertEqual(list(_statement_chunks(lines, 1)),
+                         [('OPENQASM 2.0;\n', 1),
+                          ('gate g a // {\n{\n  x a;\n}\n', 2),
+                          ('qreg q[1]; g\n  q[0];\n', 6)])
+        self.assertEqual(list(_statement_chunks(lines, 1000)), [(''.join(lines), 1)])
+
+    def test_from_qasm_str(self):
+        """Test QuantumCircuit.from_qasm_str does not build the AST."""
+        with patch.object(qasm.Qasm, 'parse') as parse:
+            circuit = QuantumCircuit.from_qasm_str('OPENQASM 2.0;\nqreg q[1];\nU(0,0,0) q[0];\n')
+        parse.assert_not_called()
+        self.assertEqual(len(circuit.data), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
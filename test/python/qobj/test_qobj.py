@@ -17,6 +17,7 @@
 
 import copy
 import uuid
+from unittest import mock
 
 import jsonschema
 
@@ -30,6 +31,7 @@ from qiskit.qobj import (QasmQobj, PulseQobj, QobjHeader,
                          PulseLibraryItem, QasmQobjInstruction,
                          QasmQobjExperiment, QasmQobjConfig)
 from qiskit.qobj import validate_qobj_against_schema
+from qiskit.qobj import utils as qobj_utils
 from qiskit.validation.jsonschema.exceptions import SchemaValidationError
 
 from qiskit.test import QiskitTestCase
@@ -113,6 +115,35 @@ class TestQASMQobj(QiskitTestCase):
             job = basicaerjob.BasicAerJob(backend, job_id, _nop, self.bad_qobj)
             job.submit()
 
+    def test_simjob_skips_validation(self):
+        """Test SimulatorJob does not validate the Qobj when asked not to."""
+        job_id = str(uuid.uuid4())
+        backend = FakeRueschlikon()
+        job = basicaerjob.BasicAerJob(backend, job_id, _nop, self.valid_qobj,
+                                      validate_qobj=False)
+        with mock.patch.object(basicaerjob, 'validate_qobj_against_schema') as validate:
+            job.submit()
+        validate.assert_not_called()
+
+    def test_invalid_experiment_against_schema(self):
+        """Test an invalid experiment fails the validation of the Qobj."""
+        self.valid_qobj.experiments.append(copy.deepcopy(self.valid_qobj.experiments[0]))
+        self.valid_qobj.experiments[1].instructions[0].params = [0.4, 0.2]
+        for parallel in [False, True]:
+            with self.subTest(parallel=parallel):
+                with self.assertRaises(SchemaValidationError):
+                    validate_qobj_against_schema(self.valid_qobj, parallel=parallel)
+
+    def test_validated_experiments_are_not_validated_again(self):
+        """Test identical experiments are validated only once."""
+        self.valid_qobj.experiments[0].instructions[0].params = [0.123456789]
+        self.valid_qobj.experiments.append(copy.deepcopy(self.valid_qobj.experiments[0]))
+        with mock.patch.object(qobj_utils, '_is_valid_experiment',
+                               wraps=qobj_utils._is_valid_experiment) as is_valid:
+            validate_qobj_against_schema(self.valid_qobj)
+            validate_qobj_against_schema(self.valid_qobj)
+        self.assertEqual(is_valid.call_count, 1)
+
     def test_change_qobj_after_compile(self):
         """Test modifying Qobj parameters after compile."""
         qr = QuantumRegister(3)
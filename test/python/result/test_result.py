@@ -14,11 +14,14 @@
 
 """Test Qiskit's Result class."""
 
+from unittest import mock
+
 import numpy as np
 
 from qiskit.result import models
 from qiskit.validation import base
 from qiskit.result import Result
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
@@ -58,6 +61,81 @@ class TestResultOperations(QiskitTestCase):
 
         self.assertEqual(result.get_counts(0), processed_counts)
 
+    def test_counts_empty_registers(self):
+        """Test that counts are separated properly with empty registers."""
+        raw_counts = {'0x0': 4, '0x5': 10}
+        processed_counts = {' 0 00': 4, ' 1 01': 10}
+        data = models.ExperimentResultData(counts=base.Obj(**raw_counts))
+        exp_result_header = base.Obj(creg_sizes=[['c0', 2], ['c1', 1], ['c2', 0]],
+                                     memory_slots=3)
+        exp_result = models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                             data=data, header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        self.assertEqual(result.get_counts(0), processed_counts)
+
+    def test_counts_are_not_formatted_again(self):
+        """Test that the formatted counts are cached, and not shared."""
+        raw_counts = {'0x0': 4, '0x2': 10}
+        data = models.ExperimentResultData(counts=base.Obj(**raw_counts))
+        exp_result_header = base.Obj(creg_sizes=[['c0', 2]], memory_slots=2)
+        exp_result = models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                             data=data, header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        counts = result.get_counts(0)
+        counts['11'] = 1
+        with mock.patch('qiskit.result.postprocess._format_keys') as format_keys:
+            self.assertEqual(result.get_counts(0), {'00': 4, '10': 10})
+        format_keys.assert_not_called()
+
+        exp_result.data = models.ExperimentResultData(counts=base.Obj(**{'0x1': 14}))
+        self.assertEqual(result.get_counts(0), {'01': 14})
+
+        exp_result.data.counts.__dict__['0x3'] = 2
+        self.assertEqual(result.get_counts(0), {'01': 14, '11': 2})
+        exp_result_header.creg_sizes = [['c0', 1], ['c1', 1]]
+        self.assertEqual(result.get_counts(0), {'0 1': 14, '1 1': 2})
+
+    def test_counts_array(self):
+        """Test that counts are extracted properly as arrays."""
+        raw_counts = {'0x5': 4, '0x2': 10}
+        data = models.ExperimentResultData(counts=base.Obj(**raw_counts))
+        exp_result_header = base.Obj(creg_sizes=[['c0', 3]], memory_slots=3)
+        exp_result = models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                             data=data, header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        np.testing.assert_array_equal(result.get_counts_array(0),
+                                      [0, 0, 10, 0, 0, 4, 0, 0])
+        outcomes, counts = result.get_counts_array(0, sparse=True)
+        np.testing.assert_array_equal(outcomes, [2, 5])
+        np.testing.assert_array_equal(counts, [10, 4])
+
+    def test_counts_array_invalid_outcomes(self):
+        """Test that counts arrays reject outcomes wider than the memory slots."""
+        data = models.ExperimentResultData(counts=base.Obj(**{'0x9': 4, '0x2': 10}))
+        exp_result_header = base.Obj(creg_sizes=[['c0', 3]], memory_slots=3)
+        exp_result = models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                             data=data, header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        self.assertRaises(QiskitError, result.get_counts_array, 0)
+        self.assertRaises(QiskitError, result.get_counts_array, 0, sparse=True)
+
+    def test_counts_array_wide_registers(self):
+        """Test that counts of wide registers are only returned as sparse arrays."""
+        data = models.ExperimentResultData(counts=base.Obj(**{hex(1 << 60): 4, '0x2': 10}))
+        exp_result_header = base.Obj(creg_sizes=[['c0', 64]], memory_slots=64)
+        exp_result = models.ExperimentResult(shots=14, success=True, meas_level=2,
+                                             data=data, header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        self.assertRaises(QiskitError, result.get_counts_array, 0)
+        outcomes, counts = result.get_counts_array(0, sparse=True)
+        np.testing.assert_array_equal(outcomes, [2, 1 << 60])
+        np.testing.assert_array_equal(counts, [10, 4])
+
     def test_memory_counts_no_header(self):
         """Test that memory bitstrings are extracted properly without header."""
         raw_memory = ['0x0', '0x0', '0x2', '0x2', '0x2', '0x2', '0x2']
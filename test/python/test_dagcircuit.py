@@ -15,6 +15,7 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
 
 from qiskit.dagcircuit import DAGCircuit
@@ -287,6 +288,49 @@ class TestDagOperations(QiskitTestCase):
                     ('h', [(QuantumRegister(3, 'qr'), 2)])]
         self.assertEqual(expected, [(i.name, i.qargs) for i in named_nodes])
 
+    def test_topological_nodes_after_changes(self):
+        """The topological order is kept valid as the DAG is modified after a traversal."""
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        h_node = self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        list(self.dag.topological_nodes())
+
+        self.dag.apply_operation_back(CnotGate(), [self.qubit2, self.qubit1], [])
+        self.dag.remove_op_node(h_node)
+        self.dag.apply_operation_back(XGate(), [self.qubit1], [])
+
+        expected = [('cx', [self.qubit0, self.qubit1]),
+                    ('cx', [self.qubit2, self.qubit1]),
+                    ('x', [self.qubit1])]
+        self.assertEqual(expected,
+                         [(i.name, i.qargs) for i in self.dag.topological_op_nodes()])
+
+        nodes = list(self.dag.topological_nodes())
+        self.assertEqual(len(nodes), len(list(self.dag.nodes())))
+        position = {node: index for index, node in enumerate(nodes)}
+        for source, dest, _ in self.dag.edges():
+            self.assertLess(position[source], position[dest])
+
+    def test_topological_nodes_after_substitution(self):
+        """A substituted node is replaced in place in the topological order."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        cx_node = self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        self.dag.apply_operation_back(XGate(), [self.qubit1], [])
+        list(self.dag.topological_nodes())
+
+        replacement = DAGCircuit()
+        v = QuantumRegister(2, "v")
+        replacement.add_qreg(v)
+        replacement.apply_operation_back(HGate(), [v[1]], [])
+        replacement.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+        self.dag.substitute_node_with_dag(cx_node, replacement, wires=[v[1], v[0]])
+
+        expected = [('h', [self.qubit0]),
+                    ('h', [self.qubit0]),
+                    ('cx', [self.qubit0, self.qubit1]),
+                    ('x', [self.qubit1])]
+        self.assertEqual(expected,
+                         [(i.name, i.qargs) for i in self.dag.topological_op_nodes()])
+
     def test_dag_nodes_on_wire(self):
         """Test that listing the gates on a qubit/classical bit gets the correct gates"""
         self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
@@ -354,6 +398,22 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(expected,
                          [(i.name, i.qargs) for i in self.dag.topological_op_nodes()])
 
+    def test_remove_op_node_rewires_edges(self):
+        """Removing a node connects its predecessors to its successors wire by wire."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        cx_node = self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1])
+        self.dag.apply_operation_back(XGate(), [self.qubit1])
+        self.dag.remove_op_node(cx_node)
+
+        self.assertEqual(len(list(self.dag.edges())), 7)
+        h_node = self.dag.named_nodes('h')[0]
+        x_node = self.dag.named_nodes('x')[0]
+        self.assertEqual(list(self.dag.successors(h_node)),
+                         [self.dag.output_map[self.qubit0]])
+        self.assertEqual(list(self.dag.predecessors(x_node)),
+                         [self.dag.input_map[self.qubit1]])
+        self.assertEqual(self.dag.depth(), 1)
+
     def test_remove_non_op_node(self):
         """Try to remove a non-op node with remove_op_node method."""
         self.dag.apply_operation_back(HGate(), [self.qubit0])
@@ -361,6 +421,41 @@ class TestDagOperations(QiskitTestCase):
         in_node = next(self.dag.topological_nodes())
         self.assertRaises(DAGCircuitError, self.dag.remove_op_node, in_node)
 
+    def test_wires_changed_since(self):
+        """The wires changed since a mark are the ones with ops added, removed or substituted."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        cx_node = self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1])
+        x_node = self.dag.apply_operation_back(XGate(), [self.qubit2])
+        self.assertEqual(self.dag.wires_changed_since(None), self.dag.wires)
+
+        mark = self.dag.change_mark()
+        self.assertEqual(self.dag.wires_changed_since(mark), [])
+        self.assertEqual(self.dag.depth(), 2)
+
+        self.dag.remove_op_node(cx_node)
+        self.assertEqual(self.dag.wires_changed_since(mark), [self.qubit0, self.qubit1])
+        self.assertEqual(self.dag.depth(), 1)
+
+        mark = self.dag.change_mark()
+        self.dag.apply_operation_back(Measure(), [self.qubit2], [self.clbit0])
+        self.assertEqual(self.dag.wires_changed_since(mark), [self.qubit2, self.clbit0])
+
+        mark = self.dag.change_mark()
+        replacement = DAGCircuit()
+        qreg = QuantumRegister(1, 'q')
+        replacement.add_qreg(qreg)
+        replacement.apply_operation_back(HGate(), [qreg[0]])
+        self.dag.substitute_node_with_dag(x_node, replacement)
+        self.assertEqual(self.dag.wires_changed_since(mark), [self.qubit2])
+
+    def test_wires_changed_since_other_dag(self):
+        """All the wires changed since a mark taken on another DAG."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        mark = self.dag.change_mark()
+
+        self.assertEqual(copy.deepcopy(self.dag).wires_changed_since(mark), self.dag.wires)
+        self.assertEqual(self.dag.wires_changed_since(mark), [])
+
 
 class TestDagLayers(QiskitTestCase):
     """Test finding layers on the dag"""
@@ -400,6 +495,44 @@ class TestDagLayers(QiskitTestCase):
             ['measure', 'measure']
         ], name_layers)
 
+        for layer in layers:
+            layer_dag = layer["graph"]
+            self.assertEqual(layer_dag.depth(), 1)
+            self.assertEqual(len(list(layer_dag.edges())),
+                             len(layer_dag.wires) + sum(len(list(layer_dag.successors(node)))
+                                                        for node in layer_dag.op_nodes()))
+
+    def test_light_layers(self):
+        """The light layers have the op nodes and partitions of layers()."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(2, 'cr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.add_creg(creg)
+        dag.apply_operation_back(HGate(), [qreg[0]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[1], qreg[2]], [])
+        dag.apply_operation_back(Barrier(2), [qreg[0], qreg[1]], [])
+        dag.apply_operation_back(XGate(), [qreg[1]], [], condition=(creg, 1))
+        dag.apply_operation_back(Measure(), [qreg[2]], [creg[0]])
+
+        layers = list(dag.layers())
+        light_layers = list(dag.light_layers())
+        self.assertEqual(len(layers), len(light_layers))
+        for layer, light_layer in zip(layers, light_layers):
+            self.assertEqual(layer["partition"],
+                             [list(support) for _, support in light_layer if support])
+            self.assertEqual(set(node._node_id for node in layer["graph"].op_nodes()),
+                             set(node._node_id for node, _ in light_layer))
+        self.assertEqual((), dict((node.name, support) for node, support in
+                                  light_layers[1])['barrier'])
+
+        serial_layers = list(dag.light_serial_layers())
+        self.assertEqual(['h', 'cx', 'barrier', 'x', 'measure'],
+                         [layer[0][0].name for layer in serial_layers])
+        cx_supports = [support for layer in serial_layers
+                       for node, support in layer if node.name == 'cx']
+        self.assertEqual([((qreg, 1), (qreg, 2))], cx_supports)
+
 
 class TestCircuitProperties(QiskitTestCase):
     """DAGCircuit properties test."""
@@ -525,6 +658,43 @@ class TestDagEquivalence(QiskitTestCase):
 
         self.assertNotEqual(self.dag1, dag2)
 
+    def test_dag_eq_fingerprint(self):
+        """DAG fingerprint: the same for equivalent DAGs and their circuits."""
+        circ2 = QuantumCircuit(QuantumRegister(4, 'qr1'), QuantumRegister(2, 'qr2'))
+        qr1, qr2 = circ2.qregs
+        circ2.u2(0.1, 0.2, qr1[3])
+        circ2.cx(qr1[2], qr1[3])
+        circ2.u2(0.1, 0.2, qr1[3])
+        circ2.h(qr1[0])
+        dag2 = circuit_to_dag(circ2)
+        self.assertNotEqual(self.dag1.fingerprint(), dag2.fingerprint())
+
+        circ2.data.pop(0)
+        circ2.h(qr1[2])
+        circ2.t(qr1[2])
+        circ2.ch(qr1[2], qr1[1])
+        circ2.ccx(qr2[0], qr2[1], qr1[0])
+        dag2 = circuit_to_dag(circ2)
+        self.assertEqual(self.dag1.fingerprint(), dag2.fingerprint())
+        self.assertEqual(dag2.fingerprint(), circ2.fingerprint())
+        # DAGs are mutable, so they are not hashable on their fingerprint
+        self.assertRaises(TypeError, hash, dag2)
+
+    def test_dag_eq_condition_and_barrier(self):
+        """DAG equivalence check: conditions, barriers and parameters within
+        tolerance."""
+        cr = ClassicalRegister(1, 'cr')
+        circ1 = QuantumCircuit(self.qr1, cr)
+        circ1.u1(0.1, self.qr1[0]).c_if(cr, 1)
+        circ1.barrier(self.qr1[0], self.qr1[1])
+        circ2 = QuantumCircuit(self.qr1, cr)
+        circ2.u1(0.1 + 1e-12, self.qr1[0]).c_if(cr, 1)
+        circ2.barrier(self.qr1[1], self.qr1[0])
+        self.assertEqual(circuit_to_dag(circ1), circuit_to_dag(circ2))
+
+        circ2.data[0][0].control = (cr, 0)
+        self.assertNotEqual(circuit_to_dag(circ1), circuit_to_dag(circ2))
+
 
 class TestDagSubstitute(QiskitTestCase):
     """Test substituting a dag node with a sub-dag"""
@@ -564,6 +734,76 @@ class TestDagSubstitute(QiskitTestCase):
 
         self.assertEqual(self.dag.count_ops()['h'], 5)
 
+    def test_substitute_nodes_with_dags(self):
+        """The method substitute_nodes_with_dags() replaces nodes like
+        substitute_node_with_dag() does, one by one."""
+        v = QuantumRegister(2, "v")
+        flipped_cx_circuit = DAGCircuit()
+        flipped_cx_circuit.add_qreg(v)
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[1]], [])
+        flipped_cx_circuit.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[1]], [])
+        w = QuantumRegister(1, "w")
+        hxh_circuit = DAGCircuit()
+        hxh_circuit.add_qreg(w)
+        hxh_circuit.apply_operation_back(HGate(), [w[0]], [])
+        hxh_circuit.apply_operation_back(XGate(), [w[0]], [])
+        hxh_circuit.apply_operation_back(HGate(), [w[0]], [])
+
+        self.dag.apply_operation_back(XGate(), [self.qubit2], [], condition=self.condition)
+        expected = copy.deepcopy(self.dag)
+        list(self.dag.topological_nodes())
+        list(expected.topological_nodes())
+
+        self.dag.substitute_nodes_with_dags(
+            [(node, flipped_cx_circuit if node.name == 'cx' else hxh_circuit)
+             for node in self.dag.op_nodes()])
+        for node in expected.op_nodes():
+            replacement = flipped_cx_circuit if node.name == 'cx' else hxh_circuit
+            expected.substitute_node_with_dag(node, copy.deepcopy(replacement))
+
+        self.assertEqual(self.dag, expected)
+        self.assertEqual([(node.name, node.qargs, node.condition)
+                          for node in self.dag.topological_op_nodes()],
+                         [(node.name, node.qargs, node.condition)
+                          for node in expected.topological_op_nodes()])
+        self.assertEqual(len(set(id(node.op) for node in self.dag.op_nodes())), 14)
+        for node in self.dag.op_nodes():
+            self.assertEqual(node.op.control, node.condition)
+
+    def test_substitute_nodes_with_dags_by_name(self):
+        """The method substitute_nodes_with_dags() replaces the nodes of the
+        names of a dict."""
+        w = QuantumRegister(1, "w")
+        hh_circuit = DAGCircuit()
+        hh_circuit.add_qreg(w)
+        hh_circuit.apply_operation_back(HGate(), [w[0]], [])
+        hh_circuit.apply_operation_back(HGate(), [w[0]], [])
+        self.dag.apply_operation_back(XGate(), [self.qubit2], [])
+
+        self.dag.substitute_nodes_with_dags({'x': hh_circuit})
+
+        self.assertEqual(self.dag.count_ops(), {'h': 5, 'cx': 1})
+        self.assertEqual([node.qargs for node in self.dag.topological_op_nodes()],
+                         [[self.qubit0], [self.qubit0, self.qubit1], [self.qubit1],
+                          [self.qubit1], [self.qubit2], [self.qubit2]])
+
+    def test_substitute_nodes_with_dags_wrong_wires(self):
+        """The method substitute_nodes_with_dags() checks the number of wires
+        of all the dags before replacing any node."""
+        w = QuantumRegister(1, "w")
+        h_circuit = DAGCircuit()
+        h_circuit.add_qreg(w)
+        h_circuit.apply_operation_back(HGate(), [w[0]], [])
+        expected = copy.deepcopy(self.dag)
+
+        with self.assertRaises(DAGCircuitError):
+            self.dag.substitute_nodes_with_dags([(node, h_circuit)
+                                                 for node in self.dag.op_nodes()])
+        self.assertEqual(self.dag, expected)
+
     def test_substitute_circuit_one_front(self):
         """The method substitute_node_with_dag() replaces a leaf-in-the-front node with a DAG."""
         pass
@@ -15,9 +15,14 @@
 """Test for the QASM parser"""
 
 import unittest
+from unittest.mock import patch
+
 import ply
+from sympy import Number
 
 from qiskit.qasm import Qasm, QasmError
+from qiskit.qasm.qasmlexer import QasmLexer
+from qiskit.qasm.qasmparser import QasmParser
 from qiskit.qasm.node.node import Node
 from qiskit.test import QiskitTestCase, Path
 
@@ -82,6 +87,39 @@ class TestParser(QiskitTestCase):
         for token in qasm.get_tokens():
             self.assertTrue(isinstance(token, ply.lex.LexToken))
 
+    def test_reuse_parser(self):
+        """Test a parser parses several programs, after a failed one too."""
+        with open(self.qasm_file_path) as file:
+            data = file.read()
+        with open(self.qasm_file_path_fail) as file:
+            data_fail = file.read()
+
+        with QasmParser(None) as parser:
+            expected = parser.parse(data).qasm(15)
+            self.assertRaises(QasmError, parser.parse, data_fail)
+            self.assertEqual(parser.parse(data).qasm(15), expected)
+        self.assertEqual(parse(self.qasm_file_path), expected)
+
+    def test_parse_tables_generated_once(self):
+        """Test new parsers reuse the parse tables instead of generating them."""
+        QasmParser(None)
+        with patch('ply.yacc.yacc') as yacc:
+            res = Qasm(self.qasm_file_path).parse().qasm(15)
+            self.assertFalse(yacc.called)
+        self.assertEqual(len(res), 1563)
+
+    def test_real_literals(self):
+        """Test real literals keep their value, outside the range of doubles too."""
+        literals = ['0.5', '.25e-3', '3.14159265358979', '0e-999', '2.5e-300',
+                    '1e-310', '1e-400', '1e20', '1.5e300', '1e400']
+        lexer = QasmLexer(None)
+        lexer.input(' '.join(literals))
+        for literal in literals:
+            token = lexer.token()
+            self.assertEqual(token.type, 'REAL')
+            self.assertEqual(token.value, Number(literal), literal)
+        self.assertIsNone(lexer.token())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,7 +16,7 @@
 import os
 import time
 
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import parallel_map, close_pool
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
@@ -28,6 +28,18 @@ def _parfunc(x):
     return x
 
 
+def _worker_pid(_):
+    """Function for testing the worker pool is reused
+    """
+    return os.getpid()
+
+
+def _add(x, y, scale=1):
+    """Function for testing shared arguments in parallel_map
+    """
+    return (x + y) * scale
+
+
 def _build_simple(_):
     qreg = QuantumRegister(2)
     creg = ClassicalRegister(2)
@@ -53,3 +65,18 @@ class TestParallel(QiskitTestCase):
         out_circs = parallel_map(_build_simple, list(range(10)))
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
+
+    def test_parallel_shared_args(self):
+        """Verify task_args and task_kwargs are applied to every value"""
+        ans = parallel_map(_add, list(range(10)), task_args=(1,), task_kwargs={'scale': 2},
+                           num_processes=2, chunksize=3)
+        self.assertEqual(ans, [(x + 1) * 2 for x in range(10)])
+
+    def test_parallel_pool_reused(self):
+        """Verify consecutive calls run on the same worker processes"""
+        close_pool()
+        first = set(parallel_map(_worker_pid, list(range(4)), num_processes=2))
+        second = set(parallel_map(_worker_pid, list(range(4)), num_processes=2))
+        self.assertNotIn(os.getpid(), first)
+        self.assertLessEqual(len(first | second), 2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
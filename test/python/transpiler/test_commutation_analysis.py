@@ -16,10 +16,12 @@
 """Commutation analysis and transformation pass testing"""
 
 import unittest
+from unittest import mock
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis
+from qiskit.transpiler.passes import commutation_analysis
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 
@@ -286,6 +288,75 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[9], [13, 16, 19], [10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_commutation_is_cached(self):
+        """Test the commutation of the same gates on other qubits is not computed again"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cy(qr[1], qr[0])
+        circuit.cx(qr[2], qr[3])
+        circuit.cy(qr[3], qr[2])
+        dag = circuit_to_dag(circuit)
+        cx_node, cy_node, other_cx_node, other_cy_node = dag.op_nodes()
+
+        commutation_analysis._COMMUTATION_CACHE.clear()
+        with mock.patch.object(commutation_analysis, '_matrix_commute',
+                               wraps=commutation_analysis._matrix_commute) as matrix_commute:
+            self.assertFalse(commutation_analysis._commute(cx_node, cy_node))
+            self.assertFalse(commutation_analysis._commute(other_cx_node, other_cy_node))
+        self.assertEqual(matrix_commute.call_count, 1)
+
+    def test_commutation_rules(self):
+        """Test the commutation of common gates is decided without matrices"""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.rx(0.5, qr[1])
+        circuit.rz(0.5, qr[0])
+        circuit.cx(qr[0], qr[2])
+        circuit.cx(qr[2], qr[1])
+        circuit.x(qr[0])
+        dag = circuit_to_dag(circuit)
+        cx01, rx1, rz0, cx02, cx21, x0 = dag.op_nodes()
+
+        commutation_analysis._COMMUTATION_CACHE.clear()
+        with mock.patch.object(commutation_analysis, '_matrix_commute') as matrix_commute:
+            self.assertTrue(commutation_analysis._commute(cx01, rx1))
+            self.assertTrue(commutation_analysis._commute(cx01, rz0))
+            self.assertTrue(commutation_analysis._commute(cx01, cx02))
+            self.assertFalse(commutation_analysis._commute(cx02, cx21))
+            self.assertFalse(commutation_analysis._commute(x0, cx01))
+            self.assertTrue(commutation_analysis._commute(x0, rx1))
+        matrix_commute.assert_not_called()
+
+    def test_changed_wires_are_analysed_again(self):
+        """Test a second run only recomputes the changed wires, to the same relations"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.x(qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[2], qr[3])
+        circuit.z(qr[2])
+        circuit.cx(qr[2], qr[3])
+        dag = circuit_to_dag(circuit)
+        self.pass_.run(dag)
+
+        dag.remove_op_node(dag.named_nodes('x')[0])
+        with mock.patch.object(commutation_analysis, '_commute',
+                               wraps=commutation_analysis._commute) as commute:
+            self.pass_.run(dag)
+        self.assertEqual({qubit[1] for call in commute.call_args_list
+                          for node in call[0] if node.type == 'op'
+                          for qubit in node.qargs}, {0, 1})
+
+        fresh_pass = CommutationAnalysis()
+        fresh_pass.property_set = PropertySet()
+        fresh_pass.run(dag)
+        self.assertEqual(dict(self.pset['commutation_set']),
+                         dict(fresh_pass.property_set['commutation_set']))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -112,3 +112,29 @@ class CouplingTest(QiskitTestCase):
         coupling = CouplingMap(coupling_list)
 
         self.assertFalse(coupling.is_symmetric)
+
+    def test_coupling_distances(self):
+        """Test the distances between many pairs of physical qubits at once."""
+        coupling = CouplingMap([[0, 1], [1, 2], [3, 2]])
+        result = coupling.distances([0, 0, 3, 1], [3, 1, 0, 1])
+        self.assertEqual([3, 1, 3, 0], result.tolist())
+        self.assertRaises(CouplingError, coupling.distances, [0, 4], [1, 2])
+
+    def test_shortest_undirected_path(self):
+        """Test the shortest undirected path between two physical qubits."""
+        coupling = CouplingMap([[0, 1], [2, 1], [2, 3], [3, 4]])
+        self.assertEqual([4, 3, 2, 1, 0], coupling.shortest_undirected_path(4, 0))
+        self.assertEqual([2], coupling.shortest_undirected_path(2, 2))
+        coupling.add_physical_qubit(5)
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 5)
+
+    def test_distance_tables_shared(self):
+        """Test that coupling maps with the same edges share their distance tables."""
+        coupling_list = FakeRueschlikon().configuration().coupling_map
+        coupling1 = CouplingMap(coupling_list)
+        coupling2 = CouplingMap(coupling_list)
+        self.assertEqual(coupling1.distance(0, 8), coupling2.distance(0, 8))
+        self.assertIs(coupling1._dist_matrix, coupling2._dist_matrix)
+        coupling2.add_edge(0, 8)
+        self.assertEqual(1, coupling2.distance(0, 8))
+        self.assertNotEqual(1, coupling1.distance(0, 8))
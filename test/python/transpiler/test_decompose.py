@@ -88,3 +88,24 @@ class TestDecompose(QiskitTestCase):
         ref_dag = circuit_to_dag(ref_circuit)
 
         self.assertEqual(after_dag, ref_dag)
+
+    def test_decompose_same_gate_again(self):
+        """Test gates decomposed again get their own instructions.
+        """
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0]).c_if(cr, 1)
+        circuit.h(qr[1])
+        circuit.h(qr[0])
+        dag = circuit_to_dag(circuit)
+        after_dag = Decompose(HGate).run(dag)
+
+        op_nodes = after_dag.op_nodes()
+        self.assertEqual(len(set(id(node.op) for node in op_nodes)), 3)
+
+        ref_circuit = QuantumCircuit(qr, cr)
+        ref_circuit.u2(0, pi, qr[0]).c_if(cr, 1)
+        ref_circuit.u2(0, pi, qr[1])
+        ref_circuit.u2(0, pi, qr[0])
+        self.assertEqual(after_dag, circuit_to_dag(ref_circuit))
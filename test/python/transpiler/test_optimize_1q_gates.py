@@ -26,6 +26,7 @@ from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeRueschlikon
 from qiskit.circuit import Parameter
+from qiskit.extensions.standard import U3Gate
 
 
 class TestOptimize1qGates(QiskitTestCase):
@@ -118,12 +119,14 @@ class TestOptimize1qGates(QiskitTestCase):
         for node in simplified_dag.named_nodes('u1'):
             params.add(node.op.params[0])
 
-        expected_params = {sympy.Number(-3 * np.pi / 2),
-                           sympy.Number(1.0 + 0.55 * np.pi),
-                           sympy.Number(-0.479425538604203),
-                           sympy.Number(0.3 + np.pi + np.pi ** 2)}
+        expected_params = [-3 * np.pi / 2,
+                           1.0 + 0.55 * np.pi,
+                           -0.479425538604203,
+                           0.3 + np.pi + np.pi ** 2]
 
-        self.assertEqual(params, expected_params)
+        self.assertEqual(len(params), len(expected_params))
+        for param, expected_param in zip(sorted(params), sorted(expected_params)):
+            self.assertAlmostEqual(param, expected_param)
 
     def test_ignores_conditional_rotations(self):
         """Conditional rotations should not be considered in the chain.
@@ -176,7 +179,7 @@ class TestOptimize1qGates(QiskitTestCase):
         self.assertEqual(circuit_to_dag(expected), after)
 
     def test_single_parameterized_circuit(self):
-        """Parameters should be treated as opaque gates."""
+        """Parameters are added to u1 angles."""
         qr = QuantumRegister(1)
         qc = QuantumCircuit(qr)
         theta = Parameter('theta')
@@ -189,42 +192,69 @@ class TestOptimize1qGates(QiskitTestCase):
         dag = circuit_to_dag(qc)
 
         expected = QuantumCircuit(qr)
-        expected.u1(0.7, qr)
-        expected.u1(theta, qr)
-        expected.u1(0.3, qr)
+        expected.u1(theta + 1.0, qr)
 
         after = Optimize1qGates().run(dag)
 
         self.assertEqual(circuit_to_dag(expected), after)
 
     def test_parameterized_circuits(self):
-        """Parameters should be treated as opaque gates."""
+        """Runs of u2's and u3's are split around parameterized gates."""
         qr = QuantumRegister(1)
         qc = QuantumCircuit(qr)
         theta = Parameter('theta')
 
         qc.u1(0.3, qr)
-        qc.u1(0.4, qr)
-        qc.u1(theta, qr)
-        qc.u1(0.1, qr)
+        qc.u3(theta, 0.1, 0.2, qr)
         qc.u1(0.2, qr)
+        qc.u2(0.3, 0.4, qr)
         qc.u1(theta, qr)
-        qc.u1(0.3, qr)
-        qc.u1(0.2, qr)
+        qc.u3(0.1, 0.2, 0.3, qr)
+        qc.u3(0.4, 0.5, 0.6, qr)
 
         dag = circuit_to_dag(qc)
 
         expected = QuantumCircuit(qr)
-        expected.u1(0.7, qr)
-        expected.u1(theta, qr)
-        expected.u1(0.3, qr)
-        expected.u1(theta, qr)
-        expected.u1(0.5, qr)
+        expected.u3(theta, 0.3, 0.5, qr)
+        expected.u2(0.3 + theta, 0.4, qr)
+        expected.append(U3Gate(*Optimize1qGates.compose_u3(0.4, 0.5, 0.6, 0.1, 0.2, 0.3)), [qr[0]])
 
         after = Optimize1qGates().run(dag)
 
         self.assertEqual(circuit_to_dag(expected), after)
 
+    def test_only_changed_wires_again(self):
+        """A second run only optimizes the runs on the wires changed since the first.
+
+        qr0:--[U1]-[U1]--[X]--    qr0:--[U1]-------
+        qr1:--[U3]------------    qr1:--[U3]-------
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u1(0.3, qr[0])
+        circuit.u1(0.4, qr[0])
+        circuit.x(qr[0])
+        circuit.u3(0.1, 0.2, 0.3, qr[1])
+        dag = circuit_to_dag(circuit)
+        u3_node = dag.named_nodes('u3')[0]
+
+        pass_ = Optimize1qGates()
+        dag = pass_.run(dag)
+        mark = dag.change_mark()
+        self.assertEqual(dag.named_nodes('u3'), [u3_node])
+
+        dag = pass_.run(dag)
+        self.assertEqual(dag.wires_changed_since(mark), [])
+
+        dag.remove_op_node(dag.named_nodes('x')[0])
+        dag = pass_.run(dag)
+        self.assertEqual(dag.wires_changed_since(mark), [qr[0]])
+
+        expected = QuantumCircuit(qr)
+        expected.u1(0.7, qr[0])
+        expected.u3(0.1, 0.2, 0.3, qr[1])
+        self.assertEqual(circuit_to_dag(expected), dag)
+
 
 if __name__ == '__main__':
     unittest.main()
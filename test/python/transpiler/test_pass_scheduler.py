@@ -16,10 +16,11 @@
 
 """Transpiler testing"""
 
+import json
 import unittest.mock
 
 from qiskit import QuantumRegister, QuantumCircuit
-from qiskit.transpiler import PassManager
+from qiskit.transpiler import PassManager, PassProfiler
 from qiskit.compiler import transpile
 from qiskit.transpiler import TranspilerAccessError, TranspilerError
 from qiskit.transpiler.passmanager import DoWhileController, ConditionalController, \
@@ -686,5 +687,73 @@ class TestPassManagerReuse(SchedulerTestCase):
         self.assertScheduler(self.circuit, self.passmanager, expected)
 
 
+class TestPassManagerCallback(SchedulerTestCase):
+    """ The callback of PassManager.run is called after every pass."""
+
+    def setUp(self):
+        self.passmanager = PassManager()
+        self.circuit = QuantumCircuit(QuantumRegister(1), name='circuit')
+
+    def test_callback_in_loop(self):
+        """ The callback is given the iteration and the property set keys written. """
+        self.passmanager.append(
+            [PassK_check_fixed_point_property(),
+             PassA_TP_NR_NP(),
+             PassF_reduce_dag_property()],
+            do_while=lambda property_set: not property_set['property_fixed_point'])
+        calls = []
+
+        def callback(**kwargs):
+            calls.append(kwargs)
+
+        with self.assertLogs(logger, level='INFO'):
+            self.passmanager.run(self.circuit, callback=callback)
+
+        self.assertEqual(len(calls), 7 * 4)
+        self.assertEqual([call['count'] for call in calls], list(range(28)))
+        self.assertEqual([call['iteration'] for call in calls],
+                         [iteration for iteration in range(1, 8) for _ in range(4)])
+        self.assertEqual([call['pass_'].name() for call in calls[:4]],
+                         ['PassG_calculates_dag_property', 'PassK_check_fixed_point_property',
+                          'PassA_TP_NR_NP', 'PassF_reduce_dag_property'])
+        self.assertEqual([call['written'] for call in calls[:4]],
+                         [['property'],
+                          ['_fixed_point_previous_property', 'property_fixed_point'],
+                          [], []])
+        for call in calls:
+            self.assertEqual(call['circuit_name'], 'circuit')
+            self.assertEqual(call['size_before'], 0)
+            self.assertEqual(call['size_after'], 0)
+            self.assertGreaterEqual(call['time'], 0)
+            self.assertGreaterEqual(call['cpu_time'], 0)
+
+    def test_profiler_in_transpile(self):
+        """ A profiler collects the passes of all the circuits given to transpile. """
+        qr = QuantumRegister(3, 'qr')
+        circuits = []
+        for index in range(3):
+            circuit = QuantumCircuit(qr, name='circuit_%d' % index)
+            circuit.h(qr[0])
+            circuit.cx(qr[0], qr[2])
+            circuit.cx(qr[2 * (index % 2)], qr[1])
+            circuits.append(circuit)
+        profiler = PassProfiler()
+        transpiled = transpile(circuits, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                               coupling_map=[[0, 1], [1, 2]], optimization_level=1,
+                               seed_transpiler=42, profiler=profiler)
+
+        self.assertEqual(transpiled, transpile(circuits, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                               coupling_map=[[0, 1], [1, 2]],
+                                               optimization_level=1, seed_transpiler=42))
+        self.assertEqual({record['circuit'] for record in profiler.records},
+                         {'circuit_0', 'circuit_1', 'circuit_2'})
+        summary = profiler.summary()
+        self.assertEqual(summary['Unroller']['calls'], 3)
+        self.assertGreaterEqual(summary['Optimize1qGates']['max_iteration'], 1)
+        self.assertIn('layout', [key for record in profiler.records
+                                 for key in record['property_set_keys']])
+        self.assertEqual(json.loads(profiler.to_json())['records'], profiler.records)
+
+
 if __name__ == '__main__':
     unittest.main()
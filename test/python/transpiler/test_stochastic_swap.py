@@ -589,6 +589,22 @@ class TestStochasticSwap(QiskitTestCase):
         for _2q_gate in after.twoQ_gates():
             self.assertIn(set(_2q_gate.qargs), valid_couplings)
 
+    def test_trials_in_threads(self):
+        """Test that the result for a seed does not depend on the number of threads."""
+
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5], [5, 0]])
+        qr = QuantumRegister(6, 'q')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 3), (1, 4), (2, 5), (0, 2), (3, 1), (5, 4)]:
+            circuit.cx(qr[control], qr[target])
+        dag = circuit_to_dag(circuit)
+        layout = Layout.generate_trivial_layout(qr)
+
+        results = [StochasticSwap(coupling, layout, 20, 13, num_threads=num_threads).run(dag)
+                   for num_threads in [2, 4]]
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(6, results[0].count_ops()['cx'])
+
     def test_len_coupling_vs_dag(self):
         """Test error if coupling map and dag are not the same size."""
 
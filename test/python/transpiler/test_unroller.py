@@ -321,3 +321,64 @@ class TestUnroller(QiskitTestCase):
         expected.u1(gamma, qr2[3])
 
         self.assertEqual(circuit_to_dag(expected), out_dag)
+
+    def test_unroll_same_gate_again(self):
+        """Verify gates unrolled again, also with a condition, get their own
+        instructions."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.ccx(qr[2], qr[0], qr[1]).c_if(cr, 1)
+        circuit.ccx(qr[1], qr[2], qr[0])
+        dag = circuit_to_dag(circuit)
+        unrolled_dag = Unroller(['h', 't', 'tdg', 'cx']).run(dag)
+
+        op_nodes = unrolled_dag.op_nodes()
+        self.assertEqual(len(op_nodes), 45)
+        self.assertEqual(len(set(id(node.op) for node in op_nodes)), 45)
+        self.assertEqual(sum(node.condition is not None for node in op_nodes), 15)
+
+        ref_circuit = QuantumCircuit(qr, cr)
+        ref_circuit.ccx(qr[1], qr[2], qr[0])
+        ref_dag = Unroller(['h', 't', 'tdg', 'cx']).run(circuit_to_dag(ref_circuit))
+        for node in ref_dag.op_nodes():
+            self.assertIsNone(node.condition)
+
+    def test_unroll_composite_gates_of_same_name(self):
+        """Verify composite gates of the same name are unrolled to their own
+        definitions."""
+        qr = QuantumRegister(2, 'qr')
+        subqc1 = QuantumCircuit(qr, name='sub')
+        subqc1.cx(qr[0], qr[1])
+        subqc2 = QuantumCircuit(qr, name='sub')
+        subqc2.cx(qr[1], qr[0])
+
+        circuit = QuantumCircuit(qr)
+        circuit.append(subqc1.to_instruction(), [qr[0], qr[1]])
+        circuit.append(subqc2.to_instruction(), [qr[0], qr[1]])
+        out_dag = Unroller(['cx']).run(circuit_to_dag(circuit))
+
+        expected = QuantumCircuit(qr)
+        expected.cx(qr[0], qr[1])
+        expected.cx(qr[1], qr[0])
+        self.assertEqual(circuit_to_dag(expected), out_dag)
+
+    def test_unroll_output_gates_do_not_share_params(self):
+        """Verify editing the parameters of an unrolled gate does not change
+        the other gates, nor later unrollings."""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.ccx(qr[2], qr[0], qr[1])
+        unrolled_dag = Unroller(['u1', 'u2', 'cx']).run(circuit_to_dag(circuit))
+        u2_nodes = unrolled_dag.named_nodes('u2')
+        u2_nodes[0].op.params[0] = 1.234
+        for node in u2_nodes[1:]:
+            self.assertEqual(node.op.params, [0, pi])
+
+        circuit = QuantumCircuit(qr)
+        circuit.ccx(qr[1], qr[2], qr[0])
+        unrolled_dag = Unroller(['u1', 'u2', 'cx']).run(circuit_to_dag(circuit))
+        for node in unrolled_dag.named_nodes('u2'):
+            self.assertEqual(node.op.params, [0, pi])
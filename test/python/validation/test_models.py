@@ -17,7 +17,7 @@
 from datetime import datetime
 
 from qiskit.validation import fields
-from qiskit.validation.base import BaseModel, BaseSchema, bind_schema
+from qiskit.validation.base import BaseModel, BaseSchema, bind_schema, skip_validation
 from qiskit.validation.exceptions import ModelValidationError
 from qiskit.test import QiskitTestCase
 
@@ -41,6 +41,13 @@ class BookSchema(BaseSchema):
     author = fields.Nested(PersonSchema, required=True)
 
 
+class LibrarySchema(BaseSchema):
+    """Example Library schema."""
+    books = fields.Nested(BookSchema, many=True, required=True)
+    location = fields.List(fields.Complex())
+    visitors = fields.Integer(missing=0)
+
+
 @bind_schema(DummySchema)
 class NotAPerson(BaseModel):
     """Example of NotAPerson model."""
@@ -59,6 +66,24 @@ class Book(BaseModel):
     pass
 
 
+@bind_schema(LibrarySchema)
+class Library(BaseModel):
+    """Example Library model."""
+    pass
+
+
+class NamedBookSchema(BookSchema):
+    """Example NamedBook schema."""
+    pass
+
+
+@bind_schema(NamedBookSchema)
+class NamedBook(Book):
+    """Example model whose __init__ calls the one of its bound base model."""
+    def __init__(self, title, **kwargs):
+        super().__init__(title=title, **kwargs)
+
+
 class TestModels(QiskitTestCase):
     """Tests for models."""
 
@@ -164,3 +189,48 @@ class TestModels(QiskitTestCase):
         self.assertEqual(book.to_dict(),
                          {'title': 'A Book',
                           'author': {'name': 'Foo', 'other': 'bar'}})
+
+    def test_from_dict_unvalidated(self):
+        """Test model deserialization without validation."""
+        library_dict = {'books': [{'title': 'A Book',
+                                   'date': '2000-01-01',
+                                   'author': {'name': 'Foo', 'other': 'bar'}}],
+                        'location': [[1.0, 2.0]],
+                        'other': [1, 2]}
+        library = Library.from_dict(library_dict)
+        library_unvalidated = Library.from_dict(library_dict, validate=False)
+
+        self.assertEqual(library_unvalidated, library)
+        self.assertIsInstance(library_unvalidated.books[0], Book)
+        self.assertIsInstance(library_unvalidated.books[0].author, Person)
+        self.assertEqual(library_unvalidated.books[0].date, datetime(2000, 1, 1).date())
+        self.assertEqual(library_unvalidated.location, [1 + 2j])
+        self.assertEqual(library_unvalidated.visitors, 0)
+        self.assertEqual(library_unvalidated.to_dict(), library.to_dict())
+
+    def test_skip_validation(self):
+        """Test models are not validated inside skip_validation()."""
+        with skip_validation():
+            person = Person(name=1)
+            book = Book.from_dict({'title': 'A Book', 'author': {'fur_density': '1.2'}})
+        self.assertEqual(person.name, 1)
+        self.assertEqual(book.author.fur_density, '1.2')
+
+        with self.assertRaises(ModelValidationError):
+            person.validate()
+        with self.assertRaises(ModelValidationError):
+            book.validate()
+        with self.assertRaises(ModelValidationError):
+            _ = Person(name=1)
+
+    def test_validate(self):
+        """Test validating a valid model."""
+        book = Book(title='A Book', author=Person(name='Foo', other='bar'))
+        book.validate()
+
+    def test_instantiate_subclass(self):
+        """Test a model whose __init__ calls the one of its base model is validated."""
+        book = NamedBook(title='A Book', author=Person(name='Foo'))
+        self.assertEqual(book.title, 'A Book')
+        with self.assertRaises(ModelValidationError):
+            _ = NamedBook(title='A Book', author=NotAPerson())